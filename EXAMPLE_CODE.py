@@ -21,21 +21,60 @@ def normalize_inverse(value, min_val, max_val):
         return 1.0
     return (max_val - value) / (max_val - min_val)
 
+def costs_in_base_currency(possible_itineraries, user_constraints, fx=None):
+    """
+    Đưa mọi chi phí và ngân sách về cùng một đồng tiền trước khi chấm điểm.
+    Ngân sách lấy tiền tệ từ user_constraints['currency'] hoặc dạng
+    {"amount", "currency"} của SourceDemo. 'total_cost' của lộ trình tính theo
+    khóa 'currency' của nó; lộ trình KHÔNG có khóa này được coi là cùng đồng
+    tiền với ngân sách, nên ứng viên đã quy đổi sẵn (vd. của
+    itinerary_generator) phải ghi 'currency'.
+    Quy đổi cả mảng chi phí trong một lần (fx_rates.FxTable.to_base_many).
+    Không có thông tin tiền tệ nào -> trả về nguyên giá trị như cũ (và không
+    cần nạp numpy/fx_rates).
+    """
+    budget = user_constraints.get("max_budget", 99999)
+    budget_currency = user_constraints.get("currency")
+    if isinstance(budget, dict):
+        budget_currency = budget.get("currency", budget_currency)
+        budget = budget.get("amount", 99999)
+    costs = [it["total_cost"] for it in possible_itineraries]
+    currencies = [it.get("currency", budget_currency) for it in possible_itineraries]
+    if budget_currency is None and all(c is None for c in currencies):
+        return costs, budget
+
+    if fx is None:
+        from fx_rates import default_fx
+        fx = default_fx()
+    costs = fx.to_base_many(costs, [c or fx.base for c in currencies]).tolist()
+    if "max_budget" in user_constraints:
+        budget = fx.to_base(budget, budget_currency or fx.base)
+    return costs, budget
+
 # --- Mục 3: Hàm Logic chính (Decision Process) ---
 
-def select_final_itinerary(possible_itineraries, user_constraints, context_alerts):
+def select_final_itinerary(possible_itineraries, user_constraints, context_alerts, fx=None):
     """
     Hàm logic chính: Tích hợp và ra quyết định.
     Chọn ra lộ trình tốt nhất dựa trên điểm số đã chuẩn hóa và các ràng buộc.
+    possible_itineraries: danh sách hoặc iterator bất kỳ, ví dụ luồng ứng viên
+    từ itinerary_generator.generate_itineraries (được đọc đúng một lần).
+    fx: bảng tỷ giá (fx_rates.FxTable) khi chi phí/ngân sách khác đồng tiền.
     """
     
     best_itinerary = None
     max_decision_score = -float('inf')
 
+    # Chuẩn hóa Min-Max cần toàn bộ ứng viên: gom luồng ứng viên một lần
+    possible_itineraries = list(possible_itineraries)
+    if not possible_itineraries:
+        return None
+
     # 3a. Tìm Min-Max để chuẩn hóa (Rất quan trọng)
     scores = [it["avg_rec_score"] for it in possible_itineraries]
     times = [it["total_time"] for it in possible_itineraries]
-    costs = [it["total_cost"] for it in possible_itineraries]
+    # Chi phí và ngân sách đã quy về cùng một đồng tiền
+    costs, max_budget = costs_in_base_currency(possible_itineraries, user_constraints, fx)
     
     # Xử lý trường hợp chỉ có 1 lộ trình (tránh chia cho 0)
     min_score, max_score = min(scores), max(scores)
@@ -44,10 +83,10 @@ def select_final_itinerary(possible_itineraries, user_constraints, context_alert
 
     print("--- BẮT ĐẦU QUY TRÌNH QUYẾT ĐỊNH ---")
     
-    for itinerary in possible_itineraries:
+    for itinerary, cost in zip(possible_itineraries, costs):
         
         # 3b. Kiểm tra Ràng buộc CỨNG (từ người dùng)
-        if itinerary["total_cost"] > user_constraints.get("max_budget", 99999):
+        if cost > max_budget:
             print(f"Loại Lộ trình '{itinerary['id']}': Vượt ngân sách.")
             continue
         if itinerary["total_time"] > user_constraints.get("max_time", 99):
@@ -57,7 +96,7 @@ def select_final_itinerary(possible_itineraries, user_constraints, context_alert
         # 3c. Chuẩn hóa giá trị
         score_norm = normalize(itinerary["avg_rec_score"], min_score, max_score)
         time_norm = normalize_inverse(itinerary["total_time"], min_time, max_time)
-        cost_norm = normalize_inverse(itinerary["total_cost"], min_cost, max_cost)
+        cost_norm = normalize_inverse(cost, min_cost, max_cost)
         
         # 3d. Xử lý Cảnh báo (từ module ngữ cảnh)
         alert_penalty = 0.0 # Không phạt
@@ -0,0 +1,133 @@
+"""
+Task 3 – Recommendation & Ranking.
+
+Importable ranking module. Nothing is loaded at import time: a `Ranker` reads
+the place catalog on first use, caches it, and ranks users with the vectorized
+engine in `ranking_engine` (same composite score as `compute_score` below).
+
+Usage:
+    from Rcm_Ranking import Ranker
+    ranker = Ranker()                       # catalog loaded lazily
+    for r in ranker.rank(user, k=5):
+        print(r.place["name"], r.score)
+
+    python Rcm_Ranking.py                   # demo: top 5 for the sample user
+"""
+from __future__ import annotations
+
+import math
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:  # NumPy-backed modules are imported on first use only
+    from place_table import PlaceTable
+    from ranking_engine import RankedPlace
+    from spatial_index import GridIndex
+
+# Catalog locations tried in order: ./data/ (original layout), then next to this file
+DEFAULT_PLACES_PATHS = (
+    os.path.join("data", "sample_places.json"),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_places.json"),
+)
+
+# Demo user profile
+DEMO_USER: Dict[str, Any] = {
+    "preferences": ["museum", "park"],
+    "budget": 50,
+    "location": (10.776, 106.700)
+}
+
+
+# Distance score (scalar reference for ranking_engine.distance_scores)
+def distance_score(place, user):
+    dx = place["lat"] - user["location"][0]
+    dy = place["lon"] - user["location"][1]
+    dist = math.sqrt(dx*dx + dy*dy)
+    return max(0, 1 - dist/10)  # normalize 0-1
+
+# Composite score (scalar reference for ranking_engine.composite_scores)
+def compute_score(place, user):
+    w_pref, w_dist, w_rating, w_trend = 0.4, 0.25, 0.25, 0.1
+    preference_score = 1 if any(tag in user["preferences"] for tag in place["tags"]) else 0
+    score = (w_pref*preference_score + 
+             w_dist*distance_score(place, user) + 
+             w_rating*place["rating"]/5 + 
+             w_trend*place.get("trend_score", 0))
+    return score
+
+
+def find_places_file(paths=DEFAULT_PLACES_PATHS) -> str:
+    """First existing catalog path; FileNotFoundError if there is none."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No places file found (tried: {', '.join(paths)})")
+
+
+class Ranker:
+    """Ranks places for users against a lazily loaded, cached catalog.
+
+    Args:
+        path: Places file (JSON array or JSON Lines); default: `find_places_file()`
+        cache_dir: Optional columnar cache directory (see `catalog_loader.load_table`)
+        metric: "euclidean" (degrees, original formula) or "haversine" (km)
+        nearby_only: Only score places whose distance score can be above zero
+    """
+
+    def __init__(self, path: Optional[str] = None, cache_dir: Optional[str] = None,
+                 metric: str = "euclidean", nearby_only: bool = False) -> None:
+        self.path = path
+        self.cache_dir = cache_dir
+        self.metric = metric
+        self.nearby_only = nearby_only
+        self._table: Optional["PlaceTable"] = None
+        self._index: Optional["GridIndex"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def table(self) -> "PlaceTable":
+        """The catalog, loaded on first access (thread-safe)."""
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    from catalog_loader import load_table
+                    self._table = load_table(self.path or find_places_file(), self.cache_dir)
+        return self._table
+
+    @property
+    def index(self) -> "GridIndex":
+        """Spatial index over the catalog, built on first access."""
+        if self._index is None:
+            table = self.table
+            with self._lock:
+                if self._index is None:
+                    from spatial_index import GridIndex
+                    self._index = GridIndex.from_table(table)
+        return self._index
+
+    def rank(self, user: Dict[str, Any], k: int = 5) -> List["RankedPlace"]:
+        """Top `k` places for `user` (preferences, location), best first."""
+        from ranking_engine import rank_top_k
+        index = self.index if self.nearby_only else None
+        return rank_top_k(self.table, user, k, index=index, metric=self.metric)
+
+
+def main() -> None:
+    ranker = Ranker()
+    user = DEMO_USER
+    table = ranker.table
+
+    # Print top 5 with explain tags
+    for r in ranker.rank(user, k=5):
+        p = r.place
+        explain_tags = []
+        if table.tag_index.matched_tags(r.index, user["preferences"]):
+            explain_tags.append("Matches preference")
+        if p["rating"] >= 4:
+            explain_tags.append("High rating")
+        print(p["name"], r.score, explain_tags)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,24 @@ Mô phỏng các tính năng đặc biệt và cảnh báo linh hoạt dựa tr
 """
 
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import json
 
+from alert_rules import compile_alert_rules, load_rule_config, merge_rule_config
+
 
 class ContextAlertSystem:
     """Hệ thống cảnh báo và tính năng đặc biệt cho du lịch"""
     
-    def __init__(self):
+    def __init__(self, tag_index=None, fx=None, rules=None):
+        # Chỉ mục thẻ dùng chung với bộ xếp hạng (tag_index.TagIndex), tùy chọn.
+        # Khi có, việc khớp sở thích dùng id thẻ thay vì dựng set cho mỗi địa điểm.
+        self.tag_index = tag_index
+        
+        # Bảng tỷ giá (fx_rates.FxTable) để so sánh chi tiêu và ngân sách khác
+        # đồng tiền; mặc định dùng fx_rates.json, chỉ nạp khi thật sự cần quy đổi.
+        self._fx = fx
+        
         # Ngưỡng để xác định Hot Trend
         self.HOT_TREND_THRESHOLD = {
             'min_rating': 4.5,
@@ -21,17 +31,29 @@ class ContextAlertSystem:
         
         # Quy tắc cảnh báo thời tiết
         self.WEATHER_RULES = {
-            'rain': {'indoor': True, 'message': '🌧️ Trời mưa - Ưu tiên hoạt động trong nhà'},
-            'hot': {'message': '☀️ Trời nắng nóng - Nên mang nước và kem chống nắng'},
-            'cold': {'message': '❄️ Trời lạnh - Mang áo ấm'},
-            'storm': {'outdoor': False, 'message': '⛈️ Cảnh báo bão - Tránh hoạt động ngoài trời'}
+            'rain': {'indoor': True, 'level': 'warning', 'message': '🌧️ Trời mưa - Ưu tiên hoạt động trong nhà'},
+            'hot': {'level': 'info', 'message': '☀️ Trời nắng nóng - Nên mang nước và kem chống nắng'},
+            'cold': {'level': 'info', 'message': '❄️ Trời lạnh - Mang áo ấm'},
+            'storm': {'outdoor': False, 'level': 'warning', 'message': '⛈️ Cảnh báo bão - Tránh hoạt động ngoài trời'}
+        }
+        
+        # Cảnh báo thêm cho địa điểm ngoài trời: 'indoor' khi thời tiết có
+        # indoor=True, 'no_outdoor' khi thời tiết có outdoor=False
+        self.OUTDOOR_RULES = {
+            'indoor': {'type': 'recommendation', 'level': 'warning',
+                       'message': '⚠️ Địa điểm ngoài trời - Cân nhắc thay đổi kế hoạch'},
+            'no_outdoor': {'type': 'recommendation', 'level': 'danger',
+                           'message': '🚫 Không nên đi - Điều kiện thời tiết nguy hiểm'}
         }
         
         # Quy tắc cảnh báo theo thời gian
         self.TIME_RULES = {
-            'rush_hour': {'hours': [7, 8, 17, 18, 19], 'message': '🚗 Giờ cao điểm - Giao thông đông đúc'},
-            'lunch_time': {'hours': [11, 12, 13], 'message': '🍽️ Giờ ăn trưa - Nhà hàng có thể đông'},
-            'night_time': {'hours': [22, 23, 0, 1, 2, 3, 4, 5], 'message': '🌙 Tối muộn - Chú ý an toàn'}
+            'rush_hour': {'hours': [7, 8, 17, 18, 19], 'type': 'traffic', 'level': 'info',
+                          'message': '🚗 Giờ cao điểm - Giao thông đông đúc'},
+            'lunch_time': {'hours': [11, 12, 13], 'type': 'crowd', 'level': 'info',
+                           'message': '🍽️ Giờ ăn trưa - Nhà hàng có thể đông'},
+            'night_time': {'hours': [22, 23, 0, 1, 2, 3, 4, 5], 'type': 'safety', 'level': 'warning',
+                           'message': '🌙 Tối muộn - Chú ý an toàn'}
         }
         
         # Quy tắc cảnh báo ngân sách
@@ -39,6 +61,42 @@ class ContextAlertSystem:
             'overspend_warning': 0.8,  # Cảnh báo khi đã dùng 80% ngân sách
             'overspend_critical': 0.95  # Cảnh báo nghiêm trọng ở 95%
         }
+        
+        # Biên dịch quy tắc một lần thành bảng tra (alert_rules.AlertRules).
+        # `rules` (dict hoặc đường dẫn file JSON cùng cấu trúc) thay thế từng
+        # nhóm quy tắc mặc định có mặt trong đó.
+        self.load_rules(rules)
+    
+    
+    def rule_config(self) -> Dict[str, Any]:
+        """Cấu hình quy tắc hiện tại theo cấu trúc của alert_rules"""
+        return {
+            'weather': self.WEATHER_RULES,
+            'outdoor': self.OUTDOOR_RULES,
+            'time': self.TIME_RULES,
+            'budget': self.BUDGET_RULES
+        }
+    
+    
+    def load_rules(self, rules=None) -> None:
+        """
+        Nạp (hoặc nạp lại) và biên dịch quy tắc cảnh báo
+        
+        Args:
+            rules: None (dùng quy tắc hiện tại), dict cấu hình hoặc đường dẫn
+                   file JSON; nhóm nào có mặt sẽ thay nhóm tương ứng
+        
+        Raises:
+            ValueError: Nếu cấu hình không hợp lệ (quy tắc cũ vẫn được giữ)
+        """
+        if isinstance(rules, str):
+            rules = load_rule_config(rules)
+        config = merge_rule_config(self.rule_config(), rules or {})
+        self.rules = compile_alert_rules(config)
+        self.WEATHER_RULES = config['weather']
+        self.OUTDOOR_RULES = config['outdoor']
+        self.TIME_RULES = config['time']
+        self.BUDGET_RULES = config['budget']
     
     
     def check_hot_trend(self, location: Dict[str, Any]) -> Dict[str, Any]:
@@ -47,6 +105,7 @@ class ContextAlertSystem:
         
         Args:
             location: Thông tin địa điểm với rating, số review, growth_rate
+                      (dict hoặc place_table.Place - đọc trực tiếp qua .get)
             
         Returns:
             Dict chứa is_hot_trend và lý do
@@ -77,7 +136,7 @@ class ContextAlertSystem:
     
     
     def generate_weather_alerts(self, weather_condition: str, 
-                                location_type: str) -> List[Dict[str, str]]:
+                                location_type: str) -> Tuple[Dict[str, str], ...]:
         """
         Tạo cảnh báo dựa trên điều kiện thời tiết
         
@@ -86,39 +145,15 @@ class ContextAlertSystem:
             location_type: 'indoor', 'outdoor', 'both'
             
         Returns:
-            Danh sách các cảnh báo
+            Các cảnh báo - cảnh báo chung, cộng thêm cảnh báo đặc biệt cho
+            địa điểm ngoài trời (alert_rules.Alert: dict chỉ đọc, dùng chung
+            giữa các lần gọi; cần sửa thì dùng alert.to_dict())
         """
-        alerts = []
-        
-        if weather_condition in self.WEATHER_RULES:
-            rule = self.WEATHER_RULES[weather_condition]
-            
-            # Cảnh báo chung
-            alerts.append({
-                'type': 'weather',
-                'level': 'warning' if weather_condition in ['rain', 'storm'] else 'info',
-                'message': rule['message']
-            })
-            
-            # Cảnh báo đặc biệt cho địa điểm ngoài trời
-            if location_type == 'outdoor':
-                if rule.get('indoor'):
-                    alerts.append({
-                        'type': 'recommendation',
-                        'level': 'warning',
-                        'message': '⚠️ Địa điểm ngoài trời - Cân nhắc thay đổi kế hoạch'
-                    })
-                if rule.get('outdoor') == False:
-                    alerts.append({
-                        'type': 'recommendation',
-                        'level': 'danger',
-                        'message': '🚫 Không nên đi - Điều kiện thời tiết nguy hiểm'
-                    })
-        
-        return alerts
+        # Bảng thời tiết x loại địa điểm đã biên dịch sẵn
+        return self.rules.weather_for(weather_condition, location_type)
     
     
-    def generate_time_alerts(self, visit_time: datetime) -> List[Dict[str, str]]:
+    def generate_time_alerts(self, visit_time: datetime) -> Tuple[Dict[str, str], ...]:
         """
         Tạo cảnh báo dựa trên thời gian trong ngày
         
@@ -126,75 +161,67 @@ class ContextAlertSystem:
             visit_time: Thời gian dự kiến đến
             
         Returns:
-            Danh sách các cảnh báo theo thời gian
+            Các cảnh báo theo thời gian, theo thứ tự khai báo trong
+            TIME_RULES (alert_rules.Alert dùng chung, chỉ đọc)
         """
-        alerts = []
-        hour = visit_time.hour
-        
-        # Kiểm tra giờ cao điểm
-        if hour in self.TIME_RULES['rush_hour']['hours']:
-            alerts.append({
-                'type': 'traffic',
-                'level': 'info',
-                'message': self.TIME_RULES['rush_hour']['message']
-            })
-        
-        # Kiểm tra giờ ăn trưa
-        if hour in self.TIME_RULES['lunch_time']['hours']:
-            alerts.append({
-                'type': 'crowd',
-                'level': 'info',
-                'message': self.TIME_RULES['lunch_time']['message']
-            })
-        
-        # Kiểm tra giờ tối muộn
-        if hour in self.TIME_RULES['night_time']['hours']:
-            alerts.append({
-                'type': 'safety',
-                'level': 'warning',
-                'message': self.TIME_RULES['night_time']['message']
-            })
-        
-        return alerts
+        # Bảng 24 ô đã biên dịch sẵn: giờ cao điểm, giờ ăn trưa, tối muộn
+        return self.rules.time_alerts(visit_time.hour)
     
     
-    def check_budget_status(self, spent: float, total_budget: float) -> Dict[str, Any]:
+    @property
+    def fx(self):
+        if self._fx is None:
+            # Nạp fx_rates (và numpy) chỉ khi thật sự cần quy đổi
+            from fx_rates import default_fx
+            self._fx = default_fx()
+        return self._fx
+    
+    
+    def check_budget_status(self, spent: float, total_budget: float,
+                            spent_currency: Optional[str] = None,
+                            budget_currency: Optional[str] = None) -> Dict[str, Any]:
         """
         Kiểm tra tình trạng ngân sách và đưa ra cảnh báo
         
         Args:
             spent: Số tiền đã chi
             total_budget: Tổng ngân sách
+            spent_currency: Đồng tiền của khoản đã chi (tùy chọn)
+            budget_currency: Đồng tiền của ngân sách (tùy chọn)
             
         Returns:
-            Dict chứa thông tin trạng thái ngân sách
+            Dict chứa thông tin trạng thái ngân sách; khi có đủ hai đồng tiền,
+            'spent'/'remaining' được quy về đồng tiền của ngân sách
         """
         if total_budget == 0:
             return {'status': 'unknown', 'alerts': []}
         
+        if spent_currency and budget_currency:
+            spent = self.fx.convert(spent, spent_currency, budget_currency)
+        
         ratio = spent / total_budget
         alerts = []
         
-        if ratio >= self.BUDGET_RULES['overspend_critical']:
-            alerts.append({
-                'type': 'budget',
-                'level': 'danger',
-                'message': f'💸 CẢNH BÁO: Đã chi {ratio*100:.1f}% ngân sách!'
-            })
-        elif ratio >= self.BUDGET_RULES['overspend_warning']:
+        # Ngưỡng cao nhất đã chạm (95% -> danger, 80% -> warning)
+        level = self.rules.budget_level(ratio)
+        if level is not None:
+            _, alert_level, _, template = level
             alerts.append({
                 'type': 'budget',
-                'level': 'warning',
-                'message': f'⚠️ Chú ý: Đã chi {ratio*100:.1f}% ngân sách'
+                'level': alert_level,
+                'message': template.format(percent=ratio * 100)
             })
         
-        return {
+        status = {
             'spent': spent,
             'remaining': total_budget - spent,
             'percentage': ratio * 100,
-            'status': 'critical' if ratio >= 0.95 else 'warning' if ratio >= 0.8 else 'good',
+            'status': level[2] if level is not None else 'good',
             'alerts': alerts
         }
+        if budget_currency:
+            status['currency'] = budget_currency
+        return status
     
     
     def generate_explainability_tags(self, location: Dict[str, Any], 
@@ -204,7 +231,7 @@ class ContextAlertSystem:
         Tạo các thẻ giải thích tại sao địa điểm này được khuyến nghị
         
         Args:
-            location: Thông tin địa điểm
+            location: Thông tin địa điểm (có thể kèm 'place_id' trong chỉ mục thẻ)
             user_preferences: Sở thích người dùng
             score_breakdown: Chi tiết điểm số từng tiêu chí
             
@@ -214,12 +241,16 @@ class ContextAlertSystem:
         tags = []
         
         # Giải thích về sở thích
-        location_tags = set(location.get('tags', []))
-        user_tags = set(user_preferences.get('interests', []))
-        matched_interests = location_tags & user_tags
+        user_interests = user_preferences.get('interests', [])
+        place_id = location.get('place_id')
+        if self.tag_index is not None and place_id is not None:
+            matched_interests = self.tag_index.matched_tags(place_id, user_interests)
+        else:
+            user_tags = set(user_interests)
+            matched_interests = [t for t in location.get('tags', []) if t in user_tags]
         
         if matched_interests:
-            tags.append(f"✓ Khớp sở thích: {', '.join(list(matched_interests)[:2])}")
+            tags.append(f"✓ Khớp sở thích: {', '.join(matched_interests[:2])}")
         
         # Giải thích về rating
         if location.get('rating', 0) >= 4.5:
@@ -252,7 +283,7 @@ class ContextAlertSystem:
         Tạo báo cáo tổng hợp cho một địa điểm với đầy đủ cảnh báo và giải thích
         
         Args:
-            location: Thông tin địa điểm
+            location: Thông tin địa điểm (dict hoặc place_table.Place)
             user_data: Dữ liệu người dùng (preferences, budget)
             context: Ngữ cảnh (weather, time, current_spending)
             
@@ -288,10 +319,25 @@ class ContextAlertSystem:
         # 4. Kiểm tra ngân sách
         if 'current_spending' in context and 'total_budget' in user_data:
             estimated_cost = location.get('estimated_cost', 0)
-            new_spending = context['current_spending'] + estimated_cost
+            budget_currency = user_data.get('budget_currency')
+            currencies = [context.get('spending_currency'), location.get('currency')]
+            if budget_currency or any(currencies):
+                # Quy đổi cả hai khoản về đồng tiền của ngân sách trong một lần.
+                # Ngân sách không ghi đồng tiền -> coi như cùng đồng tiền với khoản
+                # đầu tiên có ghi (chi tiêu, rồi địa điểm), không mặc định là fx.base
+                budget_currency = budget_currency or next(c for c in currencies if c)
+                amounts = self.fx.convert_many(
+                    [context['current_spending'], estimated_cost],
+                    [c or budget_currency for c in currencies],
+                    budget_currency
+                )
+                new_spending = float(amounts.sum())
+            else:
+                new_spending = context['current_spending'] + estimated_cost
             budget_status = self.check_budget_status(
                 new_spending,
-                user_data['total_budget']
+                user_data['total_budget'],
+                budget_currency=budget_currency
             )
             report['budget_status'] = budget_status
             report['alerts'].extend(budget_status['alerts'])
@@ -437,5 +483,100 @@ def demo_context_alert_system():
     print("=" * 60)
 
 
+def run_tests() -> int:
+    """
+    Các bài tự kiểm tra (python Smart_Context_Insights.py --test)
+    
+    Returns:
+        Mã thoát (0 = tất cả đạt)
+    """
+    system = ContextAlertSystem()
+    failures = []
+    total = 0
+    
+    # Ngân sách không ghi đồng tiền: khoản có ghi 'VND' không được đổi ngân sách sang USD
+    location = {'name': 'Chợ Bến Thành', 'estimated_cost': 200000}
+    user_data = {'total_budget': 500000}
+    plain = system.generate_comprehensive_report(location, user_data, {'current_spending': 250000})
+    for label, loc, ctx in (
+        ('location VND', dict(location, currency='VND'), {'current_spending': 250000}),
+        ('spending VND', location, {'current_spending': 250000, 'spending_currency': 'VND'}),
+    ):
+        total += 1
+        status = system.generate_comprehensive_report(loc, user_data, ctx)['budget_status']
+        if (status['status'] != plain['budget_status']['status']
+                or abs(status['percentage'] - plain['budget_status']['percentage']) > 1e-9
+                or status.get('currency') != 'VND'):
+            failures.append(f"BUDGET {label} FAIL – {status['percentage']:.1f}% {status['status']} "
+                            f"{status.get('currency')}, không ghi tiền tệ: "
+                            f"{plain['budget_status']['percentage']:.1f}% {plain['budget_status']['status']}")
+
+    # Bảng tra đã biên dịch phải cho đúng các cảnh báo khi duyệt trực tiếp quy tắc
+    def expected_alerts(weather, location_type, hour):
+        alerts = []
+        rule = system.WEATHER_RULES.get(weather)
+        if rule is not None:
+            alerts.append({'type': 'weather', 'level': rule['level'], 'message': rule['message']})
+            if location_type == 'outdoor':
+                if rule.get('indoor'):
+                    alerts.append(system.OUTDOOR_RULES['indoor'])
+                if rule.get('outdoor') == False:
+                    alerts.append(system.OUTDOOR_RULES['no_outdoor'])
+        for time_rule in system.TIME_RULES.values():
+            if hour in time_rule['hours']:
+                alerts.append({k: time_rule[k] for k in ('type', 'level', 'message')})
+        return alerts
+
+    for weather in list(system.WEATHER_RULES) + ['clear']:
+        for location_type in ('indoor', 'outdoor', 'both', 'cave'):
+            for hour in range(24):
+                total += 1
+                got = (list(system.generate_weather_alerts(weather, location_type))
+                       + list(system.generate_time_alerts(datetime(2026, 1, 1, hour))))
+                if got != expected_alerts(weather, location_type, hour):
+                    failures.append(f"ALERTS {weather}/{location_type}/{hour}h FAIL – {got}")
+
+    # Cảnh báo dùng chung: chỉ đọc, nhưng báo cáo vẫn chuyển được sang JSON
+    total += 1
+    shared = system.generate_time_alerts(datetime(2026, 1, 1, 8))
+    report = system.generate_comprehensive_report(
+        location, user_data, {'weather': 'rain', 'visit_time': datetime(2026, 1, 1, 8)})
+    try:
+        shared[0]['message'] = 'x'
+        failures.append("ALERTS shared alert FAIL – sửa được cảnh báo dùng chung")
+    except TypeError:
+        if shared is not system.generate_time_alerts(datetime(2026, 1, 1, 8)) \
+                or json.loads(json.dumps(report, default=str))['alerts'] != report['alerts']:
+            failures.append("ALERTS shared alert FAIL – không dùng chung hoặc không chuyển được JSON")
+
+    # Cấu hình lỗi: báo ValueError và giữ nguyên quy tắc cũ
+    for label, bad in (
+        ('level', {'weather': {'fog': {'level': 'severe', 'message': 'x'}}}),
+        ('hours', {'time': {'dawn': {'hours': [24], 'message': 'x'}}}),
+        ('message', {'outdoor': {'indoor': {'level': 'info'}}}),
+        ('budget', {'budget': {'overspend_warning': 'high'}}),
+    ):
+        total += 1
+        rules = system.rules
+        try:
+            system.load_rules(bad)
+            failures.append(f"RULES {label} FAIL – cấu hình lỗi được chấp nhận")
+        except ValueError:
+            if system.rules is not rules or 'fog' in system.WEATHER_RULES:
+                failures.append(f"RULES {label} FAIL – quy tắc cũ bị thay")
+
+    print(f"Test Results: {total - len(failures)}/{total} tests passed.")
+    if failures:
+        print("Detailed Failures:")
+        for line in failures:
+            print(" - " + line)
+    else:
+        print("All test cases passed.")
+    return 0 if not failures else 1
+
+
 if __name__ == "__main__":
+    import sys
+    if '--test' in sys.argv[1:]:
+        sys.exit(run_tests())
     demo_context_alert_system()
\ No newline at end of file
@@ -2,16 +2,27 @@
 Smart Travel Project — Single-File Implementation
 
 This single Python module bundles:
-- Taxonomy (languages, currencies, countries, interests)
-- JSON Schemas (user profile, user query)
-- Normalization utilities (language, currency, country, interests, budget parsing)
+- Taxonomy (languages, currencies, countries, interests), hot-reloadable from a file
+- JSON Schemas (user profile, user query), generated from the taxonomy
+- Normalization utilities (language, currency, country, interests, budget parsing),
+  memoized by a bounded LRU per normalizer, with an optional fuzzy (trigram) alias fallback
 - Validation pipeline (JSON Schema + custom logical checks)
 - UX error mapping (friendly codes/messages)
-- Minimal test fixtures and a CLI with `--test` and `--preview`
+- Generated fast-path validators (specialized Python code per schema), selectable at runtime
+- Incremental per-session re-validation that only re-checks changed fields (IncrementalValidator)
+- Bulk normalize+validate of JSON Lines query streams across a process pool (`--bulk`)
+- Minimal test fixtures and a CLI with `--test`, `--preview`, `--bench` and `--parity`
 
 Usage:
     python smart_travel_single.py --test     # Run embedded fixtures through normalize+validate
     python smart_travel_single.py --preview  # Demo normalize+validate with defaults from a profile
+    python smart_travel_single.py --bench    # Validations/second: per-call, cached and generated
+    python smart_travel_single.py --parity   # Compare generated validators with jsonschema
+    python smart_travel_single.py --bench-normalize   # Normalizer LRU memo: cached vs uncached
+    python smart_travel_single.py --bench-incremental # Per-keystroke re-validation: full vs incremental
+    python smart_travel_single.py --backend generated --test   # Use the generated validators
+    python smart_travel_single.py --bulk queries.jsonl --out results.jsonl
+    python smart_travel_single.py --taxonomy taxonomy.json --test   # Use a taxonomy file
 
 Notes:
 - Requires Python 3.10+
@@ -21,12 +32,23 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import copy
 import json
+import os
+import random
 import re
 import sys
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import islice
+from datetime import date, datetime
+from functools import lru_cache, partial
+from hashlib import sha1
+from numbers import Number
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 # Optional dependency: jsonschema
 try:
@@ -37,9 +59,10 @@ except Exception:
     Draft7Validator = None  # type: ignore
 
 # --------------------------------------------------------------------------------------
-# Embedded Taxonomy (acts as the source of truth for normalization)
+# Embedded Taxonomy (default; a taxonomy file with the same shape can replace it,
+# see TaxonomyStore)
 # --------------------------------------------------------------------------------------
-TAXONOMY: Dict[str, Any] = {
+DEFAULT_TAXONOMY: Dict[str, Any] = {
     "version": "1.0",
     "languages": [
         {"preferred": "en-US", "aliases": ["en", "en-US", "English", "english"]},
@@ -53,6 +76,7 @@ TAXONOMY: Dict[str, Any] = {
         {"preferred": "EUR", "aliases": ["EUR", "eur", "€", "Euro", "euro"]},
         {"preferred": "GBP", "aliases": ["GBP", "gbp", "£", "Pound", "British Pound"]},
         {"preferred": "JPY", "aliases": ["JPY", "jpy", "¥", "Yen", "yen", "Japanese Yen"]},
+        {"preferred": "VND", "aliases": ["VND", "vnd", "₫", "VNĐ", "đ", "Dong", "dong", "Vietnamese Dong"]},
     ],
     "countries": [
         {"preferred": "US", "aliases": ["US", "USA", "United States", "United States of America"]},
@@ -75,52 +99,64 @@ TAXONOMY: Dict[str, Any] = {
 # --------------------------------------------------------------------------------------
 # Embedded JSON Schemas (draft-07)
 # --------------------------------------------------------------------------------------
-USER_PROFILE_SCHEMA: Dict[str, Any] = {
-    "$schema": "http://json-schema.org/draft-07/schema#",
-    "title": "UserProfile",
-    "type": "object",
-    "properties": {
-        "user_id": {"type": "string"},
-        "name": {"type": "string"},
-        "language_preference": {"type": "string", "enum": ["en-US", "fr-FR", "es-ES", "zh-CN", "ja-JP"]},
-        "currency_preference": {"type": "string", "enum": ["USD", "EUR", "GBP", "JPY"]},
-        "home_country": {"type": "string", "pattern": "^[A-Z]{2}$"},
-        "interests": {
-            "type": "array",
-            "items": {"type": "string", "enum": ["beach", "culture", "adventure", "nature", "food"]},
-        },
-    },
-    "required": ["user_id", "language_preference", "currency_preference"],
-}
+def _preferred(taxonomy: Dict[str, Any], category: str) -> List[str]:
+    return [entry["preferred"] for entry in taxonomy[category]]
 
-USER_QUERY_SCHEMA: Dict[str, Any] = {
-    "$schema": "http://json-schema.org/draft-07/schema#",
-    "title": "UserQuery",
-    "type": "object",
-    "properties": {
-        "origin": {"type": "string", "pattern": "^[A-Z]{2}$"},
-        "destination": {"type": "string", "pattern": "^[A-Z]{2}$"},
-        "departure_date": {"type": "string", "format": "date"},
-        "return_date": {"type": "string", "format": "date"},
-        "adults": {"type": "integer", "minimum": 1},
-        "children": {"type": "integer", "minimum": 0},
-        "language": {"type": "string", "enum": ["en-US", "fr-FR", "es-ES", "zh-CN", "ja-JP"]},
-        "currency": {"type": "string", "enum": ["USD", "EUR", "GBP", "JPY"]},
-        "interests": {
-            "type": "array",
-            "items": {"type": "string", "enum": ["beach", "culture", "adventure", "nature", "food"]},
+
+def build_profile_schema(taxonomy: Dict[str, Any], tag: Optional[str] = None) -> Dict[str, Any]:
+    """UserProfile schema with enums taken from `taxonomy` (`tag` identifies its version)."""
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "UserProfile",
+        "$comment": f"taxonomy {tag or taxonomy.get('version')}",
+        "type": "object",
+        "properties": {
+            "user_id": {"type": "string"},
+            "name": {"type": "string"},
+            "language_preference": {"type": "string", "enum": _preferred(taxonomy, "languages")},
+            "currency_preference": {"type": "string", "enum": _preferred(taxonomy, "currencies")},
+            "home_country": {"type": "string", "pattern": "^[A-Z]{2}$"},
+            "interests": {
+                "type": "array",
+                "items": {"type": "string", "enum": _preferred(taxonomy, "interests")},
+            },
         },
-        "budget": {
-            "type": "object",
-            "properties": {
-                "amount": {"type": "number", "minimum": 0},
-                "currency": {"type": "string", "enum": ["USD", "EUR", "GBP", "JPY"]},
+        "required": ["user_id", "language_preference", "currency_preference"],
+    }
+
+
+def build_query_schema(taxonomy: Dict[str, Any], tag: Optional[str] = None) -> Dict[str, Any]:
+    """UserQuery schema with enums taken from `taxonomy` (`tag` identifies its version)."""
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "UserQuery",
+        "$comment": f"taxonomy {tag or taxonomy.get('version')}",
+        "type": "object",
+        "properties": {
+            "origin": {"type": "string", "pattern": "^[A-Z]{2}$"},
+            "destination": {"type": "string", "pattern": "^[A-Z]{2}$"},
+            "departure_date": {"type": "string", "format": "date"},
+            "return_date": {"type": "string", "format": "date"},
+            "adults": {"type": "integer", "minimum": 1},
+            "children": {"type": "integer", "minimum": 0},
+            "language": {"type": "string", "enum": _preferred(taxonomy, "languages")},
+            "currency": {"type": "string", "enum": _preferred(taxonomy, "currencies")},
+            "interests": {
+                "type": "array",
+                "items": {"type": "string", "enum": _preferred(taxonomy, "interests")},
+            },
+            "budget": {
+                "type": "object",
+                "properties": {
+                    "amount": {"type": "number", "minimum": 0},
+                    "currency": {"type": "string", "enum": _preferred(taxonomy, "currencies")},
+                },
+                "required": ["amount"],
             },
-            "required": ["amount"],
         },
-    },
-    "required": ["origin", "destination", "departure_date", "return_date", "adults"],
-}
+        "required": ["origin", "destination", "departure_date", "return_date", "adults"],
+    }
+
 
 # --------------------------------------------------------------------------------------
 # UX Error Catalog (code -> message + hint). Used for mapping validation failures.
@@ -150,19 +186,29 @@ UX_ERRORS: Dict[str, Dict[str, str]] = {
     },
     "UNSUPPORTED_CURRENCY": {
         "message": "Unsupported currency code.",
-        "hint": "Use a valid ISO 4217 code (e.g., USD, EUR).",
+        "hint": "Use a supported ISO 4217 code ({currencies}).",
     },
     "UNSUPPORTED_INTEREST": {
         "message": "Unsupported interest category.",
-        "hint": "Choose from the available categories (beach, culture, adventure, nature, food).",
+        "hint": "Choose from the available categories ({interests}).",
     },
     "INVALID_COUNTRY_CODE": {
         "message": "Invalid country code for '{field}'.",
         "hint": "Use a 2-letter ISO 3166-1 code (e.g., 'US').",
     },
     "INVALID_VALUE": {"message": "Invalid value for '{field}'.", "hint": "Please correct the input."},
+    "INVALID_JSON": {"message": "The record is not valid JSON.", "hint": "Send one JSON object per line."},
 }
 
+# Issue code -> taxonomy category whose values its hint lists (filled in per taxonomy snapshot)
+_TAXONOMY_HINTS = {"UNSUPPORTED_CURRENCY": "currencies", "UNSUPPORTED_INTEREST": "interests"}
+
+
+def _render_taxonomy_hints(taxonomy: Dict[str, Any]) -> Dict[str, str]:
+    """Hints of the _TAXONOMY_HINTS codes with `taxonomy`'s allowed values written in."""
+    return {code: UX_ERRORS[code]["hint"].replace("{" + category + "}", ", ".join(_preferred(taxonomy, category)))
+            for code, category in _TAXONOMY_HINTS.items()}
+
 # --------------------------------------------------------------------------------------
 # Normalization Utilities
 # --------------------------------------------------------------------------------------
@@ -175,20 +221,15 @@ def _build_alias_map(category_list: List[Dict[str, Any]]) -> Dict[str, str]:
             mapping[alias.lower()] = preferred
     return mapping
 
-_LANGUAGE_MAP = _build_alias_map(TAXONOMY["languages"])
-_CURRENCY_MAP = _build_alias_map(TAXONOMY["currencies"])
-_COUNTRY_MAP = _build_alias_map(TAXONOMY["countries"])
-_INTEREST_MAP = _build_alias_map(TAXONOMY["interests"])
+_RE_LANGUAGE_TAG = re.compile(r"^([A-Za-z]{2,3})(?:-([A-Za-z]{2}))?$")
+_RE_BUDGET = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Za-z$€£¥₫Đđ]*)\s*$")
 
 
-def normalize_language(lang: Optional[str]) -> Optional[str]:
-    """Return canonical BCP-47 tag (e.g., 'English' -> 'en-US'). Preserve unknowns."""
-    if not lang:
-        return lang
+def _normalize_language(aliases: Dict[str, str], lang: str) -> str:
     raw = lang.strip()
-    if raw.lower() in _LANGUAGE_MAP:
-        return _LANGUAGE_MAP[raw.lower()]
-    m = re.match(r"^([A-Za-z]{2,3})(?:-([A-Za-z]{2}))?$", raw)
+    if raw.lower() in aliases:
+        return aliases[raw.lower()]
+    m = _RE_LANGUAGE_TAG.match(raw)
     if m:
         lc = m.group(1).lower()
         rc = m.group(2)
@@ -196,25 +237,19 @@ def normalize_language(lang: Optional[str]) -> Optional[str]:
     return raw
 
 
-def normalize_currency(curr: Optional[str]) -> Optional[str]:
-    """Return canonical ISO-4217 code (e.g., '€' -> 'EUR'). Preserve unknown symbols as-is."""
-    if not curr:
-        return curr
+def _normalize_currency(aliases: Dict[str, str], curr: str) -> str:
     raw = curr.strip()
-    if raw.lower() in _CURRENCY_MAP:
-        return _CURRENCY_MAP[raw.lower()]
+    if raw.lower() in aliases:
+        return aliases[raw.lower()]
     if raw.isalpha() and len(raw) == 3:
         return raw.upper()
     return raw
 
 
-def normalize_country(country: Optional[str]) -> Optional[str]:
-    """Return ISO 3166-1 alpha-2 code (e.g., 'United States' -> 'US')."""
-    if not country:
-        return country
+def _normalize_country(aliases: Dict[str, str], country: str) -> str:
     raw = country.strip()
-    if raw.lower() in _COUNTRY_MAP:
-        return _COUNTRY_MAP[raw.lower()]
+    if raw.lower() in aliases:
+        return aliases[raw.lower()]
     if len(raw) == 2 and raw.isalpha():
         return raw.upper()
     if len(raw) == 3 and raw.isalpha():
@@ -222,7 +257,195 @@ def normalize_country(country: Optional[str]) -> Optional[str]:
     return raw
 
 
-def normalize_interests(interests: Any) -> Optional[List[str]]:
+def _normalize_interest(aliases: Dict[str, str], item: str) -> str:
+    key = item.strip().lower()
+    return aliases.get(key, key)
+
+
+# --------------------------------------------------------------------------------------
+# Fuzzy alias matching (trigram index over every alias of a taxonomy category)
+# --------------------------------------------------------------------------------------
+FUZZY_MIN_SCORE = 0.6
+FUZZY_NORMALIZATION = False  # opt-in fallback, see configure_fuzzy_normalization
+
+_RE_SQUASH = re.compile(r"[\s._-]+")
+_RE_COUNTRY_CODE = re.compile(r"^[A-Z]{2}$")
+
+
+def _squash(text: str) -> str:
+    """Lowercase and drop separators, so 'Wild life' and 'wildlife' compare equal."""
+    return _RE_SQUASH.sub("", text.lower())
+
+
+def _trigrams(key: str) -> FrozenSet[str]:
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    value: str   # canonical (preferred) taxonomy value
+    alias: str   # alias that matched best
+    score: float  # Dice similarity of the trigram sets, 0..1
+
+
+class AliasMatcher:
+    """Approximate alias lookup through an inverted trigram index, built once per taxonomy.
+
+    `match(text)` scores only the aliases sharing at least one trigram with
+    `text` and returns the best one (first alias wins ties); results are memoized.
+    """
+
+    def __init__(self, alias_map: Dict[str, str], preferred: Iterable[str], cache_size: int = 1024) -> None:
+        entries: Dict[str, Tuple[str, str]] = {}
+        for alias, value in alias_map.items():
+            entries.setdefault(_squash(alias), (alias, value))
+        for value in preferred:
+            entries.setdefault(_squash(value), (value.lower(), value))
+        self._entries = [entry for key, entry in entries.items() if key]
+        self._sizes: List[int] = []
+        postings: Dict[str, List[int]] = {}
+        for i, key in enumerate(k for k in entries if k):
+            grams = _trigrams(key)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: tuple(ids) for gram, ids in postings.items()}
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _match(self, text: str) -> Optional[FuzzyMatch]:
+        key = _squash(text)
+        if not key:
+            return None
+        grams = _trigrams(key)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        best, best_score = -1, 0.0
+        n = len(grams)
+        for i, count in shared.items():
+            score = 2.0 * count / (n + self._sizes[i])
+            if score > best_score or (score == best_score and i < best):
+                best, best_score = i, score
+        if best < 0:
+            return None
+        alias, value = self._entries[best]
+        return FuzzyMatch(value=value, alias=alias, score=best_score)
+
+
+def _build_matchers(taxonomy: Dict[str, Any], alias_maps: Dict[str, Dict[str, str]]) -> Dict[str, AliasMatcher]:
+    return {name: AliasMatcher(alias_maps[category], _preferred(taxonomy, category))
+            for name, (category, _) in _NORMALIZER_IMPLS.items()}
+
+
+def _with_fuzzy_fallback(normalize: Callable[[str], str], matcher: AliasMatcher,
+                         accept: Callable[[str], bool], min_score: float) -> Callable[[str], str]:
+    """Wrap `normalize` so values it cannot resolve fall back to the closest alias."""
+    def fuzzy_normalize(raw: str) -> str:
+        value = normalize(raw)
+        if accept(value):
+            return value
+        m = matcher.match(raw)
+        return m.value if m is not None and m.score >= min_score else value
+    return fuzzy_normalize
+
+
+# --------------------------------------------------------------------------------------
+# Normalizer memo (bounded LRU per normalizer; traffic repeats the same raw strings)
+# --------------------------------------------------------------------------------------
+NORMALIZER_CACHE_SIZE = 1024
+
+# normalizer name -> (taxonomy category, implementation taking the category's alias map)
+_NORMALIZER_IMPLS: Dict[str, Tuple[str, Callable[[Dict[str, str], str], str]]] = {
+    "language": ("languages", _normalize_language),
+    "currency": ("currencies", _normalize_currency),
+    "country": ("countries", _normalize_country),
+    "interest": ("interests", _normalize_interest),
+}
+
+
+def _build_normalizers(taxonomy: Dict[str, Any], alias_maps: Dict[str, Dict[str, str]],
+                       matchers: Dict[str, AliasMatcher], maxsize: Optional[int]) -> Dict[str, Any]:
+    normalizers: Dict[str, Any] = {}
+    for name, (category, fn) in _NORMALIZER_IMPLS.items():
+        normalize: Callable[[str], str] = partial(fn, alias_maps[category])
+        if FUZZY_NORMALIZATION:
+            known = frozenset(_preferred(taxonomy, category))
+            # Unlisted but well-formed country codes are valid as they are
+            accept = (lambda v, known=known: v in known or bool(_RE_COUNTRY_CODE.match(v))) \
+                if name == "country" else known.__contains__
+            normalize = _with_fuzzy_fallback(normalize, matchers[name], accept, FUZZY_MIN_SCORE)
+        normalizers[name] = lru_cache(maxsize=maxsize)(normalize)
+    return normalizers
+
+
+def configure_normalizer_cache(maxsize: Optional[int] = NORMALIZER_CACHE_SIZE) -> None:
+    """(Re)build the LRU memo in front of each normalizer with room for `maxsize` inputs.
+
+    `maxsize=0` turns memoization off; None makes the caches unbounded.
+    Publishes a copy of the current taxonomy snapshot with the new memos and
+    applies to later reloads. Statistics start again from zero.
+    """
+    global NORMALIZER_CACHE_SIZE
+    NORMALIZER_CACHE_SIZE = maxsize
+    TAXONOMY_STORE.rebuild_normalizers()
+
+
+def configure_fuzzy_normalization(enabled: bool = True, min_score: float = FUZZY_MIN_SCORE) -> None:
+    """Let normalizers map unknown values to the closest alias scoring at least `min_score`.
+
+    Off by default, since it rewrites user input; the validators' "did you
+    mean" hints use the same matchers either way.
+    """
+    global FUZZY_NORMALIZATION, FUZZY_MIN_SCORE
+    FUZZY_NORMALIZATION, FUZZY_MIN_SCORE = enabled, min_score
+    configure_normalizer_cache(NORMALIZER_CACHE_SIZE)
+
+
+def suggest(kind: str, text: str, min_score: float = FUZZY_MIN_SCORE,
+            snapshot: Optional[TaxonomySnapshot] = None) -> Optional[FuzzyMatch]:
+    """Closest taxonomy value for `text` ("language", "currency", "country" or "interest")."""
+    m = (snapshot or TAXONOMY_STORE.snapshot).matchers[kind].match(text)
+    return m if m is not None and m.score >= min_score else None
+
+
+def normalizer_cache_info() -> Dict[str, Any]:
+    """Per-normalizer `CacheInfo(hits, misses, maxsize, currsize)` for the current taxonomy."""
+    return {name: cached.cache_info() for name, cached in current_taxonomy().normalizers.items()}
+
+
+def clear_normalizer_cache() -> None:
+    """Forget memoized results and reset hit/miss statistics."""
+    for cached in current_taxonomy().normalizers.values():
+        cached.cache_clear()
+
+
+def normalize_language(lang: Optional[str], snapshot: Optional[TaxonomySnapshot] = None) -> Optional[str]:
+    """Return canonical BCP-47 tag (e.g., 'English' -> 'en-US'). Preserve unknowns."""
+    if not lang:
+        return lang
+    return (snapshot or TAXONOMY_STORE.snapshot).normalizers["language"](lang)
+
+
+def normalize_currency(curr: Optional[str], snapshot: Optional[TaxonomySnapshot] = None) -> Optional[str]:
+    """Return canonical ISO-4217 code (e.g., '€' -> 'EUR'). Preserve unknown symbols as-is."""
+    if not curr:
+        return curr
+    return (snapshot or TAXONOMY_STORE.snapshot).normalizers["currency"](curr)
+
+
+def normalize_country(country: Optional[str], snapshot: Optional[TaxonomySnapshot] = None) -> Optional[str]:
+    """Return ISO 3166-1 alpha-2 code (e.g., 'United States' -> 'US')."""
+    if not country:
+        return country
+    return (snapshot or TAXONOMY_STORE.snapshot).normalizers["country"](country)
+
+
+def normalize_interests(interests: Any, snapshot: Optional[TaxonomySnapshot] = None) -> Optional[List[str]]:
     """Normalize a list or comma-separated string of interest keywords to canonical set."""
     if interests is None:
         return None
@@ -233,12 +456,12 @@ def normalize_interests(interests: Any) -> Optional[List[str]]:
         parts = interests
     else:
         parts = []
+    normalize = (snapshot or TAXONOMY_STORE.snapshot).normalizers["interest"]
     out: List[str] = []
     for item in parts:
         if not isinstance(item, str):
             continue
-        key = item.strip().lower()
-        out.append(_INTEREST_MAP.get(key, key))
+        out.append(normalize(item))
     # de-duplicate while preserving order
     seen: set[str] = set()
     uniq: List[str] = []
@@ -249,45 +472,50 @@ def normalize_interests(interests: Any) -> Optional[List[str]]:
     return uniq
 
 
-def normalize_user_profile(profile: Dict[str, Any] | None) -> Dict[str, Any] | None:
+def _coerce_number(v: Any) -> Any:
+    """Best-effort numeric coercion of strings ('2' -> 2, '2.5' -> 2.5); other values unchanged."""
+    if isinstance(v, str):
+        if v.isdigit():
+            try:
+                return int(v)
+            except ValueError:
+                pass
+        try:
+            f = float(v)
+            return int(f) if f.is_integer() else f
+        except ValueError:
+            pass
+    return v
+
+
+def normalize_profile_field(k: str, v: Any, snap: TaxonomySnapshot) -> Any:
+    """Normalize one profile field; each field is independent of the others."""
+    if v is None:
+        return None
+    if k == "language_preference":
+        return normalize_language(str(v), snap)
+    if k == "currency_preference":
+        return normalize_currency(str(v), snap)
+    if k == "home_country":
+        return normalize_country(str(v), snap)
+    if k == "interests":
+        return normalize_interests(v, snap)
+    # best-effort numeric coercion for unknown fields
+    return _coerce_number(v)
+
+
+def normalize_user_profile(profile: Dict[str, Any] | None,
+                           snapshot: Optional[TaxonomySnapshot] = None) -> Dict[str, Any] | None:
     """Normalize a raw profile dict. Unknown values are preserved for validator to catch."""
     if profile is None:
         return None
-    norm: Dict[str, Any] = {}
-    for k, v in profile.items():
-        if v is None:
-            norm[k] = None
-            continue
-        if k == "language_preference":
-            norm[k] = normalize_language(str(v))
-        elif k == "currency_preference":
-            norm[k] = normalize_currency(str(v))
-        elif k == "home_country":
-            norm[k] = normalize_country(str(v))
-        elif k == "interests":
-            norm[k] = normalize_interests(v)
-        else:
-            # best-effort numeric coercion for unknown fields
-            if isinstance(v, str):
-                if v.isdigit():
-                    try:
-                        norm[k] = int(v)
-                        continue
-                    except ValueError:
-                        pass
-                try:
-                    f = float(v)
-                    norm[k] = int(f) if f.is_integer() else f
-                    continue
-                except ValueError:
-                    pass
-            norm[k] = v
-    return norm
+    snap = snapshot or TAXONOMY_STORE.snapshot
+    return {k: normalize_profile_field(k, v, snap) for k, v in profile.items()}
 
 
-def _parse_budget_str(s: str) -> Optional[Dict[str, Any]]:
+def _parse_budget_str(s: str, snapshot: Optional[TaxonomySnapshot] = None) -> Optional[Dict[str, Any]]:
     """Parse budget strings like '5000 USD', '$3000', '€1200'. Returns dict or None."""
-    m = re.match(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Za-z$€£¥]*)\s*$", s)
+    m = _RE_BUDGET.match(s)
     if not m:
         return None
     amount_s, curr_s = m.groups()
@@ -297,70 +525,64 @@ def _parse_budget_str(s: str) -> Optional[Dict[str, Any]]:
         return None
     result: Dict[str, Any] = {"amount": amount}
     if curr_s:
-        result["currency"] = normalize_currency(curr_s)
+        result["currency"] = normalize_currency(curr_s, snapshot)
     return result
 
 
-def normalize_user_query(query: Dict[str, Any] | None, profile: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
-    """Normalize a raw query, applying defaults from `profile` when helpful (origin, currency)."""
-    if query is None:
-        return None
-    out: Dict[str, Any] = {}
-    origin_default = (profile or {}).get("home_country") if profile else None
-    for k, v in query.items():
-        if v is None:
-            continue
-        if k == "language":
-            out[k] = normalize_language(str(v))
-        elif k == "currency":
-            out[k] = normalize_currency(str(v))
-        elif k in ("origin", "destination"):
-            out[k] = normalize_country(str(v))
-        elif k == "interests":
-            out[k] = normalize_interests(v)
-        elif k == "budget":
-            if isinstance(v, str):
-                parsed = _parse_budget_str(v)
-                out[k] = parsed if parsed is not None else v
-            elif isinstance(v, (int, float)):
-                out[k] = {"amount": v}
-            elif isinstance(v, dict):
-                amt = v.get("amount")
-                cur = v.get("currency")
-                if isinstance(amt, str):
-                    try:
-                        f = float(amt)
-                        amt = int(f) if f.is_integer() else f
-                    except ValueError:
-                        pass
-                out[k] = {"amount": amt}
-                if cur:
-                    out[k]["currency"] = normalize_currency(str(cur))
-            else:
-                out[k] = v
-        else:
-            # best-effort numeric coercion for adults/children if given as strings
-            if isinstance(v, str):
-                if v.isdigit():
-                    try:
-                        out[k] = int(v)
-                        continue
-                    except ValueError:
-                        pass
+def normalize_query_field(k: str, v: Any, snap: TaxonomySnapshot) -> Any:
+    """Normalize one (non-None) query field; profile defaults are applied separately."""
+    if k == "language":
+        return normalize_language(str(v), snap)
+    if k == "currency":
+        return normalize_currency(str(v), snap)
+    if k in ("origin", "destination"):
+        return normalize_country(str(v), snap)
+    if k == "interests":
+        return normalize_interests(v, snap)
+    if k == "budget":
+        if isinstance(v, str):
+            parsed = _parse_budget_str(v, snap)
+            return parsed if parsed is not None else v
+        if isinstance(v, (int, float)):
+            return {"amount": v}
+        if isinstance(v, dict):
+            amt = v.get("amount")
+            cur = v.get("currency")
+            if isinstance(amt, str):
                 try:
-                    f = float(v)
-                    out[k] = int(f) if f.is_integer() else f
-                    continue
+                    f = float(amt)
+                    amt = int(f) if f.is_integer() else f
                 except ValueError:
                     pass
-            out[k] = v
-    # Defaults from profile
+            budget: Dict[str, Any] = {"amount": amt}
+            if cur:
+                budget["currency"] = normalize_currency(str(cur), snap)
+            return budget
+        return v
+    # best-effort numeric coercion for adults/children if given as strings
+    return _coerce_number(v)
+
+
+def apply_query_defaults(out: Dict[str, Any], profile: Dict[str, Any] | None, snap: TaxonomySnapshot) -> None:
+    """Fill origin and budget currency of a normalized query from `profile`, in place."""
+    origin_default = (profile or {}).get("home_country") if profile else None
     if not out.get("origin") and origin_default:
-        out["origin"] = normalize_country(str(origin_default))
+        out["origin"] = normalize_country(str(origin_default), snap)
     if isinstance(out.get("budget"), dict):
         b = out["budget"]
         if b.get("amount") is not None and not b.get("currency") and profile and profile.get("currency_preference"):
             b["currency"] = profile["currency_preference"]
+
+
+def normalize_user_query(query: Dict[str, Any] | None, profile: Dict[str, Any] | None = None,
+                         snapshot: Optional[TaxonomySnapshot] = None) -> Dict[str, Any] | None:
+    """Normalize a raw query, applying defaults from `profile` when helpful (origin, currency)."""
+    if query is None:
+        return None
+    snap = snapshot or TAXONOMY_STORE.snapshot
+    out = {k: normalize_query_field(k, v, snap) for k, v in query.items() if v is not None}
+    # Defaults from profile
+    apply_query_defaults(out, profile, snap)
     return out
 
 # --------------------------------------------------------------------------------------
@@ -372,20 +594,35 @@ class ValidationIssue:
     field: str | None = None
     message: str | None = None
     hint: str | None = None
+    suggestion: str | None = None
 
 
-def _map_schema_error(err: Any, profile: bool = False) -> ValidationIssue:
-    """Translate jsonschema.ValidationError to our UX error taxonomy."""
-    # Safe defaults
-    field = ".".join(str(p) for p in err.path) if getattr(err, "path", None) else None
+def _map_schema_errors(errors: Iterable[Any]) -> List[ValidationIssue]:
+    """Translate jsonschema.ValidationErrors to our UX error taxonomy, in order."""
+    issues: List[ValidationIssue] = []
+    missing: Iterator[str] = iter(())
+    required_owner: Any = None
+    for err in errors:
+        kind = err.validator
+        if kind == "required":
+            # One error per absent name, in `required` order: take them from validator_value
+            if err.instance is not required_owner:
+                required_owner = err.instance
+                missing = iter([name for name in err.validator_value if name not in err.instance])
+            field = next(missing, None)
+        else:
+            required_owner = None
+            field = ".".join(map(str, err.path)) if err.path else None
+        issues.append(_issue_for(kind, field))
+    return issues
+
+
+def _render_issue(kind: Optional[str], field: Optional[str]) -> Tuple[str, str, str]:
+    """(code, message, hint) for a failed schema keyword (`kind`) at `field`."""
     code = "INVALID_VALUE"
-    if getattr(err, "validator", None) == "required":
+    if kind == "required":
         code = "REQ_FIELD_MISSING"
-        # Try to extract field name from message
-        m = re.search(r"'([^']+)' is a required property", err.message)
-        if m:
-            field = m.group(1)
-    elif getattr(err, "validator", None) == "enum":
+    elif kind == "enum":
         # Deduce domain-specific codes
         target = field or ""
         if any(x in target for x in ["language_preference", "language"]):
@@ -396,52 +633,700 @@ def _map_schema_error(err: Any, profile: bool = False) -> ValidationIssue:
             code = "UNSUPPORTED_INTEREST"
         else:
             code = "INVALID_VALUE"
-    elif getattr(err, "validator", None) == "pattern":
+    elif kind == "pattern":
         code = "INVALID_COUNTRY_CODE" if field and ("origin" in field or "destination" in field or "country" in field) else "INVALID_VALUE"
-    elif getattr(err, "validator", None) == "format":
+    elif kind == "format":
         code = "INVALID_DATE_FORMAT"
-    elif getattr(err, "validator", None) == "minimum":
+    elif kind == "minimum":
         if field == "adults":
             code = "ADULT_COUNT_MIN"
         elif field == "children":
             code = "CHILD_COUNT_MIN"
         else:
             code = "INVALID_VALUE"
-    elif getattr(err, "validator", None) == "type":
+    elif kind == "type":
         code = "INVALID_TYPE"
     # Compose message/hint
     u = UX_ERRORS.get(code, {"message": "Invalid value.", "hint": "Please correct it."})
     msg = u["message"].replace("{field}", field or "field")
     hint = u.get("hint", "")
-    return ValidationIssue(code=code, field=field, message=msg, hint=hint)
+    return code, msg, hint
 
 
-def validate_profile(profile: Dict[str, Any]) -> List[ValidationIssue]:
-    issues: List[ValidationIssue] = []
-    if jsonschema:
-        validator = Draft7Validator(USER_PROFILE_SCHEMA)  # type: ignore
-        for err in validator.iter_errors(profile):
-            issues.append(_map_schema_error(err, profile=True))
+# (validator kind, field) -> pre-rendered (code, message, hint). Filled from the schemas
+# by build_issue_table; other pairs (array indices, unknown fields) are added on first use.
+_ISSUE_TABLE: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, str, str]] = {}
+_ISSUE_TABLE_MAX = 4096
+
+_ISSUE_KINDS = ("type", "enum", "pattern", "format", "minimum")
+
+
+def build_issue_table(schema: Dict[str, Any], field: Optional[str] = None) -> None:
+    """Pre-render the issues every keyword of `schema` can produce, for each field path."""
+    for kind in _ISSUE_KINDS:
+        if kind in schema:
+            _ISSUE_TABLE[(kind, field)] = _render_issue(kind, field)
+    for name in schema.get("required", ()):
+        _ISSUE_TABLE[("required", name)] = _render_issue("required", name)
+    for prop, sub in schema.get("properties", {}).items():
+        build_issue_table(sub, f"{field}.{prop}" if field else prop)
+    items = schema.get("items")
+    if isinstance(items, dict):
+        for i in range(8):  # the first few positions; later ones are added on demand
+            build_issue_table(items, f"{field}.{i}" if field else str(i))
+
+
+def _issue_for(kind: Optional[str], field: Optional[str]) -> ValidationIssue:
+    """Build the UX issue for a failed schema keyword (`kind`) at `field`."""
+    parts = _ISSUE_TABLE.get((kind, field))
+    if parts is None:
+        parts = _render_issue(kind, field)
+        if len(_ISSUE_TABLE) < _ISSUE_TABLE_MAX:
+            _ISSUE_TABLE[(kind, field)] = parts
+    return ValidationIssue(parts[0], field, parts[1], parts[2])
+
+
+# --------------------------------------------------------------------------------------
+# Generated fast-path validators
+# --------------------------------------------------------------------------------------
+# Which implementation validate_profile/validate_query use (see set_validator_backend)
+VALIDATOR_BACKENDS = ("jsonschema", "generated")
+VALIDATOR_BACKEND = "jsonschema"
+
+_RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$", re.ASCII)
+_MISSING = object()
+
+# Draft-07 type tests, matching jsonschema's type checker (bool is not a number/integer)
+_TYPE_TESTS: Dict[str, str] = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, Number) and not isinstance({v}, bool))",
+    "integer": "(not isinstance({v}, bool) and (isinstance({v}, int) or (isinstance({v}, float) and {v}.is_integer())))",
+}
+
+
+def _is_date(value: str) -> bool:
+    """jsonschema's "date" format rule: YYYY-MM-DD and a real calendar date."""
+    try:
+        return bool(_RE_DATE.fullmatch(value) and date.fromisoformat(value))
+    except ValueError:
+        return False
+
+
+class _ValidatorCodegen:
+    """Emit the source of one validation function for a (flat) draft-07 schema.
+
+    Keywords are checked in the schema's own order, like jsonschema's
+    iter_errors, so issues come out in the same order. Only the keywords our
+    schemas use are supported; anything else raises NotImplementedError.
+    """
+
+    _IGNORED = ("$schema", "$comment", "title", "description")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.lines: List[str] = [f"def {name}(doc):", "    issues = []", "    add = issues.append"]
+        self.consts: Dict[str, Any] = {}
+        self.n_vars = 0
+
+    def const(self, value: Any) -> str:
+        name = f"_C{len(self.consts)}"
+        self.consts[name] = value
+        return name
+
+    def new_var(self) -> str:
+        self.n_vars += 1
+        return f"v{self.n_vars}"
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    @staticmethod
+    def path_expr(parts: List[Tuple[bool, str]]) -> str:
+        """Expression for the dotted field name; parts are (is_variable, text)."""
+        if not parts:
+            return "None"
+        return " + '.' + ".join(f"str({t})" if dyn else repr(t) for dyn, t in parts)
+
+    def issue(self, depth: int, kind: str, field_expr: str) -> None:
+        self.emit(depth, f"add(_issue_for({kind!r}, {field_expr}))")
+
+    def schema(self, schema: Dict[str, Any], v: str, parts: List[Tuple[bool, str]], depth: int) -> None:
+        field = self.path_expr(parts)
+        for keyword, value in schema.items():
+            if keyword in self._IGNORED:
+                continue
+            if keyword == "type":
+                if not isinstance(value, str) or value not in _TYPE_TESTS:
+                    raise NotImplementedError(f"type {value!r}")
+                self.emit(depth, f"if not {_TYPE_TESTS[value].format(v=v)}:")
+                self.issue(depth + 1, "type", field)
+            elif keyword == "enum":
+                if not all(isinstance(e, str) for e in value):
+                    raise NotImplementedError("non-string enum")
+                self.emit(depth, f"if not (isinstance({v}, str) and {v} in {self.const(frozenset(value))}):")
+                self.issue(depth + 1, "enum", field)
+            elif keyword == "pattern":
+                self.emit(depth, f"if isinstance({v}, str) and not {self.const(re.compile(value))}.search({v}):")
+                self.issue(depth + 1, "pattern", field)
+            elif keyword == "format":
+                if value != "date":
+                    raise NotImplementedError(f"format {value!r}")
+                self.emit(depth, f"if isinstance({v}, str) and not _is_date({v}):")
+                self.issue(depth + 1, "format", field)
+            elif keyword == "minimum":
+                self.emit(depth, f"if {_TYPE_TESTS['number'].format(v=v)} and {v} < {value!r}:")
+                self.issue(depth + 1, "minimum", field)
+            elif keyword == "properties":
+                self.emit(depth, f"if isinstance({v}, dict):")
+                for prop, sub in value.items():
+                    nv = self.new_var()
+                    self.emit(depth + 1, f"{nv} = {v}.get({prop!r}, _MISSING)")
+                    self.emit(depth + 1, f"if {nv} is not _MISSING:")
+                    self.schema(sub, nv, parts + [(False, prop)], depth + 2)
+            elif keyword == "required":
+                self.emit(depth, f"if isinstance({v}, dict):")
+                for prop in value:
+                    self.emit(depth + 1, f"if {prop!r} not in {v}:")
+                    self.issue(depth + 2, "required", repr(prop))
+            elif keyword == "items" and isinstance(value, dict):
+                i, nv = self.new_var(), self.new_var()
+                self.emit(depth, f"if isinstance({v}, list):")
+                self.emit(depth + 1, f"for {i}, {nv} in enumerate({v}):")
+                self.schema(value, nv, parts + [(True, i)], depth + 2)
+            else:
+                raise NotImplementedError(f"keyword {keyword!r}")
+
+    def build(self, schema: Dict[str, Any], field: Optional[str] = None) -> str:
+        """Function body for `schema`; with `field`, the argument is that field's value."""
+        self.schema(schema, "doc", [(False, field)] if field else [], 1)
+        self.emit(1, "return issues")
+        return "\n".join(self.lines) + "\n"
+
+
+def generate_validator_source(schema: Dict[str, Any], name: str,
+                              field: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """Python source of a `name(doc) -> List[ValidationIssue]` function, plus its constants."""
+    gen = _ValidatorCodegen(name)
+    return gen.build(schema, field), gen.consts
+
+
+def compile_fast_validator(schema: Dict[str, Any]) -> Callable[[Any], List[ValidationIssue]]:
+    """Generate and compile the specialized validator for `schema`."""
+    name = "validate_" + re.sub(r"\W", "_", schema.get("title", "schema"))
+    return _compile_generated(name, *generate_validator_source(schema, name))
+
+
+def compile_field_validators(schema: Dict[str, Any]) -> Dict[str, Callable[[Any], List[ValidationIssue]]]:
+    """One generated validator per top-level property, taking that property's value."""
+    title = re.sub(r"\W", "_", schema.get("title", "schema"))
+    validators = {}
+    for prop, sub in schema.get("properties", {}).items():
+        name = "validate_" + title + "_" + re.sub(r"\W", "_", prop)
+        validators[prop] = _compile_generated(name, *generate_validator_source(sub, name, field=prop))
+    return validators
+
+
+def _compile_generated(name: str, source: str, consts: Dict[str, Any]) -> Callable[[Any], List[ValidationIssue]]:
+    namespace: Dict[str, Any] = {
+        "_issue_for": _issue_for, "_is_date": _is_date, "_MISSING": _MISSING, "Number": Number, **consts,
+    }
+    exec(compile(source, f"<generated {name}>", "exec"), namespace)
+    fn = namespace[name]
+    fn.__source__ = source
+    return fn
+
+
+def compile_validator(schema: Dict[str, Any]) -> Any:
+    """Check `schema` and compile a Draft7Validator for it, with `format` checks enabled."""
+    Draft7Validator.check_schema(schema)  # type: ignore
+    return Draft7Validator(schema, format_checker=jsonschema.FormatChecker())  # type: ignore
+
+
+def _schema_key(schema: Dict[str, Any]) -> Tuple[str, str]:
+    # Generated schemas record their taxonomy version in $comment
+    return schema.get("title", ""), schema.get("$comment", "")
+
+
+# Validators for ad-hoc schemas, built once per (schema title, taxonomy version).
+# The taxonomy's own schemas are compiled into each TaxonomySnapshot instead.
+_FAST_VALIDATOR_CACHE: Dict[Tuple[str, str], Callable[[Any], List[ValidationIssue]]] = {}
+_VALIDATOR_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def get_fast_validator(schema: Dict[str, Any]) -> Callable[[Any], List[ValidationIssue]]:
+    """Return the cached generated validator for `schema` (no jsonschema needed)."""
+    key = _schema_key(schema)
+    fn = _FAST_VALIDATOR_CACHE.get(key)
+    if fn is None:
+        fn = _FAST_VALIDATOR_CACHE[key] = compile_fast_validator(schema)
+    return fn
+
+
+def set_validator_backend(name: str) -> None:
+    """Select the schema validation backend: "jsonschema" (default) or "generated"."""
+    global VALIDATOR_BACKEND
+    if name not in VALIDATOR_BACKENDS:
+        raise ValueError(f"Unknown validator backend '{name}', expected one of {VALIDATOR_BACKENDS}")
+    VALIDATOR_BACKEND = name
+
+
+def get_validator(schema: Dict[str, Any]) -> Any:
+    """Return the cached Draft7Validator for `schema`, with `format` checks enabled.
+
+    The schema is checked and compiled on first use only; the cache key
+    includes the taxonomy version recorded in the schema's `$comment`.
+    """
+    key = _schema_key(schema)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[key] = compile_validator(schema)
+    return validator
+
+
+def clear_validator_cache() -> None:
+    """Drop compiled and generated validators (e.g. after editing a schema in place)."""
+    _VALIDATOR_CACHE.clear()
+    _FAST_VALIDATOR_CACHE.clear()
+
+
+# --------------------------------------------------------------------------------------
+# Taxonomy store (versioned, hot-reloadable snapshots)
+# --------------------------------------------------------------------------------------
+_TAXONOMY_CATEGORIES = ("languages", "currencies", "countries", "interests")
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """One taxonomy version and everything derived from it.
+
+    Alias maps, schemas, compiled validators and normalizer memos are built
+    together, so a request that holds a snapshot sees one consistent version
+    from normalization through validation, whatever reloads happen meanwhile.
+    """
+    version: str
+    digest: str
+    taxonomy: Dict[str, Any]
+    alias_maps: Dict[str, Dict[str, str]]
+    profile_schema: Dict[str, Any]
+    query_schema: Dict[str, Any]
+    # schema name ("profile"/"query") -> backend name -> validator
+    validators: Dict[str, Dict[str, Any]]
+    # schema name -> top-level property -> generated validator for that property alone
+    field_validators: Dict[str, Dict[str, Callable[[Any], List[ValidationIssue]]]]
+    normalizers: Dict[str, Any]
+    matchers: Dict[str, AliasMatcher]
+    # issue code -> hint listing this taxonomy's allowed values (see _TAXONOMY_HINTS)
+    hints: Dict[str, str]
+    source: Optional[str] = None
+
+    @property
+    def tag(self) -> str:
+        return f"{self.version} ({self.digest})"
+
+
+def _check_taxonomy(taxonomy: Any) -> None:
+    if not isinstance(taxonomy, dict):
+        raise ValueError("Taxonomy must be a JSON object")
+    for category in _TAXONOMY_CATEGORIES:
+        entries = taxonomy.get(category)
+        if not isinstance(entries, list) or not all(isinstance(e, dict) and isinstance(e.get("preferred"), str)
+                                                    for e in entries):
+            raise ValueError(f"Taxonomy '{category}' must be a list of entries with a 'preferred' value")
+
+
+def build_snapshot(taxonomy: Dict[str, Any], source: Optional[str] = None) -> TaxonomySnapshot:
+    """Derive alias maps, schemas, validators, fuzzy matchers and normalizer memos from `taxonomy`.
+
+    Raises ValueError if the taxonomy does not have the expected shape.
+    """
+    _check_taxonomy(taxonomy)
+    taxonomy = json.loads(json.dumps(taxonomy))  # private deep copy
+    digest = sha1(json.dumps(taxonomy, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    version = str(taxonomy.get("version", digest))
+    tag = f"{version} ({digest})"
+    alias_maps = {category: _build_alias_map(taxonomy[category]) for category in _TAXONOMY_CATEGORIES}
+    schemas = {"profile": build_profile_schema(taxonomy, tag), "query": build_query_schema(taxonomy, tag)}
+    for schema in schemas.values():
+        build_issue_table(schema)
+    matchers = _build_matchers(taxonomy, alias_maps)
+    validators: Dict[str, Dict[str, Any]] = {}
+    for name, schema in schemas.items():
+        validators[name] = {"generated": compile_fast_validator(schema)}
+        if jsonschema:
+            validators[name]["jsonschema"] = compile_validator(schema)
+    return TaxonomySnapshot(version=version, digest=digest, taxonomy=taxonomy, alias_maps=alias_maps,
+                            profile_schema=schemas["profile"], query_schema=schemas["query"],
+                            validators=validators,
+                            field_validators={name: compile_field_validators(schema)
+                                              for name, schema in schemas.items()},
+                            normalizers=_build_normalizers(taxonomy, alias_maps, matchers, NORMALIZER_CACHE_SIZE),
+                            matchers=matchers, hints=_render_taxonomy_hints(taxonomy), source=source)
+
+
+class TaxonomyStore:
+    """Holds the current TaxonomySnapshot and swaps in new ones on reload.
+
+    Readers take `store.snapshot` once per request without any lock and keep
+    using that object; a reload builds a complete new snapshot first and then
+    publishes it with a single attribute assignment. Reloads are serialized
+    by a lock that readers never touch.
+    """
+
+    def __init__(self, taxonomy: Optional[Dict[str, Any]] = None) -> None:
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.path: Optional[str] = None
+        self.snapshot = build_snapshot(taxonomy if taxonomy is not None else DEFAULT_TAXONOMY)
+
+    def publish(self, taxonomy: Dict[str, Any], source: Optional[str] = None) -> TaxonomySnapshot:
+        """Make `taxonomy` current; raises ValueError (and keeps the old one) if it is malformed."""
+        with self._lock:
+            snap = build_snapshot(taxonomy, source)
+            self.snapshot = snap
+        return snap
+
+    def rebuild_normalizers(self) -> TaxonomySnapshot:
+        """Publish the current taxonomy again with normalizers built from the current settings.
+
+        Snapshots are never modified once published: readers holding the old
+        one keep its normalizers.
+        """
+        with self._lock:
+            old = self.snapshot
+            snap = replace(old, normalizers=_build_normalizers(old.taxonomy, old.alias_maps, old.matchers,
+                                                               NORMALIZER_CACHE_SIZE))
+            self.snapshot = snap
+        return snap
+
+    def load_file(self, path: str) -> TaxonomySnapshot:
+        """Load a taxonomy JSON file, make it current and remember it for `refresh`."""
+        st = os.stat(path)
+        with open(path, "r", encoding="utf-8-sig") as f:
+            try:
+                taxonomy = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Taxonomy file {path} is not valid JSON: {exc}") from exc
+        snap = self.publish(taxonomy, source=os.path.abspath(path))
+        self.path, self._stamp = path, (st.st_size, st.st_mtime_ns)
+        return snap
+
+    def refresh(self) -> bool:
+        """Reload the taxonomy file if it changed since it was loaded; True if reloaded."""
+        if self.path is None:
+            return False
+        st = os.stat(self.path)
+        stamp = (st.st_size, st.st_mtime_ns)
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp  # a broken file is reported once, then retried when it changes again
+        self.load_file(self.path)
+        return True
+
+    def watch(self, interval: float = 2.0) -> None:
+        """Poll the taxonomy file every `interval` seconds in a daemon thread.
+
+        A file that fails to load is reported on stderr and the current
+        snapshot stays in place until a valid version is written.
+        """
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+
+        def poll() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    if self.refresh():
+                        print(f"Taxonomy reloaded: {self.snapshot.tag}", file=sys.stderr)
+                except (OSError, ValueError) as exc:
+                    print(f"Taxonomy reload failed, keeping {self.snapshot.tag}: {exc}", file=sys.stderr)
+
+        self._watcher = threading.Thread(target=poll, name="taxonomy-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+
+TAXONOMY_STORE = TaxonomyStore()
+
+
+def current_taxonomy() -> TaxonomySnapshot:
+    """The snapshot new requests should use (lock-free)."""
+    return TAXONOMY_STORE.snapshot
+
+
+def reload_taxonomy(taxonomy: Dict[str, Any]) -> TaxonomySnapshot:
+    """Publish `taxonomy` as the current version (alias maps, schemas, validators, memos)."""
+    return TAXONOMY_STORE.publish(taxonomy)
+
+
+def load_taxonomy_file(path: str) -> TaxonomySnapshot:
+    """Publish the taxonomy stored in a JSON file (same shape as DEFAULT_TAXONOMY)."""
+    return TAXONOMY_STORE.load_file(path)
+
+
+def __getattr__(name: str) -> Any:
+    # Live module attributes for callers that used the former constants
+    snap = TAXONOMY_STORE.snapshot
+    if name == "TAXONOMY":
+        return snap.taxonomy
+    if name == "USER_PROFILE_SCHEMA":
+        return snap.profile_schema
+    if name == "USER_QUERY_SCHEMA":
+        return snap.query_schema
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Issue code -> matcher used for its "did you mean" suggestion
+_SUGGEST_FOR = {
+    "UNSUPPORTED_LANGUAGE": "language",
+    "UNSUPPORTED_CURRENCY": "currency",
+    "UNSUPPORTED_INTEREST": "interest",
+    "INVALID_COUNTRY_CODE": "country",
+}
+
+
+def _value_at(doc: Any, field: str) -> Any:
+    for part in field.split("."):
+        if isinstance(doc, dict):
+            doc = doc.get(part)
+        elif isinstance(doc, list) and part.isdigit() and int(part) < len(doc):
+            doc = doc[int(part)]
+        else:
+            return None
+    return doc
+
+
+def _add_suggestions(issues: List[ValidationIssue], doc: Any, snap: TaxonomySnapshot) -> List[ValidationIssue]:
+    """Write `snap`'s allowed values into taxonomy hints and attach "did you mean" suggestions."""
+    for issue in issues:
+        hint = snap.hints.get(issue.code)
+        if hint is not None:
+            issue.hint = hint
+        kind = _SUGGEST_FOR.get(issue.code)
+        if kind is None or not issue.field:
+            continue
+        value = _value_at(doc, issue.field)
+        m = suggest(kind, value, snapshot=snap) if isinstance(value, str) else None
+        if m is not None and m.value != value:
+            issue.suggestion = m.value
+            issue.hint = f"{issue.hint} Did you mean '{m.value}'?".lstrip()
     return issues
 
 
-def validate_query(query: Dict[str, Any]) -> List[ValidationIssue]:
+def validate_profile(profile: Dict[str, Any], snapshot: Optional[TaxonomySnapshot] = None) -> List[ValidationIssue]:
+    snap = snapshot or TAXONOMY_STORE.snapshot
+    validators = snap.validators["profile"]
+    if VALIDATOR_BACKEND == "generated":
+        return _add_suggestions(validators["generated"](profile), profile, snap)
     issues: List[ValidationIssue] = []
     if jsonschema:
-        validator = Draft7Validator(USER_QUERY_SCHEMA)  # type: ignore
-        for err in validator.iter_errors(query):
-            issues.append(_map_schema_error(err, profile=False))
-        # Custom logical check: return_date >= departure_date
-        try:
-            dep = datetime.fromisoformat(query["departure_date"])  # may KeyError
-            ret = datetime.fromisoformat(query["return_date"])    # may KeyError
-            if ret < dep:
-                u = UX_ERRORS["DATE_ORDER"]
-                issues.append(ValidationIssue(code="DATE_ORDER", message=u["message"], hint=u["hint"]))
-        except Exception:
-            # If dates missing or malformed, schema will already have produced issues
-            pass
-    return issues
+        issues = _map_schema_errors(validators["jsonschema"].iter_errors(profile))
+    return _add_suggestions(issues, profile, snap)
+
+
+def validate_query(query: Dict[str, Any], snapshot: Optional[TaxonomySnapshot] = None) -> List[ValidationIssue]:
+    snap = snapshot or TAXONOMY_STORE.snapshot
+    validators = snap.validators["query"]
+    issues: List[ValidationIssue] = []
+    if VALIDATOR_BACKEND == "generated":
+        issues = validators["generated"](query)
+    elif jsonschema:
+        issues = _map_schema_errors(validators["jsonschema"].iter_errors(query))
+    else:
+        return issues
+    # Custom logical check: return_date >= departure_date
+    issues.extend(_date_order_issues(query))
+    return _add_suggestions(issues, query, snap)
+
+
+def _date_order_issues(query: Any) -> List[ValidationIssue]:
+    try:
+        dep = datetime.fromisoformat(query["departure_date"])  # may KeyError
+        ret = datetime.fromisoformat(query["return_date"])    # may KeyError
+        if ret < dep:
+            u = UX_ERRORS["DATE_ORDER"]
+            return [ValidationIssue(code="DATE_ORDER", message=u["message"], hint=u["hint"])]
+    except Exception:
+        # If dates missing or malformed, schema will already have produced issues
+        pass
+    return []
+
+
+# --------------------------------------------------------------------------------------
+# Incremental re-validation (per form session, only the fields that changed)
+# --------------------------------------------------------------------------------------
+# Cross-field rules per document kind: rule -> (fields it reads, check on the normalized document)
+_DEPENDENT_RULES: Dict[str, Dict[str, Tuple[Tuple[str, ...], Callable[[Any], List[ValidationIssue]]]]] = {
+    "query": {"date_order": (("departure_date", "return_date"), _date_order_issues)},
+    "profile": {},
+}
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Equality that also compares types, since 1, 1.0 and True validate differently."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_same, a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(v, b[k]) for k, v in a.items())
+    return a == b
+
+
+def _issue_key(issue: ValidationIssue) -> Tuple[Any, ...]:
+    return issue.code, issue.field, issue.message, issue.hint, issue.suggestion
+
+
+@dataclass
+class IssueDiff:
+    added: List[ValidationIssue]
+    removed: List[ValidationIssue]
+    issues: List[ValidationIssue]  # full current list, as validate_query/validate_profile return it
+    normalized: Any
+    changed: List[str]             # normalized fields that were re-validated
+
+
+class IncrementalValidator:
+    """Normalize + validate one form session's document, re-checking only what changed.
+
+    The previous raw values, normalized fields and per-field issues are kept;
+    `update(doc)` re-normalizes only raw values that changed, re-validates only
+    normalized fields that changed (including fields filled in from the
+    profile) plus the cross-field rules reading them
+    (departure_date <-> return_date), and returns the issue diff. The issues
+    equal those of a full normalize + validate_query/validate_profile (generated
+    backend, which matches jsonschema). A new taxonomy snapshot starts over.
+    """
+
+    def __init__(self, kind: str = "query", profile: Dict[str, Any] | None = None,
+                 snapshot: Optional[TaxonomySnapshot] = None) -> None:
+        if kind not in _DEPENDENT_RULES:
+            raise ValueError(f"Unknown document kind '{kind}', expected 'query' or 'profile'")
+        self.kind = kind
+        self.profile = profile
+        self._pinned = snapshot
+        self.issues: List[ValidationIssue] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the session state; the next update re-checks every field."""
+        self.snapshot: Optional[TaxonomySnapshot] = None
+        self.normalized: Any = None
+        self._raw: Dict[str, Any] = {}
+        self._fields: Dict[str, Any] = {}
+        self._field_issues: Dict[str, List[ValidationIssue]] = {}
+        self._rule_issues: Dict[str, List[ValidationIssue]] = {}
+        self._required_issues: List[ValidationIssue] = []
+        self._missing: Optional[Tuple[str, ...]] = None
+
+    def update(self, doc: Any) -> IssueDiff:
+        snap = self._pinned or TAXONOMY_STORE.snapshot
+        if snap is not self.snapshot:
+            self.reset()
+            self.snapshot = snap
+        if not isinstance(doc, dict):
+            # Nothing to reuse field by field: validate the whole value, start over next time
+            issues = validate_query(doc, snap) if self.kind == "query" else validate_profile(doc, snap)
+            self.reset()
+            return self._finish(issues, doc, [])
+
+        query = self.kind == "query"
+        normalize_field = normalize_query_field if query else normalize_profile_field
+        raw, fields = self._raw, self._fields
+        changed = [k for k in raw if k not in doc]
+        for k in changed:
+            del raw[k]
+            fields.pop(k, None)
+        for k, v in doc.items():
+            if k in raw and _same(raw[k], v):
+                continue
+            changed.append(k)
+            raw[k] = copy.deepcopy(v) if isinstance(v, (list, dict)) else v
+            if query and v is None:
+                fields.pop(k, None)  # normalize_user_query drops None values
+            else:
+                fields[k] = normalize_field(k, v, snap)
+        norm = {k: fields[k] for k in doc if k in fields}
+        if query:
+            # Profile defaults can fill fields the raw document does not have (origin from
+            # home_country), so any field the defaults set is re-checked if its value moved
+            own = norm
+            norm = {k: dict(v) if isinstance(v, dict) else v for k, v in own.items()}  # keep cached fields clean
+            apply_query_defaults(norm, self.profile, snap)
+            previous = self.normalized if isinstance(self.normalized, dict) else {}
+            for k, v in norm.items():
+                if k in changed or (k in own and _same(own[k], v)):
+                    continue
+                if k not in previous or not _same(previous[k], v):
+                    changed.append(k)
+
+        validators = snap.field_validators[self.kind]
+        schema = snap.query_schema if query else snap.profile_schema
+        required = schema.get("required", [])
+        for k in changed:
+            if k in validators:
+                self._field_issues[k] = _add_suggestions(validators[k](norm[k]), norm, snap) if k in norm else []
+        if not isinstance(self.normalized, dict) or any(k in required for k in changed):
+            missing = tuple(r for r in required if r not in norm)
+            if missing != self._missing:
+                self._missing = missing
+                self._required_issues = [_issue_for("required", r) for r in missing]
+        for name, (deps, check) in _DEPENDENT_RULES[self.kind].items():
+            if name not in self._rule_issues or any(k in deps for k in changed):
+                self._rule_issues[name] = check(norm)
+
+        issues = [i for prop in schema["properties"] for i in self._field_issues.get(prop, ())]
+        issues += self._required_issues
+        for name in _DEPENDENT_RULES[self.kind]:
+            issues += self._rule_issues[name]
+        return self._finish(issues, norm, changed)
+
+    def _finish(self, issues: List[ValidationIssue], norm: Any, changed: List[str]) -> IssueDiff:
+        before = {_issue_key(i) for i in self.issues}
+        after = {_issue_key(i) for i in issues}
+        diff = IssueDiff(added=[i for i in issues if _issue_key(i) not in before],
+                         removed=[i for i in self.issues if _issue_key(i) not in after],
+                         issues=issues, normalized=norm, changed=changed)
+        self.issues, self.normalized = issues, norm
+        return diff
+
+
+class ValidationSessions:
+    """IncrementalValidators by session id; the least recently used are dropped past `max_sessions`."""
+
+    def __init__(self, kind: str = "query", max_sessions: int = 10_000) -> None:
+        self.kind = kind
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, IncrementalValidator]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def update(self, session_id: str, doc: Any, profile: Dict[str, Any] | None = None) -> IssueDiff:
+        validator = self._sessions.get(session_id)
+        if validator is None:
+            validator = self._sessions[session_id] = IncrementalValidator(self.kind, profile)
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+            if profile is not None and not _same(profile, validator.profile):
+                validator.profile = profile
+                validator.reset()
+        return validator.update(doc)
+
+    def end(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
 
 # --------------------------------------------------------------------------------------
 # Minimal embedded fixtures for demo/testing (mirrors the multi-file repo’s samples)
@@ -627,16 +1512,160 @@ QUERY_FIXTURES: List[Dict[str, Any]] = [
     },
 ]
 
+# --------------------------------------------------------------------------------------
+# Bulk pipeline (JSON Lines in -> JSON Lines out)
+# --------------------------------------------------------------------------------------
+BULK_CHUNK_SIZE = 2000
+
+
+def process_query_line(line: str, line_no: int, snapshot: Optional[TaxonomySnapshot] = None) -> Dict[str, Any]:
+    """Normalize + validate one JSON Lines record; returns the result record."""
+    snap = snapshot or TAXONOMY_STORE.snapshot
+    try:
+        raw = json.loads(line)
+    except json.JSONDecodeError:
+        return {"line": line_no, "valid": False, "issues": ["INVALID_JSON"], "query": None}
+    # Non-objects cannot be normalized; the schema reports them as INVALID_TYPE
+    norm = (normalize_user_query(raw, snapshot=snap) or {}) if isinstance(raw, dict) else raw
+    issues = validate_query(norm, snap)
+    return {"line": line_no, "valid": not issues, "issues": [i.code for i in issues], "query": norm}
+
+
+def _process_chunk(lines: List[Tuple[int, str]], backend: str) -> Tuple[List[str], int, Counter]:
+    """Worker task: result lines (JSON, in input order), invalid count and issue-code counts."""
+    set_validator_backend(backend)
+    out: List[str] = []
+    invalid = 0
+    codes: Counter = Counter()
+    for line_no, line in lines:
+        result = process_query_line(line, line_no)
+        if not result["valid"]:
+            invalid += 1
+            codes.update(result["issues"])
+        out.append(json.dumps(result, ensure_ascii=False))
+    return out, invalid, codes
+
+
+def _init_bulk_worker(taxonomy: Dict[str, Any], cache_size: Optional[int],
+                      fuzzy: bool, fuzzy_min_score: float) -> None:
+    # Workers validate against the parent's taxonomy, whatever file it came from, and
+    # normalize with the parent's settings: spawned workers start from the module defaults
+    global NORMALIZER_CACHE_SIZE, FUZZY_NORMALIZATION, FUZZY_MIN_SCORE
+    NORMALIZER_CACHE_SIZE = cache_size
+    FUZZY_NORMALIZATION, FUZZY_MIN_SCORE = fuzzy, fuzzy_min_score
+    reload_taxonomy(taxonomy)
+
+
+def _iter_chunks(f: TextIO, chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Non-blank lines of `f` with their 1-based line numbers, `chunk_size` at a time."""
+    records = ((n, line) for n, line in enumerate(f, 1) if line.strip())
+    return iter(lambda: list(islice(records, chunk_size)), [])
+
+
+def run_bulk(input_path: str, out_path: str, workers: Optional[int] = None,
+             chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """Normalize + validate every query in a JSON Lines file, writing one result per line.
+
+    The input is streamed in chunks of `chunk_size` records and at most
+    2 * `workers` chunks are in flight, so memory stays flat however large the
+    file is. Results keep input order. `workers` defaults to all CPU cores;
+    `workers=1` runs in the calling process. Prints throughput and issue-code counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    in_flight = 2 * workers
+    codes: Counter = Counter()
+    n_records = n_invalid = 0
+    start = time.perf_counter()
+    with open(input_path, "r", encoding="utf-8-sig") as src, open(out_path, "w", encoding="utf-8") as dst:
+
+        def write(chunk_result: Tuple[List[str], int, Counter]) -> None:
+            nonlocal n_records, n_invalid
+            out, invalid, chunk_codes = chunk_result
+            dst.writelines(line + "\n" for line in out)
+            n_records += len(out)
+            n_invalid += invalid
+            codes.update(chunk_codes)
+
+        if workers == 1:
+            for chunk in _iter_chunks(src, chunk_size):
+                write(_process_chunk(chunk, VALIDATOR_BACKEND))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_bulk_worker,
+                                     initargs=(TAXONOMY_STORE.snapshot.taxonomy, NORMALIZER_CACHE_SIZE,
+                                               FUZZY_NORMALIZATION, FUZZY_MIN_SCORE)) as executor:
+                pending: deque = deque()
+                for chunk in _iter_chunks(src, chunk_size):
+                    pending.append(executor.submit(_process_chunk, chunk, VALIDATOR_BACKEND))
+                    if len(pending) >= in_flight:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+    elapsed = time.perf_counter() - start
+
+    rate = n_records / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {n_records:,} records in {elapsed:.2f}s ({rate:,.0f} records/s, "
+          f"{workers} worker(s), backend={VALIDATOR_BACKEND})")
+    print(f"Valid: {n_records - n_invalid:,}  Invalid: {n_invalid:,}")
+    if codes:
+        print("Issue codes:")
+        for code, count in codes.most_common():
+            print(f"  {code:<24}{count:>12,}")
+    if jsonschema is None and VALIDATOR_BACKEND == "jsonschema":
+        print("(Note) 'jsonschema' not installed – only normalization ran. Use --backend generated.")
+    return 0
+
+
 # --------------------------------------------------------------------------------------
 # CLI runners (test & preview)
 # --------------------------------------------------------------------------------------
 
+# Raw profiles whose defaults fill query fields: a bad home_country (3 letters) and currency
+_SESSION_PROFILES: List[Optional[Dict[str, Any]]] = [
+    None,
+    {"home_country": "AUS"},
+    {"home_country": "Vietnam", "currency_preference": "usd"},
+    {"home_country": "FR", "currency_preference": "XYZ"},
+]
+
+
+def _incremental_mismatches(sessions: int = 120, steps: int = 40, seed: int = 0) -> List[str]:
+    """Random edit sessions where IncrementalValidator.update differs from a full normalize + validate."""
+    rng = random.Random(seed)
+    mismatches: List[str] = []
+    for kind, fixtures, normalize, validate in (
+        ("query", [t["query"] for t in QUERY_FIXTURES], normalize_user_query, validate_query),
+        ("profile", [t["profile"] for t in PROFILE_FIXTURES], normalize_user_profile, validate_profile),
+    ):
+        snap = current_taxonomy()
+        keys = list((snap.query_schema if kind == "query" else snap.profile_schema)["properties"])
+        for _ in range(sessions):
+            profile = rng.choice(_SESSION_PROFILES) if kind == "query" else None
+            session = IncrementalValidator(kind, profile)
+            doc: Any = copy.deepcopy(rng.choice(fixtures))
+            for _ in range(steps):
+                if rng.random() < 0.05:
+                    doc = copy.deepcopy(rng.choice(fixtures))
+                else:
+                    doc = _fuzz(doc if isinstance(doc, dict) else {}, keys, rng)
+                diff = session.update(doc)
+                if isinstance(doc, dict):
+                    norm = (normalize(doc, profile) if kind == "query" else normalize(doc)) or {}
+                else:
+                    norm = doc
+                expected = validate(norm)
+                if diff.issues != expected or diff.normalized != norm:
+                    mismatches.append(f"{kind} profile={profile!r} doc={doc!r}: "
+                                      f"{[i.code for i in diff.issues]} != {[i.code for i in expected]}")
+    return mismatches
+
+
 def run_tests() -> int:
     """Execute embedded fixtures through normalize + validate; print a summary.
     Returns process exit code (0 = all pass)."""
     total = 0
     passed = 0
     failures: List[str] = []
+    default_backend = VALIDATOR_BACKEND
 
     # Profiles
     for t in PROFILE_FIXTURES:
@@ -660,6 +1689,20 @@ def run_tests() -> int:
         else:
             failures.append(f"{t['id']} FAIL – expected valid={t['valid']} got {valid} – issues={[i.code for i in issues]}")
 
+    # Incremental sessions (with and without profile defaults) against a full re-validation
+    for backend in VALIDATOR_BACKENDS:
+        if backend == "jsonschema" and jsonschema is None:
+            continue
+        total += 1
+        set_validator_backend(backend)
+        mismatches = _incremental_mismatches()
+        if not mismatches:
+            passed += 1
+        else:
+            failures.append(f"INCREMENTAL ({backend}) FAIL – {len(mismatches)} steps differ from full validation, "
+                            f"first: {mismatches[0]}")
+    set_validator_backend(default_backend)
+
     print(f"Test Results: {passed}/{total} tests passed.")
     if failures:
         print("Detailed Failures:")
@@ -708,6 +1751,208 @@ def run_preview() -> int:
     return 0
 
 
+def _throughput(fn: Callable[[], Any], min_seconds: float) -> float:
+    """Calls per second of `fn`, measured over at least `min_seconds`."""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds:
+        for _ in range(50):
+            fn()
+        calls += 50
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def run_benchmark(min_seconds: float = 1.0) -> int:
+    """Micro-benchmark: validations/second (schema + issue mapping) for each backend.
+
+    per-call:  a fresh Draft7Validator for every validation (previous behaviour)
+    cached:    the compiled validator held by the taxonomy snapshot
+    generated: the specialized function held by the taxonomy snapshot
+    """
+    snap = current_taxonomy()
+    profiles = [normalize_user_profile(t["profile"]) or {} for t in PROFILE_FIXTURES]
+    queries = [normalize_user_query(t["query"]) or {} for t in QUERY_FIXTURES]
+
+    def over(docs: List[Dict[str, Any]], check: Callable[[Dict[str, Any]], Any]) -> Callable[[], None]:
+        def run() -> None:
+            for doc in docs:
+                check(doc)
+        return run
+
+    print(f"{'schema':<10}{'per-call/s':>14}{'cached/s':>14}{'generated/s':>14}{'gen/cached':>12}")
+    for name, schema, docs in (("profile", snap.profile_schema, profiles),
+                               ("query", snap.query_schema, queries)):
+        fast = snap.validators[name]["generated"]
+        generated = _throughput(over(docs, fast), min_seconds) * len(docs)
+        if jsonschema is None:
+            print(f"{name:<10}{'-':>14}{'-':>14}{generated:>14,.0f}{'-':>12}")
+            continue
+        per_call = _throughput(over(docs, lambda d: _map_schema_errors(
+            Draft7Validator(schema).iter_errors(d))), min_seconds) * len(docs)  # type: ignore
+        validator = snap.validators[name]["jsonschema"]
+        cached = _throughput(over(docs, lambda d: _map_schema_errors(validator.iter_errors(d))),
+                             min_seconds) * len(docs)
+        print(f"{name:<10}{per_call:>14,.0f}{cached:>14,.0f}{generated:>14,.0f}{generated / cached:>11.1f}x")
+    return 0
+
+
+def _skewed_inputs(n: int, seed: int = 0) -> Dict[str, List[str]]:
+    """`n` raw strings per normalizer, drawn Zipf-like from a few hundred distinct spellings."""
+    rng = random.Random(seed)
+    spell = (lambda a: a, str.lower, str.upper, str.title, lambda a: f" {a} ", lambda a: f"{a}  ")
+    junk = ["xx", "Klingon", "tlh", "BTC", "N/A", "??", "Atlantis", "ZZZ", "tbd", "misc"]
+    inputs: Dict[str, List[str]] = {}
+    for name, category in (("language", "languages"), ("currency", "currencies"),
+                           ("country", "countries"), ("interest", "interests")):
+        aliases = [a for e in current_taxonomy().taxonomy[category] for a in e.get("aliases", [])] + junk
+        vocab = list(dict.fromkeys(f(a) for a in aliases for f in spell))
+        rng.shuffle(vocab)
+        weights = [1.0 / (rank + 1) ** 1.1 for rank in range(len(vocab))]
+        inputs[name] = rng.choices(vocab, weights=weights, k=n)
+    return inputs
+
+
+def run_normalizer_benchmark(n: int = 200_000, seed: int = 0) -> int:
+    """Normalizations/second with and without the LRU memo on a skewed input mix."""
+    inputs = _skewed_inputs(n, seed)
+    calls = {
+        "language": normalize_language,
+        "currency": normalize_currency,
+        "country": normalize_country,
+        "interest": lambda s: normalize_interests([s]),
+    }
+    size = NORMALIZER_CACHE_SIZE
+    print(f"{n:,} calls per normalizer, cache size {size}")
+    print(f"{'normalizer':<12}{'distinct':>10}{'uncached/s':>14}{'cached/s':>14}{'speedup':>10}{'hit rate':>10}")
+    for name, fn in calls.items():
+        rates = []
+        for maxsize in (0, size):
+            configure_normalizer_cache(maxsize)
+            start = time.perf_counter()
+            for raw in inputs[name]:
+                fn(raw)
+            rates.append(n / (time.perf_counter() - start))
+        info = normalizer_cache_info()[name]
+        hit_rate = info.hits / max(1, info.hits + info.misses)
+        print(f"{name:<12}{len(set(inputs[name])):>10}{rates[0]:>14,.0f}{rates[1]:>14,.0f}{rates[1] / rates[0]:>9.1f}x{hit_rate:>10.1%}")
+    configure_normalizer_cache(size)
+
+    # Fuzzy fallback cost per lookup, memo disabled so every call hits the trigram index
+    typos = ["Beachs", "wild life", "gastronomie", "Untied States", "Viet-nam", "Germny", "Franch", "skiing"]
+    snap = current_taxonomy()
+    matchers = {name: AliasMatcher(snap.alias_maps[category], _preferred(snap.taxonomy, category), cache_size=0)
+                for name, (category, _) in _NORMALIZER_IMPLS.items()}
+    start = time.perf_counter()
+    rounds = 2000
+    for _ in range(rounds):
+        for text in typos:
+            for matcher in matchers.values():
+                matcher.match(text)
+    per_call = (time.perf_counter() - start) / (rounds * len(typos) * len(matchers))
+    print(f"fuzzy match (uncached): {per_call * 1e6:.1f} µs/lookup")
+    return 0
+
+
+def _keystrokes() -> List[Dict[str, Any]]:
+    """Successive states of a query form as a user types into it, one per keystroke."""
+    doc: Dict[str, Any] = {"origin": "United States", "adults": "2"}
+    states = []
+    for field, text in (("destination", "Japan"), ("departure_date", "2025-12-01"),
+                        ("return_date", "2025-12-08"), ("budget", "3000 USD"), ("interests", "food, culture")):
+        for i in range(1, len(text) + 1):
+            doc = dict(doc)
+            doc[field] = text[:i]
+            states.append(doc)
+    return states
+
+
+def run_incremental_benchmark(rounds: int = 200) -> int:
+    """Per-keystroke latency: full normalize+validate vs IncrementalValidator.update."""
+    states = _keystrokes()
+    print(f"{len(states)} keystrokes per form, {rounds} forms")
+    for backend in VALIDATOR_BACKENDS:
+        if backend == "jsonschema" and jsonschema is None:
+            continue
+        set_validator_backend(backend)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for doc in states:
+                validate_query(normalize_user_query(doc) or {})
+        full = (time.perf_counter() - start) / (rounds * len(states))
+        print(f"{'full (' + backend + ')':<22}{full * 1e6:8.1f} µs/keystroke")
+    start = time.perf_counter()
+    for _ in range(rounds):
+        session = IncrementalValidator("query")
+        for doc in states:
+            session.update(doc)
+        assert session.issues == validate_query(normalize_user_query(states[-1]) or {})
+    incremental = (time.perf_counter() - start) / (rounds * len(states))
+    print(f"{'incremental':<22}{incremental * 1e6:8.1f} µs/keystroke")
+    return 0
+
+
+# Values used to fuzz documents for the parity check
+_FUZZ_VALUES: List[Any] = [
+    None, True, False, 0, -1, 1, 2.0, 1.5, -0.5, "", "abc", "US", "us", "USA", "FR",
+    "en-US", "English", "USD", "usd", "beach", "shopping", "2025-12-01", "2025-02-30",
+    "01/06/2025", "2025-1-1", [], ["beach"], ["beach", "nope"], [1, None], {},
+    {"amount": 10}, {"amount": -1}, {"amount": "5"}, {"currency": "USD"},
+    {"amount": 5, "currency": "CAD"}, {"amount": True, "currency": 1},
+]
+
+
+def _fuzz(doc: Dict[str, Any], keys: List[str], rng: random.Random) -> Any:
+    if rng.random() < 0.03:
+        return rng.choice(_FUZZ_VALUES)  # not even an object
+    out = dict(doc)
+    for _ in range(rng.randint(1, 4)):
+        op = rng.random()
+        key = rng.choice(keys)
+        if op < 0.25:
+            out.pop(key, None)
+        elif op < 0.9:
+            out[key] = rng.choice(_FUZZ_VALUES)
+        else:
+            out["extra_" + key] = rng.choice(_FUZZ_VALUES)
+    return out
+
+
+def run_parity(n_fuzz: int = 5000, seed: int = 0) -> int:
+    """Check that generated validators report exactly what jsonschema reports.
+
+    Covers every fixture (raw and normalized) plus `n_fuzz` fuzzed documents
+    per schema. Returns 0 when all issue lists (code, field, message, hint) match.
+    """
+    if jsonschema is None:
+        print("(Note) 'jsonschema' not installed – nothing to compare against.")
+        return 1
+    rng = random.Random(seed)
+    snap = current_taxonomy()
+    mismatches = 0
+    for name, schema, docs in (
+        ("profile", snap.profile_schema,
+         [t["profile"] for t in PROFILE_FIXTURES] + [normalize_user_profile(t["profile"]) for t in PROFILE_FIXTURES]),
+        ("query", snap.query_schema,
+         [t["query"] for t in QUERY_FIXTURES] + [normalize_user_query(t["query"]) for t in QUERY_FIXTURES]),
+    ):
+        keys = list(schema["properties"])
+        cases: List[Any] = list(docs)
+        cases += [_fuzz(rng.choice(docs), keys, rng) for _ in range(n_fuzz)]
+        fast, validator = snap.validators[name]["generated"], snap.validators[name]["jsonschema"]
+        for doc in cases:
+            expected = _map_schema_errors(validator.iter_errors(doc))
+            got = fast(doc)
+            if got != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"MISMATCH ({name}): {doc!r}\n  jsonschema: {expected}\n  generated:  {got}")
+        print(f"{name}: {len(cases)} documents compared")
+    print("Parity OK." if mismatches == 0 else f"{mismatches} mismatches.")
+    return 0 if mismatches == 0 else 1
+
+
 # --------------------------------------------------------------------------------------
 # Entry point
 # --------------------------------------------------------------------------------------
@@ -716,12 +1961,46 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Smart Travel – single-file CLI")
     parser.add_argument("--test", action="store_true", help="Run embedded fixture tests")
     parser.add_argument("--preview", action="store_true", help="Preview normalization+validation on an example")
+    parser.add_argument("--bench", action="store_true", help="Benchmark validations/second for each backend")
+    parser.add_argument("--bench-normalize", action="store_true",
+                        help="Benchmark the normalizer LRU memo on a skewed input mix")
+    parser.add_argument("--cache-size", type=int, default=NORMALIZER_CACHE_SIZE,
+                        help="Entries kept per normalizer memo (0 disables it)")
+    parser.add_argument("--bench-incremental", action="store_true",
+                        help="Benchmark per-keystroke incremental re-validation")
+    parser.add_argument("--fuzzy", action="store_true",
+                        help="Map unknown taxonomy values to the closest alias during normalization")
+    parser.add_argument("--parity", action="store_true", help="Check generated validators against jsonschema")
+    parser.add_argument("--backend", choices=VALIDATOR_BACKENDS, default=VALIDATOR_BACKEND,
+                        help="Schema validation backend")
+    parser.add_argument("--taxonomy", metavar="TAXONOMY.json", help="Load the taxonomy from a JSON file")
+    parser.add_argument("--bulk", metavar="INPUT.jsonl", help="Normalize+validate a JSON Lines file of queries")
+    parser.add_argument("--out", metavar="RESULTS.jsonl", help="Output file for --bulk (default: INPUT.results.jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --bulk (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE, help="Records per --bulk task")
     args = parser.parse_args()
+    set_validator_backend(args.backend)
+    if args.taxonomy:
+        load_taxonomy_file(args.taxonomy)
+    configure_normalizer_cache(args.cache_size)
+    if args.fuzzy:
+        configure_fuzzy_normalization(True)
 
     if args.test:
         sys.exit(run_tests())
     if args.preview:
         sys.exit(run_preview())
+    if args.bench:
+        sys.exit(run_benchmark())
+    if args.bench_normalize:
+        sys.exit(run_normalizer_benchmark())
+    if args.bench_incremental:
+        sys.exit(run_incremental_benchmark())
+    if args.parity:
+        sys.exit(run_parity())
+    if args.bulk:
+        out = args.out or os.path.splitext(args.bulk)[0] + ".results.jsonl"
+        sys.exit(run_bulk(args.bulk, out, workers=args.workers, chunk_size=args.chunk_size))
 
     parser.print_help()
 
@@ -0,0 +1,227 @@
+"""
+Compiled alert rules for ContextAlertSystem (Task 6).
+
+The weather, time and budget rules are plain configuration (dicts, or a JSON
+file with the same shape). `compile_alert_rules` turns them, once, into lookup
+tables of immutable `Alert` objects:
+
+- `hour_alerts[h]`: the tuple of alerts for hour `h` (24 slots),
+- `weather_alerts[w][e]`: the tuple of alerts for weather `w` at a place
+  whose `environment_type` is `e`,
+- `budget_levels`: (threshold, level, status, message template), highest first.
+
+Generating alerts is then one indexed lookup per dimension, and the same
+`Alert` objects are shared by every lookup instead of being rebuilt. An
+`Alert` is a read-only dict, so reports holding them serialize with
+`json.dumps` as they are; `Alert.to_dict` gives a mutable copy.
+
+Configuration shape (every section optional when overriding the defaults):
+
+    {
+      "weather": {"rain": {"level": "warning", "message": "...", "indoor": true},
+                  "storm": {"level": "warning", "message": "...", "outdoor": false}},
+      "outdoor": {"indoor": {"type": "recommendation", "level": "warning", "message": "..."},
+                  "no_outdoor": {"type": "recommendation", "level": "danger", "message": "..."}},
+      "time": {"rush_hour": {"hours": [7, 8, 17], "type": "traffic", "level": "info", "message": "..."}},
+      "budget": {"overspend_warning": 0.8, "overspend_critical": 0.95}
+    }
+
+`indoor: true` adds the "outdoor.indoor" alert for outdoor places and
+`outdoor: false` adds "outdoor.no_outdoor"; other environment types only get
+the general weather alert.
+
+Usage:
+    rules = compile_alert_rules(config)
+    rules.time_alerts(8)                  # -> (Alert(type='traffic', ...),)
+    rules.weather_for("rain", "outdoor")
+
+    python alert_rules.py rules.json      # validate a rules file and print the tables
+"""
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+HOURS_PER_DAY = 24
+LEVELS = ("info", "warning", "danger")
+ENVIRONMENT_TYPES = ("indoor", "outdoor", "both")
+
+# Environment types without a column of their own are treated like this one
+_DEFAULT_ENVIRONMENT = "both"
+
+
+class Alert(dict):
+    """Immutable alert: a dict with keys type/level/message that refuses changes.
+
+    Being a real dict, it serializes with `json.dumps` and compares equal to a
+    plain dict with the same keys; instances are shared by every lookup, so
+    mutating methods raise TypeError. `to_dict` gives a caller its own copy.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, type: str, level: str, message: str) -> None:
+        dict.__init__(self, type=type, level=level, message=message)
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Alert is immutable; use to_dict() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    @property
+    def type(self) -> str:
+        return self["type"]
+
+    @property
+    def level(self) -> str:
+        return self["level"]
+
+    @property
+    def message(self) -> str:
+        return self["message"]
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.level, self.message))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Alert, (self.type, self.level, self.message)
+
+    def __repr__(self) -> str:
+        return f"Alert(type={self.type!r}, level={self.level!r}, message={self.message!r})"
+
+    def to_dict(self) -> Dict[str, str]:
+        """A fresh plain dict with the same keys."""
+        return dict(self)
+
+
+@dataclass(frozen=True)
+class AlertRules:
+    """Alert lookup tables built by `compile_alert_rules`."""
+    hour_alerts: Tuple[Tuple[Alert, ...], ...]
+    weather_index: Dict[str, int]
+    environment_index: Dict[str, int]
+    weather_alerts: Tuple[Tuple[Tuple[Alert, ...], ...], ...]
+    budget_levels: Tuple[Tuple[float, str, str, str], ...]
+    config: Dict[str, Any]
+
+    def time_alerts(self, hour: int) -> Tuple[Alert, ...]:
+        return self.hour_alerts[hour]
+
+    def weather_for(self, weather: str, environment_type: str) -> Tuple[Alert, ...]:
+        w = self.weather_index.get(weather)
+        if w is None:
+            return ()
+        e = self.environment_index.get(environment_type, self.environment_index[_DEFAULT_ENVIRONMENT])
+        return self.weather_alerts[w][e]
+
+    def budget_level(self, ratio: float) -> Optional[Tuple[float, str, str, str]]:
+        """(threshold, level, status, template) of the highest threshold `ratio` reaches."""
+        for entry in self.budget_levels:
+            if ratio >= entry[0]:
+                return entry
+        return None
+
+
+# Messages and levels of the budget alerts; thresholds come from the "budget" section
+_BUDGET_LEVELS = {
+    "overspend_critical": ("danger", "critical", "💸 CẢNH BÁO: Đã chi {percent:.1f}% ngân sách!"),
+    "overspend_warning": ("warning", "warning", "⚠️ Chú ý: Đã chi {percent:.1f}% ngân sách"),
+}
+
+
+def _alert(spec: Any, where: str, default_type: str) -> Alert:
+    if not isinstance(spec, dict) or not isinstance(spec.get("message"), str):
+        raise ValueError(f"Alert rule {where} must be an object with a 'message' string")
+    level = spec.get("level", "info")
+    if level not in LEVELS:
+        raise ValueError(f"Alert rule {where} has unknown level {level!r}, expected one of {LEVELS}")
+    return Alert(spec.get("type", default_type), level, spec["message"])
+
+
+def compile_alert_rules(config: Dict[str, Any]) -> AlertRules:
+    """Build the lookup tables from a rules config; raises ValueError if it is malformed."""
+    if not isinstance(config, dict):
+        raise ValueError("Alert rules must be a JSON object")
+
+    slots: list = [[] for _ in range(HOURS_PER_DAY)]
+    for name, rule in config.get("time", {}).items():
+        alert = _alert(rule, f"time.{name}", "time")
+        hours = rule.get("hours", [])
+        if not isinstance(hours, list) or any(isinstance(h, bool) or not isinstance(h, int)
+                                              or not 0 <= h < HOURS_PER_DAY for h in hours):
+            raise ValueError(f"Alert rule time.{name} needs 'hours' as a list of integers 0-23")
+        for h in dict.fromkeys(hours):
+            slots[h].append(alert)
+
+    outdoor = config.get("outdoor", {})
+    indoor_alert = _alert(outdoor["indoor"], "outdoor.indoor", "recommendation") if "indoor" in outdoor else None
+    no_outdoor_alert = _alert(outdoor["no_outdoor"], "outdoor.no_outdoor", "recommendation") \
+        if "no_outdoor" in outdoor else None
+    weather_index, weather_rows = {}, []
+    for name, rule in config.get("weather", {}).items():
+        general = _alert(rule, f"weather.{name}", "weather")
+        extra = []
+        if rule.get("indoor") and indoor_alert is not None:
+            extra.append(indoor_alert)
+        if rule.get("outdoor") is False and no_outdoor_alert is not None:
+            extra.append(no_outdoor_alert)
+        weather_index[name] = len(weather_rows)
+        weather_rows.append(tuple((general, *extra) if env == "outdoor" else (general,)
+                                  for env in ENVIRONMENT_TYPES))
+
+    budget = config.get("budget", {})
+    levels = []
+    for key, (level, status, template) in _BUDGET_LEVELS.items():
+        if key in budget:
+            threshold = budget[key]
+            if isinstance(threshold, bool) or not isinstance(threshold, (int, float)):
+                raise ValueError(f"Budget rule {key} must be a number, got {threshold!r}")
+            levels.append((float(threshold), level, status, template))
+    levels.sort(key=lambda entry: -entry[0])
+
+    return AlertRules(
+        hour_alerts=tuple(tuple(slot) for slot in slots),
+        weather_index=weather_index,
+        environment_index={env: i for i, env in enumerate(ENVIRONMENT_TYPES)},
+        weather_alerts=tuple(weather_rows),
+        budget_levels=tuple(levels),
+        config=config,
+    )
+
+
+def merge_rule_config(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """`base` with every section present in `override` replaced by the override's."""
+    if not isinstance(override, dict):
+        raise ValueError("Alert rules must be a JSON object")
+    return {**base, **override}
+
+
+def load_rule_config(path: str) -> Dict[str, Any]:
+    """Read a rules JSON file; raises ValueError if it is not valid JSON."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Alert rules file {path} is not valid JSON: {exc}") from exc
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print("Usage: python alert_rules.py rules.json", file=sys.stderr)
+        raise SystemExit(2)
+    rules = compile_alert_rules(load_rule_config(sys.argv[1]))
+    for hour, alerts in enumerate(rules.hour_alerts):
+        if alerts:
+            print(f"{hour:02d}h: " + " | ".join(a.message for a in alerts))
+    for weather, w in rules.weather_index.items():
+        for env, e in rules.environment_index.items():
+            print(f"{weather}/{env}: " + " | ".join(a.message for a in rules.weather_alerts[w][e]))
+    for threshold, level, status, _ in rules.budget_levels:
+        print(f"budget >= {threshold:.0%}: {level} ({status})")
+
+
+if __name__ == "__main__":
+    main()
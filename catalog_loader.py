@@ -0,0 +1,233 @@
+"""
+Streaming catalog loader with a memory-mapped columnar cache (Task 1 / Task 3).
+
+- `iter_places(path)` streams place dicts one at a time from either a JSON array
+  file (`sample_places.json`) or a JSON Lines file (one place per line), without
+  reading the whole file into memory.
+- `load_table(path, cache_dir=...)` builds a `PlaceTable` in a single pass over
+  that stream and, when `cache_dir` is given, saves the columns as `.npy` files.
+  Later loads of an unchanged source memory-map the cache instead of parsing
+  JSON again, so start-up cost no longer depends on JSON parsing speed.
+
+Usage:
+    table = load_table("sample_places.json", cache_dir=".catalog_cache")
+"""
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from place_table import PlaceTable, StringColumn, tag_bitset
+from tag_index import TagIndex, TagVocabulary
+
+CACHE_VERSION = 1
+
+# Read size for the incremental JSON array parser
+_CHUNK_SIZE = 1 << 16
+
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_WHITESPACE = " \t\r\n"
+
+# Columns stored in the cache directory, one .npy file each
+_CACHE_ARRAYS = (
+    "lat", "lon", "rating", "price", "trend_score", "tag_bits",
+    "tag_offsets", "tag_ids", "posting_offsets", "posting_ids",
+    "name_offsets", "name_data", "type_offsets", "type_data",
+)
+
+
+# --------------------------------------------------------------------------------------
+# Streaming readers
+# --------------------------------------------------------------------------------------
+def _iter_json_lines(f: TextIO) -> Iterator[Dict[str, Any]]:
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_json_array(f: TextIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of a top-level JSON array, decoding one element at a time."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def skip(chars: str) -> bool:
+        """Advance past `chars`, refilling the buffer; False at end of input."""
+        nonlocal buf, pos, eof
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if eof:
+                return False
+            buf, pos = f.read(chunk_size), 0
+            eof = not buf
+
+    if not skip(_WHITESPACE) or buf[pos] != "[":
+        raise json.JSONDecodeError("Expected '[' at start of JSON array", buf, pos)
+    pos += 1
+    while True:
+        if not skip(_WHITESPACE + ","):
+            raise json.JSONDecodeError("Unterminated JSON array", buf, pos)
+        if buf[pos] == "]":
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+            complete = end < len(buf) or eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if complete:
+            pos = end
+            yield obj
+            continue
+        # Element continues past the buffer: keep the tail and read more
+        more = f.read(chunk_size)
+        eof = not more
+        buf, pos = buf[pos:] + more, 0
+
+
+def iter_places(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream place dicts from a JSON array or JSON Lines file.
+
+    `.jsonl`/`.ndjson` files are read line by line; other files are sniffed:
+    a leading '[' means a JSON array, anything else is treated as JSON Lines.
+    Raises FileNotFoundError / json.JSONDecodeError like `json.load` would.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(_JSONL_SUFFIXES):
+            yield from _iter_json_lines(f)
+            return
+        head = f.read(_CHUNK_SIZE)
+        stripped = head.lstrip(_WHITESPACE + "\ufeff")
+        f.seek(0)
+        if stripped.startswith("["):
+            if head.startswith("\ufeff"):
+                f.read(1)
+            yield from _iter_json_array(f)
+        else:
+            yield from _iter_json_lines(f)
+
+
+# --------------------------------------------------------------------------------------
+# Table construction and cache
+# --------------------------------------------------------------------------------------
+def build_table(places: Iterable[Dict[str, Any]], keep_records: bool = False,
+                coord_dtype: Any = np.float64) -> PlaceTable:
+    """Build a `PlaceTable` in one pass over `places` (any iterable, e.g. `iter_places`).
+
+    Only the columns are kept unless `keep_records` is True, so memory grows
+    with the compact columnar size rather than with the size of the dicts.
+    Tag ids are stored as int32; `coord_dtype=np.float32` also halves lat/lon.
+    """
+    lat, lon, rating, price, trend = (array("d") for _ in range(5))
+    tag_offsets = array("q", [0])
+    tag_ids = array("i")
+    names: List[str] = []
+    types: List[str] = []
+    records: Optional[List[Dict[str, Any]]] = [] if keep_records else None
+    vocab = TagVocabulary()
+    for p in places:
+        lat.append(p["lat"])
+        lon.append(p["lon"])
+        rating.append(p["rating"])
+        price.append(p.get("price", 0))
+        trend.append(p.get("trend_score", 0))
+        tag_ids.extend(dict.fromkeys(vocab.intern(tag) for tag in p.get("tags", [])))
+        tag_offsets.append(len(tag_ids))
+        names.append(p.get("name", ""))
+        types.append(p.get("type", ""))
+        if records is not None:
+            records.append(p)
+
+    def col(a: array, dtype: Any = None) -> np.ndarray:
+        out = np.frombuffer(a, dtype=np.dtype(a.typecode))
+        return out.astype(dtype) if dtype is not None else out.copy()
+
+    tag_index = TagIndex(vocab, col(tag_offsets), col(tag_ids))
+    return PlaceTable(col(lat, coord_dtype), col(lon, coord_dtype), col(rating), col(price), col(trend),
+                      tag_bitset(tag_index), tag_index, records=records,
+                      names=StringColumn.from_strings(names),
+                      types=StringColumn.from_strings(types))
+
+
+def _source_stamp(path: str) -> Dict[str, Any]:
+    st = os.stat(path)
+    return {"source": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def save_cache(table: PlaceTable, cache_dir: str, stamp: Optional[Dict[str, Any]] = None) -> None:
+    """Write `table` as one .npy file per column plus a meta.json (written last)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    if os.path.exists(meta_path):
+        # Invalidate first so a half-written cache is never picked up
+        os.remove(meta_path)
+    names = table.names if isinstance(table.names, StringColumn) else \
+        StringColumn.from_strings(table.names or [""] * len(table))
+    types = table.types if isinstance(table.types, StringColumn) else \
+        StringColumn.from_strings(table.types or [""] * len(table))
+    index = table.tag_index
+    columns = {
+        "lat": table.lat, "lon": table.lon, "rating": table.rating, "price": table.price,
+        "trend_score": table.trend_score, "tag_bits": table.tag_bits,
+        "tag_offsets": index.tag_offsets, "tag_ids": index.tag_ids,
+        "posting_offsets": index.posting_offsets, "posting_ids": index.posting_ids,
+        "name_offsets": names.offsets, "name_data": names.data,
+        "type_offsets": types.offsets, "type_data": types.data,
+    }
+    for name in _CACHE_ARRAYS:
+        np.save(os.path.join(cache_dir, name + ".npy"), np.ascontiguousarray(columns[name]))
+    meta = {"version": CACHE_VERSION, "rows": len(table), "tags": index.vocab.tags, **(stamp or {})}
+    tmp = os.path.join(cache_dir, "meta.json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp, meta_path)
+
+
+def open_cache(cache_dir: str, stamp: Optional[Dict[str, Any]] = None) -> Optional[PlaceTable]:
+    """Memory-map a cache written by `save_cache`; None if missing or stale."""
+    try:
+        with open(os.path.join(cache_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    if stamp is not None and any(meta.get(k) != v for k, v in stamp.items()):
+        return None
+    try:
+        c = {name: np.load(os.path.join(cache_dir, name + ".npy"), mmap_mode="r") for name in _CACHE_ARRAYS}
+    except (FileNotFoundError, ValueError):
+        return None
+    tag_index = TagIndex(TagVocabulary(meta["tags"]), c["tag_offsets"], c["tag_ids"],
+                         c["posting_offsets"], c["posting_ids"])
+    return PlaceTable(c["lat"], c["lon"], c["rating"], c["price"], c["trend_score"],
+                      c["tag_bits"], tag_index,
+                      names=StringColumn(c["name_offsets"], c["name_data"]),
+                      types=StringColumn(c["type_offsets"], c["type_data"]))
+
+
+def load_table(path: str, cache_dir: Optional[str] = None, coord_dtype: Any = np.float64) -> PlaceTable:
+    """Load a catalog as a `PlaceTable`, using (and refreshing) a columnar cache.
+
+    The cache is valid while the source file keeps the same path, size and
+    modification time (and was written with the same `coord_dtype`);
+    otherwise the source is streamed again and the cache rewritten.
+    """
+    if cache_dir is None:
+        return build_table(iter_places(path), coord_dtype=coord_dtype)
+    stamp = {**_source_stamp(path), "coord_dtype": np.dtype(coord_dtype).name}
+    table = open_cache(cache_dir, stamp)
+    if table is None:
+        table = build_table(iter_places(path), coord_dtype=coord_dtype)
+        save_cache(table, cache_dir, stamp)
+    return table
@@ -0,0 +1,793 @@
+"""
+Vectorized decision scoring for Task 5 (Decision Process).
+
+Computes the same decision as `EXAMPLE_CODE.select_final_itinerary` for a
+whole batch of itineraries in a few NumPy calls:
+
+    final = (0.5 * score_norm + 0.3 * time_norm + 0.2 * cost_norm) * (1 - penalty)
+
+where the min-max bounds are taken over every itinerary (also the ones that
+break a constraint), `max_budget`/`max_time` are applied as masks, `penalty`
+is 0.5 for itineraries visiting a location with a context alert, and the
+winner is the first itinerary with the highest final score. The per-element
+operations are the ones the loop performs, in the same order, so the scores
+are identical, not just close.
+
+Itineraries are held as columns (`ItineraryColumns`): one float64 array per
+criterion and the visited locations as CSR arrays of location ids, so the
+alert lookup is one boolean gather instead of a nested loop. Nothing is
+printed; pass `log=` to receive one structured event per itinerary.
+
+For top-k output and what-if re-weighting, `ParetoFront` keeps only the
+itineraries that can still reach the top `depth` under some weighting (the
+k-skyband over recommendation, time, cost and alert penalty). It is computed
+once per batch and constraint set and cached on the columns; ranking under
+new weights then scores the front members only, and no input is modified.
+
+`decide_parallel` splits the scoring over a process pool, handing the columns
+to the workers through shared memory, and merges their bounds and top-k.
+
+`StreamingDecision` consumes a generator of itineraries with running bounds,
+keeping only the rows that can still reach the top k, so candidate generation
+and scoring overlap. That set is not O(k) - with correlated criteria it can be
+most of the stream - so memory is bounded by `max_retained` rows instead; when
+the cap cuts rows the result may no longer be exact, and a RuntimeWarning is
+issued (`exact` turns False).
+
+Usage:
+    cols = ItineraryColumns.from_itineraries(itineraries, user_constraints)
+    decision = decide(cols, user_constraints, context_alerts)
+    best = select_best(itineraries, user_constraints, context_alerts)   # drop-in
+    front = cols.pareto_front(user_constraints, context_alerts, depth=10)
+    front.top_k(5, {"recommendation": 0.2, "time": 0.4, "cost": 0.4})
+
+    top = select_streaming(generate_itineraries(places, constraints), constraints, alerts, k=5)
+
+    python decision_engine.py [--candidates N]   # parity + timing vs select_final_itinerary
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import heapq
+import io
+import json
+import os
+import random
+import time
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from EXAMPLE_CODE import WEIGHTS, costs_in_base_currency, select_final_itinerary
+from fx_rates import FxTable
+from ranking_engine import top_k_indices
+from tag_index import TagVocabulary
+
+ALERT_PENALTY = 0.5
+
+# Ranks a Pareto front can answer unless asked for more
+DEFAULT_FRONT_DEPTH = 10
+# Rows compared against the front at once while computing it
+_SKYBAND_BLOCK = 256
+
+# Same defaults as select_final_itinerary when a constraint is missing
+DEFAULT_MAX_TIME = 99
+
+# Rows a StreamingDecision keeps before it starts dropping the lowest-scoring ones
+DEFAULT_MAX_RETAINED = 10_000
+
+DecisionLog = Callable[[Dict[str, Any]], None]
+
+
+@dataclass
+class ItineraryColumns:
+    """Columnar batch of itineraries.
+
+    The locations of itinerary `i` are
+    `locations.tag(loc_ids[j])` for `j` in `loc_offsets[i]:loc_offsets[i + 1]`.
+    Costs are already in one currency (see `from_itineraries`).
+    """
+    ids: List[Any]
+    rec_score: np.ndarray
+    total_time: np.ndarray
+    total_cost: np.ndarray
+    loc_offsets: np.ndarray
+    loc_ids: np.ndarray
+    locations: TagVocabulary
+    records: Optional[List[Dict[str, Any]]] = None
+    _fronts: Dict[Tuple[Any, ...], "ParetoFront"] = field(default_factory=dict, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_itineraries(cls, itineraries: Iterable[Dict[str, Any]],
+                         user_constraints: Optional[Dict[str, Any]] = None,
+                         fx: Optional[FxTable] = None, keep_records: bool = True) -> "ItineraryColumns":
+        """Build the columns in one pass, converting costs like `select_final_itinerary` does."""
+        records = list(itineraries)
+        costs, _ = costs_in_base_currency(records, user_constraints or {}, fx)
+        vocab = TagVocabulary()
+        loc_ids: List[int] = []
+        loc_offsets = [0]
+        for it in records:
+            loc_ids.extend(vocab.intern(loc) for loc in it.get("locations", []))
+            loc_offsets.append(len(loc_ids))
+        return cls(
+            ids=[it["id"] for it in records],
+            rec_score=np.array([it["avg_rec_score"] for it in records], dtype=np.float64),
+            total_time=np.array([it["total_time"] for it in records], dtype=np.float64),
+            total_cost=np.asarray(costs, dtype=np.float64),
+            loc_offsets=np.array(loc_offsets, dtype=np.int64),
+            loc_ids=np.array(loc_ids, dtype=np.int64),
+            locations=vocab,
+            records=records if keep_records else None,
+        )
+
+    def alert_mask(self, context_alerts: Dict[str, Any]) -> np.ndarray:
+        """True for every itinerary that visits at least one alerted location."""
+        alerted = np.zeros(len(self.locations), dtype=bool)
+        for loc in context_alerts:
+            lid = self.locations.get(loc)
+            if lid is not None:
+                alerted[lid] = True
+        row = np.repeat(np.arange(len(self)), np.diff(self.loc_offsets))
+        hits = np.bincount(row, weights=alerted[self.loc_ids], minlength=len(self))
+        return hits > 0
+
+    def pareto_front(self, user_constraints: Dict[str, Any], context_alerts: Dict[str, Any],
+                     depth: int = DEFAULT_FRONT_DEPTH, fx: Optional[FxTable] = None) -> "ParetoFront":
+        """The (cached) `ParetoFront` of this batch for these constraints and alerted locations."""
+        key = (json.dumps(user_constraints, sort_keys=True, default=str), frozenset(context_alerts), depth, id(fx))
+        front = self._fronts.get(key)
+        if front is None:
+            front = self._fronts[key] = ParetoFront(self, user_constraints, context_alerts, depth, fx)
+        return front
+
+
+@dataclass
+class Decision:
+    """Outcome of `decide`: the winner (None if nothing fits) and the per-row detail."""
+    index: Optional[int]
+    score: Optional[float]
+    scores: np.ndarray        # final score per itinerary, -inf where a constraint is broken
+    eligible: np.ndarray      # passes max_budget and max_time
+    penalized: np.ndarray     # visits an alerted location
+
+
+def normalize(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Vectorized `EXAMPLE_CODE.normalize` (1.0 when all values are equal)."""
+    if hi == lo:
+        return np.ones_like(values)
+    return (values - lo) / (hi - lo)
+
+
+def normalize_inverse(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Vectorized `EXAMPLE_CODE.normalize_inverse` (1.0 when all values are equal)."""
+    if hi == lo:
+        return np.ones_like(values)
+    return (hi - values) / (hi - lo)
+
+
+def _budget_in_base(user_constraints: Dict[str, Any], fx: Optional[FxTable]) -> float:
+    """`max_budget` in the currency `from_itineraries` converted the costs to."""
+    return costs_in_base_currency((), user_constraints, fx)[1]
+
+
+def _violations(cols: ItineraryColumns, user_constraints: Dict[str, Any],
+                fx: Optional[FxTable]) -> Tuple[np.ndarray, np.ndarray]:
+    """(over max_budget, over max_time) masks."""
+    over_budget = cols.total_cost > _budget_in_base(user_constraints, fx)
+    over_time = cols.total_time > user_constraints.get("max_time", DEFAULT_MAX_TIME)
+    return over_budget, over_time
+
+
+Bounds = Tuple[float, float, float, float, float, float]   # score, time and cost (min, max)
+
+
+def _bounds(cols: ItineraryColumns) -> Bounds:
+    return (cols.rec_score.min(), cols.rec_score.max(), cols.total_time.min(), cols.total_time.max(),
+            cols.total_cost.min(), cols.total_cost.max())
+
+
+def _normalized(cols: ItineraryColumns, rows: Any = slice(None),
+                bounds: Optional[Bounds] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(score_norm, time_norm, cost_norm) of `rows`, by default with bounds over the whole batch."""
+    s_lo, s_hi, t_lo, t_hi, c_lo, c_hi = bounds if bounds is not None else _bounds(cols)
+    return (normalize(cols.rec_score[rows], s_lo, s_hi),
+            normalize_inverse(cols.total_time[rows], t_lo, t_hi),
+            normalize_inverse(cols.total_cost[rows], c_lo, c_hi))
+
+
+def _final_scores(norms: Tuple[np.ndarray, np.ndarray, np.ndarray], penalized: np.ndarray,
+                  w: Dict[str, float]) -> np.ndarray:
+    score_norm, time_norm, cost_norm = norms
+    decision = (w["recommendation"] * score_norm) + (w["time"] * time_norm) + (w["cost"] * cost_norm)
+    return decision * np.where(penalized, 1 - ALERT_PENALTY, 1.0)
+
+
+def decide(cols: ItineraryColumns, user_constraints: Dict[str, Any], context_alerts: Dict[str, Any],
+           weights: Optional[Dict[str, float]] = None, fx: Optional[FxTable] = None,
+           log: Optional[DecisionLog] = None) -> Decision:
+    """Score every itinerary in `cols` and pick the winner, without a Python loop.
+
+    `log`, if given, receives one dict per itinerary in input order:
+    {"event": "rejected", "id", "reason": "budget" | "time"} or
+    {"event": "scored", "id", "score", "alert"} (`alert` is None without one).
+    """
+    n = len(cols)
+    if n == 0:
+        empty = np.empty(0)
+        return Decision(None, None, empty, empty.astype(bool), empty.astype(bool))
+
+    over_budget, over_time = _violations(cols, user_constraints, fx)
+    eligible = ~over_budget & ~over_time
+    penalized = cols.alert_mask(context_alerts) if context_alerts else np.zeros(n, dtype=bool)
+    scores = _final_scores(_normalized(cols), penalized, weights or WEIGHTS)
+    scores[~eligible] = -np.inf
+
+    index = int(np.argmax(scores)) if eligible.any() else None
+    if log is not None:
+        _log_events(log, cols, context_alerts, over_budget, over_time, scores, penalized)
+    return Decision(index, None if index is None else float(scores[index]), scores, eligible, penalized)
+
+
+def _log_events(log: DecisionLog, cols: ItineraryColumns, context_alerts: Dict[str, Any],
+                over_budget: np.ndarray, over_time: np.ndarray, scores: np.ndarray,
+                penalized: np.ndarray) -> None:
+    for i, it_id in enumerate(cols.ids):
+        if over_budget[i]:
+            log({"event": "rejected", "id": it_id, "reason": "budget"})
+        elif over_time[i]:
+            log({"event": "rejected", "id": it_id, "reason": "time"})
+        else:
+            alert = None
+            if penalized[i]:
+                locs = cols.loc_ids[cols.loc_offsets[i]:cols.loc_offsets[i + 1]]
+                first = next(cols.locations.tag(l) for l in locs if cols.locations.tag(l) in context_alerts)
+                alert = {"location": first, "alert": context_alerts[first]}
+            log({"event": "scored", "id": it_id, "score": float(scores[i]), "alert": alert})
+
+
+def select_best(itineraries: Iterable[Dict[str, Any]], user_constraints: Dict[str, Any],
+                context_alerts: Dict[str, Any], fx: Optional[FxTable] = None,
+                log: Optional[DecisionLog] = None) -> Optional[Dict[str, Any]]:
+    """Drop-in for `select_final_itinerary`: same winner and `final_decision_score`, no prints.
+
+    Only the winner gets `final_decision_score` (the loop also stamps every
+    itinerary that was the best so far).
+    """
+    cols = ItineraryColumns.from_itineraries(itineraries, user_constraints, fx)
+    decision = decide(cols, user_constraints, context_alerts, fx=fx, log=log)
+    if decision.index is None:
+        return None
+    best = cols.records[decision.index]
+    best["final_decision_score"] = decision.score
+    return best
+
+
+# --------------------------------------------------------------------------------------
+# Pareto front / top-k
+# --------------------------------------------------------------------------------------
+def _dominators(cand_vals: np.ndarray, cand_ids: np.ndarray, vals: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """[i, j] = candidate j is at least as good as row i in every column and comes earlier."""
+    out = cand_ids[None, :] < ids[:, None]
+    for c in range(vals.shape[1]):
+        out &= cand_vals[None, :, c] <= vals[:, c, None]
+    return out
+
+
+def skyband(criteria: np.ndarray, depth: int = 1, block: int = _SKYBAND_BLOCK) -> np.ndarray:
+    """Rows of `criteria` (lower is better in every column) dominated by fewer than `depth` rows.
+
+    Row q dominates row p when it is at least as good in every column and
+    comes earlier; under any non-negative weighting q then scores at least as
+    high as p and wins the tie, so p cannot rank above q. `depth=1` is the
+    Pareto front; in general every row that can be among the top `depth` is
+    kept, so top-k queries with k <= depth over the result are exact.
+
+    Sort-filter-skyline: rows are visited so that dominators always come
+    first, a block at a time, and each block is only compared with the rows
+    kept so far and with itself. Returns the kept row ids in ascending order.
+    """
+    n, m = criteria.shape
+    order = np.lexsort((np.arange(n),) + tuple(criteria[:, c] for c in reversed(range(m))))
+    # Earlier rows are never worse in the first column, so only the others are compared
+    rest = np.ascontiguousarray(criteria[:, 1:])
+    band = _SkybandFilter(m - 1, depth)
+    for start in range(0, n, block):
+        rows = order[start:start + block]
+        band.add(rest[rows], rows)
+    return np.sort(band.ids)
+
+
+class _SkybandFilter:
+    """Skyband built incrementally from blocks given in an order where dominators come first."""
+
+    def __init__(self, columns: int, depth: int) -> None:
+        self.depth = depth
+        self.vals = np.empty((0, columns))
+        self.ids = np.empty(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, vals: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Keep the rows of this block dominated by fewer than `depth` rows; returns the kept mask."""
+        # dominators among the kept rows, then among the earlier rows of this block
+        count = _dominators(self.vals, self.ids, vals, ids).sum(axis=1)
+        count += np.tril(_dominators(vals, ids, vals, ids), k=-1).sum(axis=1)
+        kept = count < self.depth
+        self.vals = np.concatenate([self.vals, vals[kept]])
+        self.ids = np.concatenate([self.ids, ids[kept]])
+        return kept
+
+
+@dataclass(frozen=True)
+class RankedItinerary:
+    """One entry of a top-k result; `record` is the caller's dict, unmodified."""
+    index: int
+    id: Any
+    score: float
+    record: Optional[Dict[str, Any]]
+
+
+class ParetoFront:
+    """The itineraries of a batch that can rank in the top `depth` under any weights.
+
+    Built once from the eligible itineraries (within `max_budget`/`max_time`)
+    by `skyband` over (recommendation, time, cost, alert penalty). The
+    normalized values of the members are kept, with min-max bounds over the
+    whole batch as in `decide`, so `top_k(k, weights)` only scores the
+    members. `top_k(1)` is the `decide` winner with the same score.
+    """
+
+    def __init__(self, cols: ItineraryColumns, user_constraints: Dict[str, Any],
+                 context_alerts: Dict[str, Any], depth: int = DEFAULT_FRONT_DEPTH,
+                 fx: Optional[FxTable] = None) -> None:
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.cols = cols
+        self.depth = depth
+        over_budget, over_time = _violations(cols, user_constraints, fx)
+        eligible = np.flatnonzero(~over_budget & ~over_time)
+        penalized = cols.alert_mask(context_alerts) if context_alerts else np.zeros(len(cols), dtype=bool)
+        criteria = np.column_stack([-cols.rec_score[eligible], cols.total_time[eligible],
+                                    cols.total_cost[eligible], penalized[eligible]])
+        self.members = eligible[skyband(criteria, depth)]
+        self.eligible_count = len(eligible)
+        self._norms = _normalized(cols, self.members)
+        self._penalized = penalized[self.members]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def scores(self, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Final decision score of every member (same order as `members`)."""
+        w = weights or WEIGHTS
+        if any(w[name] < 0 for name in ("recommendation", "time", "cost")):
+            raise ValueError("Pareto re-ranking needs non-negative weights")
+        return _final_scores(self._norms, self._penalized, w)
+
+    def top_k(self, k: int = DEFAULT_FRONT_DEPTH, weights: Optional[Dict[str, float]] = None) -> List[RankedItinerary]:
+        """The `k` best itineraries under `weights`, best first (ties: input order)."""
+        if k > self.depth:
+            raise ValueError(f"Front was built for the top {self.depth}; rebuild it with depth >= {k}")
+        scores = self.scores(weights)
+        records = self.cols.records
+        return [RankedItinerary(int(self.members[i]), self.cols.ids[self.members[i]], float(scores[i]),
+                                records[self.members[i]] if records is not None else None)
+                for i in top_k_indices(scores, k)]
+
+
+def select_top_k(itineraries: Iterable[Dict[str, Any]], user_constraints: Dict[str, Any],
+                 context_alerts: Dict[str, Any], k: int = 5, weights: Optional[Dict[str, float]] = None,
+                 fx: Optional[FxTable] = None) -> List[RankedItinerary]:
+    """Top `k` alternatives for the UI; the itinerary dicts are left untouched."""
+    cols = ItineraryColumns.from_itineraries(itineraries, user_constraints, fx)
+    return cols.pareto_front(user_constraints, context_alerts, max(k, 1), fx).top_k(k, weights)
+
+
+# --------------------------------------------------------------------------------------
+# Streaming decision
+# --------------------------------------------------------------------------------------
+class StreamingDecision:
+    """Decision over a stream of itineraries without holding the whole stream.
+
+    Itineraries are consumed in blocks of `block` (e.g. straight from
+    `itinerary_generator.generate_itineraries`). For each block the running
+    min/max bounds are widened and the eligible itineraries are passed
+    through an incremental k-skyband (see `skyband`); only those rows - the
+    ones that can still reach the top `k` however the bounds end up - are
+    retained. Because a row can only be dominated by earlier rows, later
+    arrivals never evict a retained one.
+
+    A bounded heap holds the current top `k`. While the bounds stay the same,
+    new rows are pushed into it; when a block widens the bounds the heap is
+    only marked stale and re-scored from the retained rows on the next
+    `top_k`/`best` call. While `exact` is True the result is the one
+    `decide`/`top_k` gives on the full batch.
+
+    Memory is the retained skyband plus one block, and the skyband is not
+    O(k): its size depends on how the criteria relate. With independent
+    criteria it stays small (about 1k rows for 50k candidates at k=10), but
+    when better recommendations come with higher cost and time most rows are
+    on it, up to the whole stream. `max_retained` (None: no cap) bounds it:
+    once more rows are retained, only the `max_retained` best under the
+    current bounds are kept, `exact` turns False and a RuntimeWarning is
+    issued, since a later block that widens the bounds could have lifted a
+    dropped row into the top `k`.
+    """
+
+    def __init__(self, user_constraints: Dict[str, Any], context_alerts: Dict[str, Any], k: int = 1,
+                 weights: Optional[Dict[str, float]] = None, fx: Optional[FxTable] = None,
+                 block: int = _SKYBAND_BLOCK, max_retained: Optional[int] = DEFAULT_MAX_RETAINED) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if max_retained is not None and max_retained < k:
+            raise ValueError("max_retained must be at least k")
+        self.user_constraints = user_constraints
+        self.context_alerts = context_alerts
+        self.k = k
+        self.weights = weights or WEIGHTS
+        self.fx = fx
+        self.block = block
+        self.max_retained = max_retained
+        self.exact = True
+        self.seen = 0
+        self.eligible = 0
+        self.bounds: Optional[Bounds] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._band = _SkybandFilter(4, k)
+        self._records: List[Dict[str, Any]] = []
+        self._values: List[np.ndarray] = []   # per kept block: rec, time, cost, penalized
+        self._heap: List[Tuple[float, int, int]] = []   # (score, -index, position in band)
+        self._stale = False
+
+    def __len__(self) -> int:
+        """Rows retained so far."""
+        return len(self._records)
+
+    def push(self, itinerary: Dict[str, Any]) -> None:
+        self._buffer.append(itinerary)
+        if len(self._buffer) >= self.block:
+            self.flush()
+
+    def extend(self, itineraries: Iterable[Dict[str, Any]]) -> "StreamingDecision":
+        for it in itineraries:
+            self.push(it)
+        self.flush()
+        return self
+
+    def flush(self) -> None:
+        """Process the buffered itineraries."""
+        if not self._buffer:
+            return
+        cols = ItineraryColumns.from_itineraries(self._buffer, self.user_constraints, self.fx)
+        ids = np.arange(self.seen, self.seen + len(cols))
+        self.seen += len(cols)
+        self._buffer = []
+
+        block_bounds = _bounds(cols)
+        old = self.bounds
+        self.bounds = block_bounds if old is None else (
+            min(old[0], block_bounds[0]), max(old[1], block_bounds[1]), min(old[2], block_bounds[2]),
+            max(old[3], block_bounds[3]), min(old[4], block_bounds[4]), max(old[5], block_bounds[5]))
+        if self.bounds != old:
+            self._stale = True
+
+        over_budget, over_time = _violations(cols, self.user_constraints, self.fx)
+        rows = np.flatnonzero(~over_budget & ~over_time)
+        self.eligible += len(rows)
+        if not len(rows):
+            return
+        penalized = cols.alert_mask(self.context_alerts) if self.context_alerts else np.zeros(len(cols), dtype=bool)
+        criteria = np.column_stack([-cols.rec_score[rows], cols.total_time[rows], cols.total_cost[rows],
+                                    penalized[rows]])
+        kept = rows[self._band.add(criteria, ids[rows])]
+        if not len(kept):
+            return
+        first = len(self._records)
+        self._records.extend(cols.records[i] for i in kept)
+        self._values.append(np.column_stack([cols.rec_score[kept], cols.total_time[kept],
+                                             cols.total_cost[kept], penalized[kept]]))
+        if self.max_retained is not None and len(self._records) > self.max_retained:
+            self._shrink()
+        elif not self._stale:
+            scores = self._scores(self._values[-1])
+            for j, score in enumerate(scores.tolist()):
+                self._offer(score, int(ids[kept[j]]), first + j)
+
+    def _shrink(self) -> None:
+        """Keep only the `max_retained` best retained rows under the current bounds."""
+        values = np.concatenate(self._values)
+        keep = np.sort(top_k_indices(self._scores(values), self.max_retained))
+        self._band.vals, self._band.ids = self._band.vals[keep], self._band.ids[keep]
+        self._records = [self._records[j] for j in keep.tolist()]
+        self._values = [values[keep]]
+        self._stale = True  # heap positions refer to the rows before the cut
+        if self.exact:
+            warnings.warn(f"StreamingDecision retained more than max_retained={self.max_retained} rows; "
+                          f"the top {self.k} may no longer be exact", RuntimeWarning)
+        self.exact = False
+
+    def _scores(self, values: np.ndarray) -> np.ndarray:
+        s_lo, s_hi, t_lo, t_hi, c_lo, c_hi = self.bounds
+        norms = (normalize(values[:, 0], s_lo, s_hi), normalize_inverse(values[:, 1], t_lo, t_hi),
+                 normalize_inverse(values[:, 2], c_lo, c_hi))
+        return _final_scores(norms, values[:, 3].astype(bool), self.weights)
+
+    def _offer(self, score: float, index: int, pos: int) -> None:
+        entry = (score, -index, pos)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def _refresh(self) -> None:
+        """Re-score the retained rows under the current bounds and rebuild the heap."""
+        values = np.concatenate(self._values) if len(self._values) > 1 else self._values[0]
+        self._values = [values]
+        scores = self._scores(values)
+        top = top_k_indices(scores, self.k)
+        self._heap = [(float(scores[j]), -int(self._band.ids[j]), int(j)) for j in top]
+        heapq.heapify(self._heap)
+        self._stale = False
+
+    def top_k(self, k: Optional[int] = None) -> List[RankedItinerary]:
+        """Best `k` (default: all `self.k`) itineraries seen so far, best first."""
+        self.flush()
+        k = self.k if k is None else k
+        if k > self.k:
+            raise ValueError(f"Only the top {self.k} are tracked")
+        if not self._records:
+            return []
+        if self._stale:
+            self._refresh()
+        ranked = sorted(self._heap, reverse=True)[:k]
+        return [RankedItinerary(-neg_index, self._records[pos]["id"], score, self._records[pos])
+                for score, neg_index, pos in ranked]
+
+    def best(self) -> Optional[RankedItinerary]:
+        top = self.top_k(1)
+        return top[0] if top else None
+
+
+def select_streaming(itineraries: Iterable[Dict[str, Any]], user_constraints: Dict[str, Any],
+                     context_alerts: Dict[str, Any], k: int = 1, fx: Optional[FxTable] = None,
+                     block: int = _SKYBAND_BLOCK,
+                     max_retained: Optional[int] = DEFAULT_MAX_RETAINED) -> List[RankedItinerary]:
+    """Top `k` of a stream of itineraries (e.g. a generator), scored while it is produced.
+
+    Warns (RuntimeWarning) if `max_retained` had to cut rows, in which case
+    the result may differ from `decide` on the whole batch.
+    """
+    return StreamingDecision(user_constraints, context_alerts, k, fx=fx, block=block,
+                             max_retained=max_retained).extend(itineraries).top_k()
+
+
+# --------------------------------------------------------------------------------------
+# Parallel decision
+# --------------------------------------------------------------------------------------
+# Rows of the shared matrix: one column per itinerary
+_SHARED_ROWS = ("rec_score", "total_time", "total_cost", "penalized", "eligible")
+
+
+def _shard_bounds(data: np.ndarray) -> Bounds:
+    rec, total_time, total_cost = data[0], data[1], data[2]
+    return rec.min(), rec.max(), total_time.min(), total_time.max(), total_cost.min(), total_cost.max()
+
+
+def _shard_top_k(data: np.ndarray, lo: int, bounds: Bounds, k: int,
+                 weights: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """(global ids, scores) of the shard's top `k` eligible rows under the global `bounds`."""
+    rec, total_time, total_cost, penalized, eligible = data
+    rows = np.flatnonzero(eligible)
+    s_lo, s_hi, t_lo, t_hi, c_lo, c_hi = bounds
+    norms = (normalize(rec[rows], s_lo, s_hi), normalize_inverse(total_time[rows], t_lo, t_hi),
+             normalize_inverse(total_cost[rows], c_lo, c_hi))
+    scores = _final_scores(norms, penalized[rows].astype(bool), weights)
+    top = top_k_indices(scores, k)
+    return rows[top] + lo, scores[top]
+
+
+def _run_on_shared(shm_name: str, n: int, lo: int, hi: int, task: str, *args: Any) -> Any:
+    """Run `_shard_bounds`/`_shard_top_k` on columns lo:hi of the shared matrix `shm_name`."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray((len(_SHARED_ROWS), n), dtype=np.float64, buffer=shm.buf)
+        shard = data[:, lo:hi]
+        result = _shard_bounds(shard) if task == "bounds" else _shard_top_k(shard, lo, *args)
+        del data, shard  # release the views before closing the mapping
+        return result
+    finally:
+        shm.close()
+
+
+def decide_parallel(cols: ItineraryColumns, user_constraints: Dict[str, Any], context_alerts: Dict[str, Any],
+                    k: int = 1, weights: Optional[Dict[str, float]] = None, fx: Optional[FxTable] = None,
+                    workers: Optional[int] = None, shards: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> List[RankedItinerary]:
+    """Top `k` of `cols` with the scoring split over worker processes; same result as `decide`.
+
+    The parent puts the columns (plus the eligibility and alert masks) into
+    one `multiprocessing.shared_memory` block, so workers attach to it by name
+    instead of receiving pickled arrays. Two rounds over the shards:
+
+    1. every worker returns its shard's min/max bounds; the parent reduces
+       them to the global bounds (min of mins, max of maxes);
+    2. every worker scores its shard under the global bounds and returns its
+       local top `k`; the parent picks the top `k` of those, ties broken by
+       input order.
+
+    Scores are computed element by element exactly as in `decide`, so the
+    result is the single-process one, not an approximation. `workers`
+    defaults to all CPU cores (`workers=1` runs in this process), `shards` to
+    one per worker; pass a long-lived `executor` to avoid starting a pool per
+    call.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    n = len(cols)
+    if n == 0:
+        return []
+    w = weights or WEIGHTS
+    over_budget, over_time = _violations(cols, user_constraints, fx)
+    penalized = cols.alert_mask(context_alerts) if context_alerts else np.zeros(n, dtype=bool)
+    columns = (cols.rec_score, cols.total_time, cols.total_cost, penalized, ~over_budget & ~over_time)
+    workers = workers or os.cpu_count() or 1
+    shards = max(1, min(n, shards or workers))
+    edges = np.linspace(0, n, shards + 1).astype(int).tolist()
+    spans = list(zip(edges, edges[1:]))
+
+    if workers == 1 and executor is None:
+        data = np.vstack(columns).astype(np.float64)
+        bounds = _merge_bounds([_shard_bounds(data[:, lo:hi]) for lo, hi in spans])
+        parts = [_shard_top_k(data[:, lo:hi], lo, bounds, k, w) for lo, hi in spans]
+    else:
+        shm = SharedMemory(create=True, size=len(_SHARED_ROWS) * n * 8)
+        try:
+            data = np.ndarray((len(_SHARED_ROWS), n), dtype=np.float64, buffer=shm.buf)
+            for row, values in zip(data, columns):
+                row[:] = values
+            del data
+            pool = executor or ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = [pool.submit(_run_on_shared, shm.name, n, lo, hi, "bounds") for lo, hi in spans]
+                bounds = _merge_bounds([f.result() for f in futures])
+                futures = [pool.submit(_run_on_shared, shm.name, n, lo, hi, "top_k", bounds, k, w)
+                           for lo, hi in spans]
+                parts = [f.result() for f in futures]
+            finally:
+                if executor is None:
+                    pool.shutdown()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    # Shards are in input order, so ties keep resolving to the earlier row
+    ids = np.concatenate([i for i, _ in parts])
+    scores = np.concatenate([sc for _, sc in parts])
+    records = cols.records
+    return [RankedItinerary(int(ids[j]), cols.ids[ids[j]], float(scores[j]),
+                            records[ids[j]] if records is not None else None)
+            for j in top_k_indices(scores, k)]
+
+
+def _merge_bounds(parts: List[Bounds]) -> Bounds:
+    b = np.array(parts)
+    return b[:, 0].min(), b[:, 1].max(), b[:, 2].min(), b[:, 3].max(), b[:, 4].min(), b[:, 5].max()
+
+
+# --------------------------------------------------------------------------------------
+# Parity and timing against the reference loop
+# --------------------------------------------------------------------------------------
+def _random_itineraries(n: int, rng: random.Random, n_locations: int = 200) -> List[Dict[str, Any]]:
+    return [{"id": f"it_{i}",
+             "locations": rng.sample(range(n_locations), rng.randint(0, 5)),
+             "avg_rec_score": rng.choice((rng.randint(50, 100), round(rng.uniform(0, 1), 3))),
+             "total_time": rng.choice((rng.randint(1, 10), rng.uniform(0.5, 12))),
+             "total_cost": rng.choice((rng.randint(10, 500), rng.uniform(10, 500)))}
+            for i in range(n)]
+
+
+def _correlated_itineraries(n: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Better recommendations cost more time and money: nearly every row is on the skyband."""
+    out = []
+    for i in range(n):
+        q = rng.random()
+        out.append({"id": f"it_{i}", "locations": [], "avg_rec_score": 50 + 50 * q,
+                    "total_time": 1 + 8 * q + rng.uniform(0, 0.01), "total_cost": 20 + 400 * q})
+    return out
+
+
+def check_parity(trials: int = 500, seed: int = 0) -> int:
+    """Compare `select_best` with `select_final_itinerary` on random batches; mismatches."""
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(trials):
+        its = _random_itineraries(rng.randint(1, 40), rng, n_locations=rng.choice((5, 50)))
+        constraints = {"max_budget": rng.randint(50, 600), "max_time": rng.randint(1, 12)}
+        alerts = {loc: "RAIN" for loc in rng.sample(range(50), rng.randint(0, 5))}
+        with contextlib.redirect_stdout(io.StringIO()):
+            ref = select_final_itinerary([dict(it) for it in its], constraints, alerts)
+        got = select_best([dict(it) for it in its], constraints, alerts)
+        same = (ref is None and got is None) or (
+            ref is not None and got is not None and ref["id"] == got["id"]
+            and ref["final_decision_score"] == got["final_decision_score"])
+        mismatches += not same
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vectorized decision scoring: parity and timing")
+    parser.add_argument("--candidates", type=int, default=50_000)
+    parser.add_argument("--trials", type=int, default=500, help="Random batches for the parity check")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for the parallel check (default: all cores)")
+    args = parser.parse_args()
+
+    mismatches = check_parity(args.trials)
+    print(f"Parity: {args.trials - mismatches}/{args.trials} random batches identical")
+
+    rng = random.Random(1)
+    its = _random_itineraries(args.candidates, rng)
+    constraints = {"max_budget": 300, "max_time": 8}
+    alerts = {loc: "RAIN" for loc in range(0, 200, 7)}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ref = select_final_itinerary(its, constraints, alerts)
+    loop_s = time.perf_counter() - start
+    start = time.perf_counter()
+    cols = ItineraryColumns.from_itineraries(its, constraints)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    decision = decide(cols, constraints, alerts)
+    decide_s = time.perf_counter() - start
+    assert cols.ids[decision.index] == ref["id"] and decision.score == ref["final_decision_score"]
+    print(f"{args.candidates:,} candidates: loop {loop_s * 1000:.1f} ms; "
+          f"columns {build_s * 1000:.1f} ms + decide {decide_s * 1000:.1f} ms "
+          f"({loop_s / decide_s:.0f}x on prebuilt columns)")
+
+    start = time.perf_counter()
+    front = cols.pareto_front(constraints, alerts, depth=10)
+    front_s = time.perf_counter() - start
+    start = time.perf_counter()
+    top = front.top_k(10, {"recommendation": 0.2, "time": 0.4, "cost": 0.4})
+    rerank_s = time.perf_counter() - start
+    assert front.top_k(1)[0].index == decision.index
+    print(f"Pareto front (top-10 depth): {len(front):,} of {front.eligible_count:,} eligible itineraries, "
+          f"built in {front_s * 1000:.1f} ms; re-weighted top {len(top)} in {rerank_s * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    stream = StreamingDecision(constraints, alerts, k=10).extend(iter(its))
+    stream_s = time.perf_counter() - start
+    best = stream.best()
+    assert stream.exact and best.index == decision.index and best.score == decision.score
+    print(f"Streaming: {stream.seen:,} candidates in {stream_s * 1000:.1f} ms, "
+          f"{len(stream):,} retained for the top 10")
+    worst = _correlated_itineraries(20_000, rng)
+    uncapped = StreamingDecision({}, {}, k=5, max_retained=None).extend(iter(worst))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        capped = StreamingDecision({}, {}, k=5).extend(iter(worst))
+    assert not capped.exact and any(issubclass(w.category, RuntimeWarning) for w in caught)
+    print(f"Streaming, correlated criteria: {len(uncapped):,} of {uncapped.seen:,} retained without a cap; "
+          f"{len(capped):,} with max_retained={DEFAULT_MAX_RETAINED:,} (exact={capped.exact})")
+
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        decide_parallel(cols, constraints, alerts, executor=executor)  # start the workers
+        start = time.perf_counter()
+        top = decide_parallel(cols, constraints, alerts, k=10, executor=executor, shards=workers)
+        parallel_s = time.perf_counter() - start
+    assert top[0].index == decision.index and top[0].score == decision.score
+    print(f"Parallel ({workers} workers, shared memory): top 10 in {parallel_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Currency conversion backed by a local rate file (Task 5 / Task 6).
+
+`FxTable` reads exchange rates quoted against one base currency from a JSON
+file such as `fx_rates.json`:
+
+    {"base": "USD", "as_of": "2026-10-01", "rates": {"USD": 1, "EUR": 0.92, "VND": 25400}}
+
+where each rate is the number of units of that currency per 1 unit of the base.
+The rates live in memory as an immutable `FxRates` snapshot; once `ttl`
+seconds have passed the file is checked again and re-read only if it changed,
+so a conversion is a dict lookup and one division.
+
+`to_base_many` converts a whole array of amounts (one currency each) in a
+single vectorized call. The decision step uses it to put every itinerary cost
+into one currency before scoring, instead of converting inside the
+comparison loop.
+
+Usage:
+    fx = FxTable("fx_rates.json", ttl=3600)
+    fx.convert(500000, "VND", "USD")
+    fx.to_base_many([200, 100, 300], ["USD", "EUR", "VND"])
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_RATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fx_rates.json")
+DEFAULT_TTL_S = 3600.0
+
+# Symbols and local spellings accepted in place of ISO codes
+_CODE_ALIASES = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₫": "VND", "Đ": "VND", "VNĐ": "VND"}
+
+
+def currency_code(currency: str) -> str:
+    """'usd' -> 'USD', '€' -> 'EUR', 'VNĐ' -> 'VND'."""
+    code = str(currency).strip().upper()
+    return _CODE_ALIASES.get(code, code)
+
+
+@dataclass(frozen=True)
+class FxRates:
+    """One loaded rate file; `per_base[index[code]]` units of `code` buy 1 `base`."""
+    base: str
+    as_of: Optional[str]
+    index: Dict[str, int]
+    per_base: np.ndarray
+    source: Optional[str] = None
+
+    def rate(self, currency: str) -> float:
+        code = currency_code(currency)
+        i = self.index.get(code)
+        if i is None:
+            raise ValueError(f"No FX rate for currency '{currency}' (known: {', '.join(self.index)})")
+        return float(self.per_base[i])
+
+
+def build_rates(data: Dict[str, Any], source: Optional[str] = None) -> FxRates:
+    """Check a decoded rate file and turn it into an `FxRates`; raises ValueError if malformed."""
+    if not isinstance(data, dict) or not isinstance(data.get("rates"), dict) or not data["rates"]:
+        raise ValueError("FX rate file must be an object with a non-empty 'rates' object")
+    base = currency_code(data.get("base", "USD"))
+    codes, values = [], []
+    for currency, value in data["rates"].items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not value > 0:
+            raise ValueError(f"FX rate for '{currency}' must be a positive number, got {value!r}")
+        codes.append(currency_code(currency))
+        values.append(float(value))
+    index = {code: i for i, code in enumerate(codes)}
+    if base not in index:
+        raise ValueError(f"FX rate file has no rate for its base currency '{base}'")
+    if values[index[base]] != 1.0:
+        raise ValueError(f"FX rate of the base currency '{base}' must be 1")
+    per_base = np.array(values, dtype=np.float64)
+    per_base.flags.writeable = False
+    return FxRates(base, data.get("as_of"), index, per_base, source)
+
+
+class FxTable:
+    """In-memory, time-expiring view of a rate file.
+
+    `rates` returns the current `FxRates`; after `ttl` seconds the file's size
+    and modification time are checked and the file is re-read only if they
+    changed. A file that disappears or fails to parse on refresh is reported
+    on stderr and the previous rates stay in use until it is fixed.
+    """
+
+    def __init__(self, path: str = DEFAULT_RATES_PATH, ttl: float = DEFAULT_TTL_S,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._expires = 0.0
+        self._rates = self._load()
+
+    @classmethod
+    def from_rates(cls, rates: Dict[str, float], base: str = "USD", as_of: Optional[str] = None) -> "FxTable":
+        """A table over fixed in-memory rates (never expires)."""
+        table = cls.__new__(cls)
+        table.path, table.ttl, table._clock = None, float("inf"), time.monotonic
+        table._lock, table._stamp, table._expires = threading.Lock(), None, float("inf")
+        table._rates = build_rates({"base": base, "as_of": as_of, "rates": rates})
+        return table
+
+    def _load(self) -> FxRates:
+        st = os.stat(self.path)
+        with open(self.path, "r", encoding="utf-8-sig") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"FX rate file {self.path} is not valid JSON: {exc}") from exc
+        rates = build_rates(data, source=os.path.abspath(self.path))
+        self._stamp = (st.st_size, st.st_mtime_ns)
+        self._expires = self._clock() + self.ttl
+        return rates
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-read the rate file if it changed (or `force`); True if new rates were loaded."""
+        if self.path is None:
+            return False
+        with self._lock:
+            self._expires = self._clock() + self.ttl
+            try:
+                st = os.stat(self.path)
+                if not force and (st.st_size, st.st_mtime_ns) == self._stamp:
+                    return False
+                self._rates = self._load()
+            except (OSError, ValueError) as exc:
+                print(f"FX rates refresh failed, keeping rates as of {self._rates.as_of}: {exc}", file=sys.stderr)
+                return False
+        return True
+
+    @property
+    def rates(self) -> FxRates:
+        if self._clock() >= self._expires:
+            self.refresh()
+        return self._rates
+
+    @property
+    def base(self) -> str:
+        return self.rates.base
+
+    def to_base(self, amount: float, currency: str) -> float:
+        return amount / self.rates.rate(currency)
+
+    def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """Convert one amount; amounts already in `to_currency` are returned unchanged."""
+        if currency_code(from_currency) == currency_code(to_currency):
+            return amount
+        rates = self.rates
+        return amount / rates.rate(from_currency) * rates.rate(to_currency)
+
+    @staticmethod
+    def _codes(currencies: Union[str, Sequence[str]], n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct currency codes and, for each of the `n` amounts, its position among them."""
+        if isinstance(currencies, str):
+            return np.array([currency_code(currencies)], dtype=object), np.zeros(n, dtype=np.intp)
+        codes = [currency_code(c) for c in currencies]
+        if len(codes) != n:
+            raise ValueError(f"Got {n} amounts but {len(codes)} currencies")
+        distinct, inverse = np.unique(np.array(codes, dtype=object), return_inverse=True)
+        return distinct, inverse.reshape(-1)
+
+    def to_base_many(self, amounts: Iterable[float], currencies: Union[str, Sequence[str]]) -> np.ndarray:
+        """Convert an array of amounts (one currency each, or one for all) to the base currency."""
+        values = np.asarray(amounts, dtype=np.float64)
+        rates = self.rates
+        distinct, inverse = self._codes(currencies, len(values))
+        per_base = np.array([rates.rate(c) for c in distinct], dtype=np.float64)
+        return values / per_base[inverse]
+
+    def convert_many(self, amounts: Iterable[float], currencies: Union[str, Sequence[str]],
+                     to_currency: str) -> np.ndarray:
+        """Convert an array of amounts to `to_currency` with one rate snapshot for the whole array.
+
+        Like `convert`, amounts already in `to_currency` come back unchanged.
+        """
+        values = np.asarray(amounts, dtype=np.float64)
+        rates = self.rates
+        target = currency_code(to_currency)
+        distinct, inverse = self._codes(currencies, len(values))
+        per_base = np.array([rates.rate(c) for c in distinct], dtype=np.float64)
+        out = values / per_base[inverse] * rates.rate(target)
+        same = (distinct == target)[inverse]
+        out[same] = values[same]
+        return out
+
+
+_DEFAULT_TABLE: Optional[FxTable] = None
+
+
+def default_fx() -> FxTable:
+    """The shared `FxTable` over `fx_rates.json`, loaded on first use."""
+    global _DEFAULT_TABLE
+    if _DEFAULT_TABLE is None:
+        _DEFAULT_TABLE = FxTable()
+    return _DEFAULT_TABLE
+
+
+# --------------------------------------------------------------------------------------
+# Self-test (python fx_rates.py --test)
+# --------------------------------------------------------------------------------------
+def run_tests() -> int:
+    """Check conversions, aliases, array conversion and TTL refresh of a rate file.
+    Returns process exit code (0 = all pass)."""
+    import contextlib
+    import io
+    import tempfile
+
+    failures = []
+    checks = 0
+
+    def check(label: str, ok: bool) -> None:
+        nonlocal checks
+        checks += 1
+        if not ok:
+            failures.append(f"{label} FAIL")
+
+    fx = FxTable.from_rates({"USD": 1, "EUR": 0.8, "VND": 25000})
+    check("aliases", [currency_code(c) for c in ("usd", "€", "₫", "VNĐ", " gbp ")] == ["USD", "EUR", "VND", "VND", "GBP"])
+    check("to_base", math.isclose(fx.to_base(50000, "VND"), 2.0) and fx.to_base(8, "EUR") == 10)
+    check("convert", math.isclose(fx.convert(10, "EUR", "VND"), 312500) and fx.convert(7, "₫", "VND") == 7)
+    amounts, currencies = [100, 8, 50000, 3], ["USD", "EUR", "VND", "€"]
+    many = fx.to_base_many(amounts, currencies)
+    check("to_base_many", np.allclose(many, [fx.to_base(a, c) for a, c in zip(amounts, currencies)]))
+    converted = fx.convert_many(amounts, currencies, "EUR")
+    check("convert_many", np.allclose(converted, [fx.convert(a, c, "EUR") for a, c in zip(amounts, currencies)])
+          and converted[1] == 8 and converted[3] == 3)
+    check("one currency for all", np.allclose(fx.to_base_many([25000, 50000], "VND"), [1, 2]))
+    for label, bad in (("unknown currency", lambda: fx.to_base(1, "XYZ")),
+                       ("length mismatch", lambda: fx.to_base_many([1, 2], ["USD"])),
+                       ("non-positive rate", lambda: build_rates({"base": "USD", "rates": {"USD": 1, "EUR": 0}})),
+                       ("base rate not 1", lambda: build_rates({"base": "USD", "rates": {"USD": 2}})),
+                       ("missing base", lambda: build_rates({"base": "USD", "rates": {"EUR": 1}}))):
+        try:
+            bad()
+            check(label, False)
+        except ValueError:
+            check(label, True)
+
+    # The file is re-read once the TTL has passed and it changed; a broken file keeps the old rates
+    now = [0.0]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rates.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"base": "USD", "as_of": "1", "rates": {"USD": 1, "EUR": 0.5}}, f)
+        table = FxTable(path, ttl=10, clock=lambda: now[0])
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"base": "USD", "as_of": "2", "rates": {"USD": 1, "EUR": 0.25, "JPY": 100}}, f)
+        os.utime(path, ns=(1, 1))
+        check("cached until ttl", table.to_base(1, "EUR") == 2)
+        now[0] = 10
+        check("reloaded after ttl", table.to_base(1, "EUR") == 4 and table.rates.as_of == "2")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        now[0] = 20
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            check("broken file keeps rates", table.to_base(1, "EUR") == 4 and "refresh failed" in err.getvalue())
+
+    print(f"Test Results: {checks - len(failures)}/{checks} tests passed.")
+    if failures:
+        print("Detailed Failures:")
+        for line in failures:
+            print(" - " + line)
+    else:
+        print("All test cases passed.")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_tests() if "--test" in sys.argv[1:] else 0)
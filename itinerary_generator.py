@@ -0,0 +1,298 @@
+"""
+Lazy itinerary candidate generator for Task 5 (Decision Process).
+
+`generate_itineraries` turns a ranked list of places (Task 3 output) into the
+candidate itineraries that `EXAMPLE_CODE.select_final_itinerary` scores. It
+walks the combinations of ranked places depth-first, best-ranked first, and
+yields each candidate as soon as it is complete, so memory stays at one branch
+of the search no matter how many places are ranked.
+
+Budget and time are checked while the search descends: a place that would
+push the partial itinerary over `max_budget`/`max_time` is never added, and a
+branch is cut as soon as the cheapest (resp. shortest) places still available
+could not complete the minimum number of stops within the limits. Both bounds
+are lower bounds (travel only adds time and cost), so no candidate that fits
+the constraints is skipped.
+
+Each candidate is a dict in the shape the decision step expects:
+
+    {"id": "Bảo tàng + Hồ Gươm", "locations": ["Bảo tàng", "Hồ Gươm"],
+     "avg_rec_score": 0.81, "total_time": 3.0, "total_cost": 35, "places": [...]}
+
+plus `"currency"` (the FX base currency) when costs had to be converted.
+
+Usage:
+    for itinerary in generate_itineraries(ranker.rank(user, k=50), {"max_budget": 80, "max_time": 8}):
+        ...
+
+    python itinerary_generator.py [--synthetic N] [--max-stops K]
+    python itinerary_generator.py --test   # brute-force and currency self-tests
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import math
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from fx_rates import FxTable, default_fx
+
+# Hours spent at a place that does not say how long a visit takes
+DEFAULT_VISIT_HOURS = 1.5
+
+# Same defaults as select_final_itinerary when a constraint is missing
+DEFAULT_MAX_BUDGET = 99999
+DEFAULT_MAX_TIME = 99
+
+
+@dataclass
+class GeneratorStats:
+    """Counters filled in while a generator runs (read them after iterating)."""
+    expanded: int = 0
+    pruned: int = 0
+    yielded: int = 0
+
+
+def _place_fields(item: Any) -> Tuple[Dict[str, Any], float]:
+    """(place record, recommendation score) from a RankedPlace or a place dict."""
+    if hasattr(item, "place") and hasattr(item, "score"):
+        return item.place, float(item.score)
+    score = item.get("recommend_score", item.get("score", item.get("rating", 0)))
+    return item, float(score)
+
+
+def budget_limit(user_constraints: Dict[str, Any]) -> Tuple[float, Optional[str]]:
+    """(amount, currency) of `max_budget`, a number or {"amount", "currency"}; currency may be None."""
+    budget = user_constraints.get("max_budget", DEFAULT_MAX_BUDGET)
+    currency = user_constraints.get("currency")
+    if isinstance(budget, dict):
+        currency = budget.get("currency", currency)
+        budget = budget.get("amount", DEFAULT_MAX_BUDGET)
+    return budget, currency
+
+
+def _suffix_min(values: np.ndarray) -> np.ndarray:
+    """out[j] = min(values[j:]), with out[len(values)] = inf."""
+    out = np.full(len(values) + 1, np.inf)
+    if len(values):
+        out[:-1] = np.minimum.accumulate(values[::-1])[::-1]
+    return out
+
+
+def generate_itineraries(ranked_places: Iterable[Any], user_constraints: Dict[str, Any],
+                         min_stops: int = 2, max_stops: int = 4, pool: Optional[int] = None,
+                         fx: Optional[FxTable] = None,
+                         stats: Optional[GeneratorStats] = None) -> Iterator[Dict[str, Any]]:
+    """Yield every itinerary of `min_stops`..`max_stops` places that fits the constraints.
+
+    Args:
+        ranked_places: Best first; `RankedPlace`s or dicts with a `recommend_score`
+            (or `score`), a cost (`estimated_cost` or `price`) and optionally
+            `visit_hours` and `currency`
+        user_constraints: `max_budget` (number or {"amount", "currency"}), `max_time` (hours)
+        pool: Only combine the first `pool` ranked places (default: all of them)
+        fx: Rate table used when places or the budget name a currency
+        stats: Optional counters for expanded/pruned branches
+
+    Places keep their ranked order inside an itinerary; visiting order is left
+    to the routing step. Candidates come out best-ranked combinations first.
+    When any cost or the budget names a currency, costs are converted to
+    `fx.base` and every candidate carries `"currency": fx.base`.
+    """
+    items = list(ranked_places)[:pool] if pool is not None else list(ranked_places)
+    records, scores = zip(*(_place_fields(it) for it in items)) if items else ((), ())
+    stats = stats if stats is not None else GeneratorStats()
+
+    budget, budget_currency = budget_limit(user_constraints)
+    max_time = user_constraints.get("max_time", DEFAULT_MAX_TIME)
+    cost = np.array([p.get("estimated_cost", p.get("price", 0)) for p in records], dtype=np.float64)
+    hours = np.array([p.get("visit_hours", DEFAULT_VISIT_HOURS) for p in records], dtype=np.float64)
+    currencies = [p.get("currency") for p in records]
+    cost_currency = None  # set when costs were converted: candidates then say which currency they are in
+    if budget_currency is not None or any(currencies):
+        # One vectorized conversion up front, none inside the search
+        fx = fx or default_fx()
+        cost_currency = fx.base
+        cost = fx.to_base_many(cost, [c or budget_currency or fx.base for c in currencies])
+        if "max_budget" in user_constraints:
+            budget = fx.to_base(budget, budget_currency or fx.base)
+
+    n = len(records)
+    cost_list, hours_list = cost.tolist(), hours.tolist()
+    min_cost_from, min_hours_from = _suffix_min(cost).tolist(), _suffix_min(hours).tolist()
+    names = [p.get("id", p.get("name")) for p in records]
+
+    def candidate(chosen: List[int], c: float, t: float) -> Dict[str, Any]:
+        locations = [names[i] for i in chosen]
+        out = {
+            "id": " + ".join(str(name) for name in locations),
+            "locations": locations,
+            "avg_rec_score": math.fsum(scores[i] for i in chosen) / len(chosen),
+            "total_time": t,
+            "total_cost": c,
+            "places": [records[i] for i in chosen],
+        }
+        if cost_currency is not None:
+            out["currency"] = cost_currency
+        return out
+
+    def expand(start: int, chosen: List[int], c: float, t: float) -> Iterator[Dict[str, Any]]:
+        k = len(chosen)
+        if k and k >= min_stops:
+            stats.yielded += 1
+            yield candidate(chosen, c, t)
+        if k == max_stops:
+            return
+        need = max(0, min_stops - k - 1)  # stops still missing after this one
+        for j in range(start, n - need):
+            cj, tj = c + cost_list[j], t + hours_list[j]
+            if (cj > budget or tj > max_time or
+                    need and (cj + need * min_cost_from[j + 1] > budget or
+                              tj + need * min_hours_from[j + 1] > max_time)):
+                stats.pruned += 1
+                continue
+            stats.expanded += 1
+            chosen.append(j)
+            yield from expand(j + 1, chosen, cj, tj)
+            chosen.pop()
+
+    if max_stops >= max(1, min_stops):
+        yield from expand(0, [], 0.0, 0.0)
+
+
+# --------------------------------------------------------------------------------------
+# Demo / scaling check
+# --------------------------------------------------------------------------------------
+def _synthetic_places(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    places = [{"name": f"place_{i:03d}", "recommend_score": round(100 - i * 0.5 - rng.random(), 2),
+               "price": rng.randint(5, 60), "visit_hours": rng.choice((0.5, 1.0, 1.5, 2.0, 3.0))}
+              for i in range(n)]
+    return places
+
+
+# --------------------------------------------------------------------------------------
+# Self-test (python itinerary_generator.py --test)
+# --------------------------------------------------------------------------------------
+def _brute_force(places: List[Dict[str, Any]], constraints: Dict[str, Any],
+                 min_stops: int, max_stops: int) -> List[Tuple[str, float, float]]:
+    """(id, total_cost, total_time) of every fitting combination, without any pruning."""
+    out = []
+    for k in range(max(1, min_stops), max_stops + 1):
+        for combo in itertools.combinations(places, k):
+            cost = math.fsum(p["price"] for p in combo)
+            hours = math.fsum(p["visit_hours"] for p in combo)
+            if cost <= constraints["max_budget"] and hours <= constraints["max_time"]:
+                out.append((" + ".join(p["name"] for p in combo), cost, hours))
+    return sorted(out)
+
+
+def run_tests() -> int:
+    """Check pruning against brute force and a VND budget through select_final_itinerary.
+    Returns process exit code (0 = all pass)."""
+    from EXAMPLE_CODE import costs_in_base_currency, select_final_itinerary
+
+    total = 0
+    failures: List[str] = []
+
+    # Pruning never drops a fitting combination (and never yields one that does not fit)
+    for seed in range(20):
+        rng = random.Random(seed)
+        places = _synthetic_places(rng.randint(0, 12), seed)
+        constraints = {"max_budget": rng.choice((40, 80, 150)), "max_time": rng.choice((2.5, 4, 8))}
+        min_stops, max_stops = rng.choice(((1, 3), (2, 4), (3, 3), (2, 5)))
+        total += 1
+        got = sorted((it["id"], it["total_cost"], it["total_time"])
+                     for it in generate_itineraries(places, constraints, min_stops, max_stops))
+        expected = _brute_force(places, constraints, min_stops, max_stops)
+        if [(i, round(c, 9), round(t, 9)) for i, c, t in got] != \
+                [(i, round(c, 9), round(t, 9)) for i, c, t in expected]:
+            failures.append(f"PRUNE seed={seed} FAIL – {len(got)} candidates, brute force {len(expected)}")
+
+    # A VND budget: candidates come out in the FX base currency and are not converted twice
+    fx = FxTable.from_rates({"USD": 1, "VND": 25000})
+    places = [{"name": "Chợ Bến Thành", "recommend_score": 95, "price": 400000, "currency": "VND"},
+              {"name": "Bảo tàng", "recommend_score": 90, "price": 150000, "currency": "VND"},
+              {"name": "Nhà thờ Đức Bà", "recommend_score": 80, "price": 50000, "currency": "VND"},
+              {"name": "Phố đi bộ", "recommend_score": 70, "price": 4, "currency": "USD"}]
+    generous = {"max_budget": {"amount": 800000, "currency": "VND"}, "max_time": 8}
+    strict = {"max_budget": {"amount": 300000, "currency": "VND"}, "max_time": 8}
+    candidates = list(generate_itineraries(places, generous, fx=fx))
+    total += 1
+    costs, budget = costs_in_base_currency(candidates, strict, fx)
+    in_vnd = {it["id"]: sum(p["price"] * (25000 if p["currency"] == "USD" else 1) for p in it["places"])
+              for it in candidates}
+    if any(it.get("currency") != "USD" for it in candidates) or budget != 12 or \
+            any(not math.isclose(c, in_vnd[it["id"]] / 25000) for it, c in zip(candidates, costs)):
+        failures.append("VND costs FAIL – candidate costs or budget not in the FX base currency")
+    total += 1
+    with contextlib.redirect_stdout(io.StringIO()):
+        best = select_final_itinerary(candidates, strict, {}, fx=fx)
+    if best is None or in_vnd[best["id"]] > 300000:
+        failures.append(f"VND budget FAIL – selected {best and best['id']!r} "
+                        f"({best and in_vnd[best['id']]} VND) over a 300000 VND budget")
+
+    passed = total - len(failures)
+    print(f"Test Results: {passed}/{total} tests passed.")
+    if failures:
+        print("Detailed Failures:")
+        for line in failures:
+            print(" - " + line)
+    else:
+        print("All test cases passed.")
+    return 0 if not failures else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stream itinerary candidates from ranked places")
+    parser.add_argument("--test", action="store_true", help="Run the brute-force and currency self-tests")
+    parser.add_argument("--places", default=None, help="Ranked places JSON (default: sample_places.json by rating)")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="Use N synthetic ranked places")
+    parser.add_argument("--budget", type=float, default=80)
+    parser.add_argument("--max-time", type=float, default=8)
+    parser.add_argument("--min-stops", type=int, default=2)
+    parser.add_argument("--max-stops", type=int, default=4)
+    args = parser.parse_args()
+    if args.test:
+        raise SystemExit(run_tests())
+
+    if args.synthetic:
+        places = _synthetic_places(args.synthetic)
+    else:
+        from Rcm_Ranking import find_places_file
+        with open(args.places or find_places_file(), "r", encoding="utf-8") as f:
+            places = sorted(json.load(f), key=lambda p: -p["rating"])
+    constraints = {"max_budget": args.budget, "max_time": args.max_time}
+
+    stats = GeneratorStats()
+    tracemalloc.start()
+    start = time.perf_counter()
+    best = None
+    for it in generate_itineraries(places, constraints, args.min_stops, args.max_stops, stats=stats):
+        if best is None or it["avg_rec_score"] > best["avg_rec_score"]:
+            best = it
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(math.comb(len(places), k) for k in range(args.min_stops, args.max_stops + 1))
+    print(f"{len(places)} ranked places, {args.min_stops}-{args.max_stops} stops: "
+          f"{total:,} combinations without pruning")
+    print(f"Yielded {stats.yielded:,} candidates, expanded {stats.expanded:,} branches, "
+          f"pruned {stats.pruned:,} in {elapsed:.2f}s (peak traced memory {peak / 1024:.0f} KiB)")
+    if best is not None:
+        print(f"Highest avg_rec_score: {best['id']} ({best['avg_rec_score']:.2f}, "
+              f"{best['total_time']:g} h, cost {best['total_cost']:g})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Columnar place catalog for Task 3 (Recommendation & Ranking).
+
+A `PlaceTable` keeps the numeric fields of every place (lat, lon, rating, price,
+trend_score) as NumPy arrays and the tags both as an inverted `TagIndex` and as
+a packed bitset matrix, so the ranking engine can score the whole catalog in one
+vectorized call instead of looping over a list of dicts.
+
+`Place` is the compact per-row type: a `__slots__` object with interned tag
+strings that also answers `place.get("rating", 0)` / `place["name"]`, so code
+written for the JSON dicts (e.g. `ContextAlertSystem`) can read it directly.
+
+Usage:
+    table = PlaceTable.from_places(places, coord_dtype=np.float32)
+    table.preference_mask(["museum", "park"])   # -> bool array, one entry per place
+    table.place(0)                               # -> Place
+
+Run `python place_table.py [places.json] [--synthetic N]` to compare the memory
+used by dicts, `Place` objects and a `PlaceTable`.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from tag_index import TagIndex
+
+# Bits per word of the tag bitset matrix
+_WORD_BITS = 64
+
+_MISSING = object()
+
+
+class Place:
+    """One place with a fixed set of attributes and no per-instance __dict__.
+
+    Supports read-only mapping access (`get`, `[]`, `in`) with the same keys as
+    the JSON records; optional attributes that are None count as missing, so
+    `place.get("environment_type", "both")` behaves like it does on a dict.
+    """
+
+    __slots__ = (
+        "place_id", "name", "type", "price", "rating", "tags", "lat", "lon", "trend_score",
+        "total_reviews", "review_growth_rate", "environment_type", "estimated_cost", "suitable_time",
+    )
+
+    def __init__(self, name: str, type: str, price: float, rating: float, tags: Sequence[str],
+                 lat: float, lon: float, trend_score: float = 0.0, place_id: Optional[int] = None,
+                 total_reviews: Optional[int] = None, review_growth_rate: Optional[float] = None,
+                 environment_type: Optional[str] = None, estimated_cost: Optional[float] = None,
+                 suitable_time: Optional[str] = None) -> None:
+        self.place_id = place_id
+        self.name = name
+        self.type = type
+        self.price = price
+        self.rating = rating
+        self.tags = tuple(sys.intern(t) for t in tags)
+        self.lat = lat
+        self.lon = lon
+        self.trend_score = trend_score
+        self.total_reviews = total_reviews
+        self.review_growth_rate = review_growth_rate
+        self.environment_type = environment_type
+        self.estimated_cost = estimated_cost
+        self.suitable_time = suitable_time
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], place_id: Optional[int] = None) -> "Place":
+        kwargs = {k: d[k] for k in cls.__slots__ if k in d}
+        kwargs.setdefault("place_id", place_id)
+        kwargs.setdefault("price", 0)
+        kwargs.setdefault("tags", ())
+        return cls(**kwargs)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__ if getattr(self, k) is not None}
+
+    def __repr__(self) -> str:
+        return f"Place({self.name!r}, rating={self.rating}, tags={list(self.tags)})"
+
+
+class StringColumn:
+    """Read-only sequence of strings stored as one UTF-8 buffer plus offsets.
+
+    Both arrays can be memory-mapped; strings are only decoded when accessed.
+    """
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray) -> None:
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringColumn":
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return cls(offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+
+class PlaceTable:
+    """Struct-of-arrays view of a place catalog.
+
+    Row `i` of every column describes place `i`. When the table was built from
+    dicts, the original records are kept (never modified) so ranking results
+    can be returned as the same dicts the catalog was loaded from; tables
+    loaded from a columnar cache rebuild the record from the columns instead.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        rating: np.ndarray,
+        price: np.ndarray,
+        trend_score: np.ndarray,
+        tag_bits: np.ndarray,
+        tag_index: TagIndex,
+        records: Optional[Sequence[Dict[str, Any]]] = None,
+        names: Optional[Sequence[str]] = None,
+        types: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.lat = lat
+        self.lon = lon
+        self.rating = rating
+        self.price = price
+        self.trend_score = trend_score
+        self.tag_bits = tag_bits
+        self.tag_index = tag_index
+        self.records = records
+        self.names = names
+        self.types = types
+
+    @classmethod
+    def from_places(cls, places: Sequence[Dict[str, Any]], coord_dtype: Any = np.float64) -> "PlaceTable":
+        """Build the columns from `sample_places.json`-style dicts.
+
+        `coord_dtype=np.float32` halves the coordinate columns (about 1 m of
+        precision); scores are then no longer bit-identical to the dict formula.
+        """
+        n = len(places)
+        lat = np.fromiter((p["lat"] for p in places), dtype=coord_dtype, count=n)
+        lon = np.fromiter((p["lon"] for p in places), dtype=coord_dtype, count=n)
+        rating = np.fromiter((p["rating"] for p in places), dtype=np.float64, count=n)
+        price = np.fromiter((p.get("price", 0) for p in places), dtype=np.float64, count=n)
+        trend = np.fromiter((p.get("trend_score", 0) for p in places), dtype=np.float64, count=n)
+
+        tag_index = TagIndex.from_places(places)
+        tag_bits = tag_bitset(tag_index)
+        return cls(lat, lon, rating, price, trend, tag_bits, tag_index, records=places,
+                   names=[p.get("name", "") for p in places],
+                   types=[p.get("type", "") for p in places])
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def columns_only(self) -> "PlaceTable":
+        """Same columns without the source records (cheap to send to worker processes)."""
+        return PlaceTable(self.lat, self.lon, self.rating, self.price, self.trend_score,
+                          self.tag_bits, self.tag_index)
+
+    def place(self, i: int) -> Place:
+        """Row `i` as a `Place` (tag strings come from the shared vocabulary)."""
+        index = self.tag_index
+        return Place(
+            name=self.names[i] if self.names is not None else "",
+            type=self.types[i] if self.types is not None else "",
+            price=float(self.price[i]),
+            rating=float(self.rating[i]),
+            tags=[index.vocab.tag(t) for t in index.place_tag_ids(i).tolist()],
+            lat=float(self.lat[i]),
+            lon=float(self.lon[i]),
+            trend_score=float(self.trend_score[i]),
+            place_id=i,
+        )
+
+    def record(self, i: int) -> Union[Dict[str, Any], Place]:
+        """The source dict of place `i` if kept, else the row as a `Place`."""
+        if self.records is not None:
+            return self.records[i]
+        return self.place(i)
+
+    def nbytes(self) -> int:
+        """Bytes held by the NumPy columns (strings and vocabulary excluded)."""
+        index = self.tag_index
+        arrays = [self.lat, self.lon, self.rating, self.price, self.trend_score, self.tag_bits,
+                  index.tag_offsets, index.tag_ids, index.posting_offsets, index.posting_ids]
+        for col in (self.names, self.types):
+            if isinstance(col, StringColumn):
+                arrays += [col.offsets, col.data]
+        return sum(a.nbytes for a in arrays)
+
+    def tag_mask(self, tags: Iterable[str]) -> np.ndarray:
+        """Bitset (one row of `tag_bits` width) for the known tags in `tags`."""
+        mask = np.zeros(self.tag_bits.shape[1], dtype=np.uint64)
+        for tid in self.tag_index.vocab.ids(tags):
+            mask[tid // _WORD_BITS] |= np.uint64(1) << np.uint64(tid % _WORD_BITS)
+        return mask
+
+    def preference_mask(self, preferences: Iterable[str], idx: Optional[np.ndarray] = None) -> np.ndarray:
+        """True where a place shares at least one tag with `preferences`.
+
+        For the whole catalog this is a union of the matching posting lists;
+        for a subset `idx` the rows of the bitset matrix are tested instead.
+        """
+        if idx is None:
+            matched = np.zeros(len(self), dtype=bool)
+            matched[self.tag_index.places_with_any(preferences)] = True
+            return matched
+        mask = self.tag_mask(preferences)
+        return np.bitwise_and(self.tag_bits[idx], mask).any(axis=1)
+
+
+def tag_bitset(tag_index: TagIndex) -> np.ndarray:
+    """(places, words) uint64 matrix with bit `t` of row `i` set when place `i` has tag `t`."""
+    n = len(tag_index)
+    n_words = max(1, -(-len(tag_index.vocab) // _WORD_BITS))
+    tag_bits = np.zeros((n, n_words), dtype=np.uint64)
+    if len(tag_index.tag_ids):
+        rows = np.repeat(np.arange(n), np.diff(tag_index.tag_offsets))
+        cols = tag_index.tag_ids
+        bits = np.left_shift(np.uint64(1), (cols % _WORD_BITS).astype(np.uint64))
+        np.bitwise_or.at(tag_bits, (rows, cols // _WORD_BITS), bits)
+    return tag_bits
+
+
+# --------------------------------------------------------------------------------------
+# Memory comparison: list of dicts vs list of Place vs PlaceTable
+# --------------------------------------------------------------------------------------
+def _traced_size(build) -> int:
+    """Bytes still allocated (per tracemalloc) by the object `build()` returns."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def compare_memory(raw_json: str) -> Dict[str, int]:
+    """Bytes used by each representation of the places in `raw_json`."""
+    from catalog_loader import build_table  # local import: catalog_loader imports this module
+
+    places = json.loads(raw_json)
+    return {
+        "dicts": _traced_size(lambda: json.loads(raw_json)),
+        "Place": _traced_size(lambda: [Place.from_dict(p, i) for i, p in enumerate(places)]),
+        "PlaceTable (float64)": _traced_size(lambda: build_table(places)),
+        "PlaceTable (float32)": _traced_size(lambda: build_table(places, coord_dtype=np.float32)),
+    }
+
+
+def _synthetic_places(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    tags = [f"tag{i}" for i in range(200)]
+    return [
+        {"name": f"Place {i}", "type": rng.choice(["park", "museum", "tour"]),
+         "price": rng.randint(0, 50), "rating": round(rng.uniform(3, 5), 1),
+         "tags": rng.sample(tags, 3), "lat": rng.uniform(8, 23), "lon": rng.uniform(102, 110),
+         "trend_score": round(rng.random(), 2)}
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare memory of place representations")
+    parser.add_argument("path", nargs="?", help="JSON array of places (default: synthetic data)")
+    parser.add_argument("--synthetic", type=int, default=100_000, help="Number of synthetic places")
+    args = parser.parse_args()
+
+    if args.path:
+        with open(args.path, "r", encoding="utf-8") as f:
+            raw = f.read()
+    else:
+        raw = json.dumps(_synthetic_places(args.synthetic))
+    sizes = compare_memory(raw)
+    n = len(json.loads(raw))
+    base = sizes["dicts"]
+    print(f"Memory for {n:,} places:")
+    for name, size in sizes.items():
+        print(f"  {name:<22} {size / 1e6:9.2f} MB  {size / max(1, n):7.1f} B/place  {size / base:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Vectorized scoring engine for Task 3 (Recommendation & Ranking).
+
+Computes the rule-based composite score of `Rcm_Ranking.py` for a whole
+`PlaceTable` in one batched NumPy call:
+
+    score = 0.4 * preference + 0.25 * distance + 0.25 * rating / 5 + 0.1 * trend_score
+
+where `preference` is 1 when the place shares a tag with the user's preferences
+and `distance` is `max(0, 1 - dist / 10)` with `dist` the flat Euclidean distance
+in degrees. The per-element operations are the same as the scalar formula, so the
+scores are identical, not just close.
+
+Optionally, distances can be measured as great-circle kilometers
+(`metric="haversine"`, score reaches 0 at `MAX_DISTANCE_KM`), and a `GridIndex`
+can restrict ranking to the places whose distance score can be above zero.
+
+`rank_users_batch` ranks many users at once: it scores users x places blocks
+sized to a memory budget and streams out each user's top k, spreading the
+blocks over a process pool.
+
+`check_parity` compares all of these paths with the scalar `compute_score`
+on random catalogs (run by `test.py`).
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import random
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from place_table import Place, PlaceTable
+from spatial_index import KM_PER_DEG, GridIndex, check_metric, haversine_km
+
+# Composite score weights (same as compute_score in Rcm_Ranking.py)
+W_PREF, W_DIST, W_RATING, W_TREND = 0.4, 0.25, 0.25, 0.1
+
+# Distance (in degrees) at which the distance score reaches 0
+MAX_DISTANCE = 10.0
+
+# Same cut-off expressed in km for the haversine metric (10 degrees of latitude)
+MAX_DISTANCE_KM = MAX_DISTANCE * KM_PER_DEG
+
+# Default number of recommendations returned by rank_top_k
+DEFAULT_TOP_K = 5
+
+# Batch ranking: memory budget for all in-flight score blocks, and the estimated
+# bytes of temporaries (distances, preference flags, scores) per user x place cell
+DEFAULT_MEMORY_BUDGET_MB = 512
+_BYTES_PER_CELL = 40
+
+
+@dataclass(frozen=True)
+class RankedPlace:
+    index: int
+    place: Union[Dict[str, Any], Place]  # as returned by PlaceTable.record
+    score: float
+
+
+def max_distance(metric: str = "euclidean") -> float:
+    """Distance at which the distance score reaches 0 (degrees or km)."""
+    check_metric(metric)
+    return MAX_DISTANCE_KM if metric == "haversine" else MAX_DISTANCE
+
+
+def distance_scores(table: PlaceTable, user: Dict[str, Any], idx: Optional[np.ndarray] = None,
+                    metric: str = "euclidean") -> np.ndarray:
+    """Vectorized `distance_score`: max(0, 1 - dist / max_distance) for every place."""
+    # Coordinates may be stored as float32; distances are always computed in float64
+    lat = np.asarray(table.lat if idx is None else table.lat[idx], dtype=np.float64)
+    lon = np.asarray(table.lon if idx is None else table.lon[idx], dtype=np.float64)
+    if metric == "haversine":
+        dist = haversine_km(user["location"][0], user["location"][1], lat, lon)
+    else:
+        dx = lat - user["location"][0]
+        dy = lon - user["location"][1]
+        dist = np.sqrt(dx * dx + dy * dy)
+    return np.maximum(0.0, 1 - dist / max_distance(metric))
+
+
+def composite_scores(table: PlaceTable, user: Dict[str, Any], idx: Optional[np.ndarray] = None,
+                     metric: str = "euclidean") -> np.ndarray:
+    """Vectorized `compute_score` for every place (or only the rows in `idx`)."""
+    rating = table.rating if idx is None else table.rating[idx]
+    trend = table.trend_score if idx is None else table.trend_score[idx]
+    preference = table.preference_mask(user["preferences"], idx)
+    return (W_PREF * preference +
+            W_DIST * distance_scores(table, user, idx, metric) +
+            W_RATING * rating / 5 +
+            W_TREND * trend)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` highest scores, best first, in O(n + k log k).
+
+    Ties are broken by catalog position (lower index first), which is the
+    order a stable `sorted(..., reverse=True)` would produce.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        idx = np.arange(n)
+    else:
+        # k-th largest value; everything strictly above it is in, ties fill the rest
+        threshold = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+        idx = np.concatenate([above, ties])
+    order = np.lexsort((idx, -scores[idx]))
+    return idx[order]
+
+
+def rank_top_k(table: PlaceTable, user: Dict[str, Any], k: int = DEFAULT_TOP_K,
+               index: Optional[GridIndex] = None, metric: str = "euclidean") -> List[RankedPlace]:
+    """Return the `k` best places for `user` without modifying the catalog records.
+
+    With a spatial `index`, only places within the distance cut-off of the
+    user (distance score above zero) are scored; places farther away are never
+    candidates, even if their rating alone would place them in the top k.
+    """
+    if index is None:
+        idx = np.arange(len(table))
+        scores = composite_scores(table, user, metric=metric)
+    else:
+        lat, lon = user["location"]
+        idx = index.query_radius(lat, lon, max_distance(metric), metric)
+        scores = composite_scores(table, user, idx, metric)
+    return [
+        RankedPlace(index=int(idx[i]), place=table.record(idx[i]), score=float(scores[i]))
+        for i in top_k_indices(scores, k)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Batch ranking (many users against the same catalog)
+# ---------------------------------------------------------------------------
+def score_matrix(table: PlaceTable, users: List[Dict[str, Any]], metric: str = "euclidean") -> np.ndarray:
+    """Composite scores as a (len(users), len(table)) matrix.
+
+    Row `u` equals `composite_scores(table, users[u], metric=metric)` exactly.
+    """
+    loc = np.array([u["location"] for u in users], dtype=np.float64).reshape(-1, 2)
+    user_lat, user_lon = loc[:, :1], loc[:, 1:]
+    lat = np.asarray(table.lat, dtype=np.float64)
+    lon = np.asarray(table.lon, dtype=np.float64)
+    if metric == "haversine":
+        dist = haversine_km(user_lat, user_lon, lat[None, :], lon[None, :])
+    else:
+        dx = lat[None, :] - user_lat
+        dy = lon[None, :] - user_lon
+        dist = np.sqrt(dx * dx + dy * dy)
+        del dx, dy
+    scores = W_DIST * np.maximum(0.0, 1 - dist / max_distance(metric))
+    del dist
+
+    masks = np.stack([table.tag_mask(u["preferences"]) for u in users]) if users else \
+        np.zeros((0, table.tag_bits.shape[1]), dtype=np.uint64)
+    preference = np.zeros(scores.shape, dtype=bool)
+    for w in range(table.tag_bits.shape[1]):
+        preference |= np.bitwise_and(masks[:, w:w + 1], table.tag_bits[None, :, w]) != 0
+
+    # Same summation order as composite_scores: pref + dist + rating + trend
+    scores = W_PREF * preference + scores
+    scores += W_RATING * table.rating / 5
+    scores += W_TREND * table.trend_score
+    return scores
+
+
+def _rank_block(table: PlaceTable, users: List[Dict[str, Any]], k: int,
+                metric: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """(indices, scores) of the top `k` places for each user of a block."""
+    scores = score_matrix(table, users, metric)
+    out = []
+    for row in scores:
+        top = top_k_indices(row, k)
+        out.append((top, row[top]))
+    return out
+
+
+_worker_table: Optional[PlaceTable] = None
+
+
+def _init_worker(table: PlaceTable) -> None:
+    global _worker_table
+    _worker_table = table
+
+
+def _rank_block_in_worker(users: List[Dict[str, Any]], k: int,
+                          metric: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+    return _rank_block(_worker_table, users, k, metric)
+
+
+def _user_block_size(n_places: int, memory_budget_mb: float, in_flight: int) -> int:
+    per_user = max(1, n_places) * _BYTES_PER_CELL
+    return max(1, int(memory_budget_mb * 1024 * 1024 // (per_user * in_flight)))
+
+
+def rank_users_batch(table: PlaceTable, users: Iterable[Dict[str, Any]], k: int = DEFAULT_TOP_K,
+                     metric: str = "euclidean", memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                     workers: Optional[int] = None) -> Iterator[List[RankedPlace]]:
+    """Yield the top `k` places for every user in `users`, in input order.
+
+    `users` may be any iterable (e.g. a generator over a file); it is consumed
+    block by block. Each block's score matrix is sized so that all blocks in
+    flight together stay within `memory_budget_mb`, so peak memory does not
+    depend on the number of users. `workers` defaults to all CPU cores;
+    `workers=1` ranks in the calling process.
+    """
+    check_metric(metric)
+    workers = workers or os.cpu_count() or 1
+    in_flight = 1 if workers == 1 else 2 * workers
+    block = _user_block_size(len(table), memory_budget_mb, in_flight)
+    it = iter(users)
+    blocks = iter(lambda: list(islice(it, block)), [])
+
+    def emit(results: List[Tuple[np.ndarray, np.ndarray]]) -> Iterator[List[RankedPlace]]:
+        for top, scores in results:
+            yield [RankedPlace(index=int(i), place=table.record(i), score=float(s))
+                   for i, s in zip(top, scores)]
+
+    if workers == 1:
+        for users_block in blocks:
+            yield from emit(_rank_block(table, users_block, k, metric))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(table.columns_only(),)) as executor:
+        pending: deque = deque()
+        for users_block in blocks:
+            pending.append(executor.submit(_rank_block_in_worker, users_block, k, metric))
+            if len(pending) >= in_flight:
+                yield from emit(pending.popleft().result())
+        while pending:
+            yield from emit(pending.popleft().result())
+
+
+# ---------------------------------------------------------------------------
+# Parity with the scalar formula
+# ---------------------------------------------------------------------------
+def _random_catalog(rng: random.Random, n: int) -> List[Dict[str, Any]]:
+    # Few distinct ratings, coordinates and trends so that equal scores (ties) are common
+    tags = [f"tag{i}" for i in range(rng.choice((3, 70)))]
+    places = []
+    for i in range(n):
+        place = {"name": f"Place {i}", "type": rng.choice(["park", "museum"]),
+                 "rating": rng.choice((3.5, 4.0, 4.5, 5.0)), "tags": rng.sample(tags, rng.randint(0, 3)),
+                 "lat": rng.choice((10.0, 10.5, rng.uniform(0, 30))),
+                 "lon": rng.choice((106.0, rng.uniform(95, 125)))}
+        if rng.random() < 0.7:
+            place["trend_score"] = rng.choice((0.0, 0.5, 0.9))
+        places.append(place)
+    return places
+
+
+def _random_user(rng: random.Random) -> Dict[str, Any]:
+    return {"preferences": rng.sample(["tag0", "tag1", "tag2", "tag42", "unknown"], rng.randint(0, 3)),
+            "location": (rng.uniform(0, 30), rng.uniform(95, 125))}
+
+
+def check_parity(trials: int = 200, seed: int = 0) -> int:
+    """Compare the vectorized ranking with `Rcm_Ranking.compute_score` on random catalogs.
+
+    Per trial, checks `composite_scores` (exact equality), `rank_top_k` with
+    and without a `GridIndex` (order of ties included) and `rank_users_batch`
+    against a stable sort of the scalar scores. A catalog loaded through
+    `catalog_loader` (JSON Lines, then its columnar cache) is checked once.
+    Returns the number of mismatching trials.
+    """
+    from Rcm_Ranking import compute_score
+    from catalog_loader import load_table
+
+    def expected(places, user, candidates=None):
+        scores = [compute_score(p, user) for p in places]
+        order = sorted(range(len(places)) if candidates is None else candidates, key=lambda i: -scores[i])
+        return scores, [(i, scores[i]) for i in order]
+
+    def got(ranked):
+        return [(r.index, r.score) for r in ranked]
+
+    rng = random.Random(seed)
+    mismatches = 0
+    for trial in range(trials):
+        places = _random_catalog(rng, rng.randint(1, 60))
+        table = PlaceTable.from_places(places)
+        index = GridIndex.from_table(table, cell_size=rng.choice((0.5, 1.0, 4.0)))
+        users = [_random_user(rng) for _ in range(rng.randint(1, 6))]
+        k = rng.randint(1, 12)
+        ok = True
+        for user in users:
+            scores, ref = expected(places, user)
+            ok &= composite_scores(table, user).tolist() == scores
+            top = rank_top_k(table, user, k)
+            ok &= got(top) == ref[:k] and all(r.place is places[r.index] for r in top)
+            # Grid path: only places within the cut-off distance are candidates
+            lat, lon = user["location"]
+            nearby = [i for i, p in enumerate(places)
+                      if math.sqrt((p["lat"] - lat) ** 2 + (p["lon"] - lon) ** 2) <= MAX_DISTANCE]
+            ok &= got(rank_top_k(table, user, k, index=index)) == expected(places, user, nearby)[1][:k]
+        # Tiny memory budget: several user blocks; one trial through a process pool
+        batch = rank_users_batch(table, iter(users), k, memory_budget_mb=1e-4,
+                                 workers=2 if trial == 0 else 1)
+        ok &= [got(r) for r in batch] == [expected(places, u)[1][:k] for u in users]
+        mismatches += not ok
+
+    places = _random_catalog(rng, 300)
+    user = _random_user(rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "places.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(p) + "\n" for p in places)
+        _, ref = expected(places, user)
+        for _ in range(2):  # first load builds the cache, the second memory-maps it
+            table = load_table(path, os.path.join(tmp, "cache"))
+            top = rank_top_k(table, user, 20)
+            mismatches += (got(top) != ref[:20]
+                           or [r.place["name"] for r in top] != [places[i]["name"] for i, _ in ref[:20]])
+    return mismatches
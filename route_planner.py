@@ -0,0 +1,416 @@
+"""
+Route optimization for itinerary candidates (Task 4 / Task 5).
+
+`RoutePlanner` computes `total_time` and `total_cost` for a set of places from
+their `lat`/`lon` fields, which is what `EXAMPLE_CODE.select_final_itinerary`
+scores. It precomputes one distance matrix (great-circle km times
+`ROAD_FACTOR`) and travel-time matrix for the whole ranked pool when it is
+built, so solving a route only indexes into those matrices.
+
+The visiting order is:
+- exact for up to `EXACT_MAX_STOPS` places (Held-Karp dynamic programming),
+- nearest-neighbor followed by 2-opt and Or-opt moves for larger sets.
+
+Routes start and end wherever is shortest, or at `origin` (and back there
+with `return_to_origin=True`). Solved routes are memoized by place set, so a
+set that reappears in another candidate costs one dict lookup.
+
+Usage:
+    planner = RoutePlanner(places, speed_kmh=30, cost_per_km=0.5)
+    planner.plan(places[:4])                                # -> Route
+    for it in route_itineraries(generate_itineraries(places, constraints), planner, constraints):
+        ...
+
+    python route_planner.py [--synthetic N] [--stops K]
+    python route_planner.py --test   # exact-solver, heuristic and budget self-tests
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fx_rates import FxTable, default_fx
+from itinerary_generator import budget_limit
+from spatial_index import haversine_km
+
+# Road distance per unit of great-circle distance
+ROAD_FACTOR = 1.3
+DEFAULT_SPEED_KMH = 30.0
+# Largest place set solved exactly (Held-Karp is O(2^k * k^2))
+EXACT_MAX_STOPS = 9
+ROUTE_CACHE_SIZE = 100_000
+
+# Improvements smaller than this are treated as ties (floating-point noise)
+_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class Route:
+    """Visiting order for one place set and what travelling it takes."""
+    order: Tuple[int, ...]        # planner place ids, in visiting order
+    distance_km: float
+    travel_hours: float
+    travel_cost: float
+    exact: bool                   # True when the order is provably shortest
+
+
+# --------------------------------------------------------------------------------------
+# Solvers over a small (k+2) x (k+2) matrix: node 0 = start, 1..k = stops, k+1 = end
+# --------------------------------------------------------------------------------------
+def _path_length(d: np.ndarray, seq: Sequence[int]) -> float:
+    return float(sum(d[a, b] for a, b in zip(seq, seq[1:])))
+
+
+def held_karp(d: np.ndarray) -> List[int]:
+    """Shortest path 0 -> all of 1..k -> k+1; returns the stop order."""
+    k = len(d) - 2
+    if k <= 1:
+        return list(range(1, k + 1))
+    w = d.tolist()
+    full = (1 << k) - 1
+    inf = math.inf
+    cost = [[inf] * k for _ in range(1 << k)]
+    parent = [[-1] * k for _ in range(1 << k)]
+    for j in range(k):
+        cost[1 << j][j] = w[0][j + 1]
+    for mask in range(1, full + 1):
+        row = cost[mask]
+        for j in range(k):
+            cj = row[j]
+            if cj == inf:
+                continue
+            wj = w[j + 1]
+            for nxt in range(k):
+                bit = 1 << nxt
+                if mask & bit:
+                    continue
+                c = cj + wj[nxt + 1]
+                if c < cost[mask | bit][nxt]:
+                    cost[mask | bit][nxt] = c
+                    parent[mask | bit][nxt] = j
+    last = min(range(k), key=lambda j: cost[full][j] + w[j + 1][k + 1])
+    order, mask = [], full
+    while last != -1:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), parent[mask][last]
+    return order[::-1]
+
+
+def nearest_neighbor(d: np.ndarray) -> List[int]:
+    """Greedy order: always go to the closest unvisited stop."""
+    k = len(d) - 2
+    left = set(range(1, k + 1))
+    order, here = [], 0
+    while left:
+        here = min(left, key=lambda j: (d[here, j], j))
+        order.append(here)
+        left.remove(here)
+    return order
+
+
+def improve(d: np.ndarray, order: List[int], max_segment: int = 3) -> List[int]:
+    """Apply improving 2-opt and Or-opt moves until neither finds one.
+
+    2-opt reverses a stretch of the path; Or-opt moves a stretch of up to
+    `max_segment` stops (optionally reversed) to another position. The
+    endpoints (nodes 0 and k+1) never move. Assumes a symmetric matrix.
+    """
+    w = d.tolist()
+    seq = [0] + list(order) + [len(d) - 1]
+    improved = True
+    while improved:
+        improved = False
+        # 2-opt: reverse seq[i..j]
+        for i in range(1, len(seq) - 2):
+            for j in range(i + 1, len(seq) - 1):
+                a, b, c, e = seq[i - 1], seq[i], seq[j], seq[j + 1]
+                if w[a][c] + w[b][e] < w[a][b] + w[c][e] - _EPS:
+                    seq[i:j + 1] = seq[i:j + 1][::-1]
+                    improved = True
+        # Or-opt: move seq[i..i+L-1] between two other neighbours
+        for length in range(1, max_segment + 1):
+            i = 1
+            while i + length < len(seq):
+                first, last = seq[i], seq[i + length - 1]
+                prev, nxt = seq[i - 1], seq[i + length]
+                removed = w[prev][first] + w[last][nxt] - w[prev][nxt]
+                rest = seq[:i] + seq[i + length:]
+                best, best_at, best_rev = removed - _EPS, None, False
+                for p in range(len(rest) - 1):
+                    x, y = rest[p], rest[p + 1]
+                    fwd = w[x][first] + w[last][y] - w[x][y]
+                    rev = w[x][last] + w[first][y] - w[x][y]
+                    if fwd < best:
+                        best, best_at, best_rev = fwd, p, False
+                    if rev < best:
+                        best, best_at, best_rev = rev, p, True
+                if best_at is not None:
+                    segment = seq[i:i + length]
+                    if best_rev:
+                        segment.reverse()
+                    seq = rest[:best_at + 1] + segment + rest[best_at + 1:]
+                    improved = True
+                i += 1
+    return seq[1:-1]
+
+
+# --------------------------------------------------------------------------------------
+# Planner
+# --------------------------------------------------------------------------------------
+def _place_key(place: Any) -> Hashable:
+    return place.get("id", place.get("name")), place["lat"], place["lon"]
+
+
+class RoutePlanner:
+    """Distance/time matrices over a pool of places plus a memoized route solver.
+
+    Args:
+        places: The ranked pool (dicts or `place_table.Place`s with `lat`/`lon`)
+        speed_kmh: Average travel speed used for the time matrix
+        cost_per_km: Travel cost per road km, in `fx.base` (the currency the generator
+            converts place costs to); in the place costs' own units when no
+            currency is named anywhere
+        origin: Optional (lat, lon) every route starts from
+        return_to_origin: Routes end back at `origin`
+        cache_size: Routes kept in the place-set memo (least recently used dropped)
+    """
+
+    def __init__(self, places: Sequence[Any], speed_kmh: float = DEFAULT_SPEED_KMH,
+                 cost_per_km: float = 0.0, origin: Optional[Tuple[float, float]] = None,
+                 return_to_origin: bool = False, cache_size: int = ROUTE_CACHE_SIZE) -> None:
+        if speed_kmh <= 0:
+            raise ValueError("speed_kmh must be positive")
+        if return_to_origin and origin is None:
+            raise ValueError("return_to_origin needs an origin")
+        self.places = list(places)
+        self.speed_kmh = speed_kmh
+        self.cost_per_km = cost_per_km
+        self.origin = origin
+        self.return_to_origin = return_to_origin
+        self.cache_size = cache_size
+        self._ids = {_place_key(p): i for i, p in enumerate(self.places)}
+        self._cache: "OrderedDict[Tuple[int, ...], Route]" = OrderedDict()
+        self.hits = self.misses = 0
+
+        lat = np.array([p["lat"] for p in self.places], dtype=np.float64)
+        lon = np.array([p["lon"] for p in self.places], dtype=np.float64)
+        if origin is not None:
+            lat, lon = np.append(lat, origin[0]), np.append(lon, origin[1])
+        # Last row/column is the origin when there is one
+        self.distance_km = haversine_km(lat[:, None], lon[:, None], lat[None, :], lon[None, :]) * ROAD_FACTOR
+        self.travel_hours = self.distance_km / speed_kmh
+
+    def place_id(self, place: Any) -> int:
+        """Row of `place` in the matrices; KeyError if it is not in the pool."""
+        try:
+            return self._ids[_place_key(place)]
+        except KeyError:
+            raise KeyError(f"Place {place.get('name')!r} is not in the planner's pool") from None
+
+    def _submatrix(self, ids: Sequence[int]) -> np.ndarray:
+        """(k+2) x (k+2) distances: start node, the stops, end node (free ends are 0 away)."""
+        k = len(ids)
+        d = np.zeros((k + 2, k + 2))
+        d[1:k + 1, 1:k + 1] = self.distance_km[np.ix_(ids, ids)]
+        if self.origin is not None:
+            to_origin = self.distance_km[-1, ids]
+            d[0, 1:k + 1] = d[1:k + 1, 0] = to_origin
+            if self.return_to_origin:
+                d[k + 1, 1:k + 1] = d[1:k + 1, k + 1] = to_origin
+        return d
+
+    def _solve(self, ids: Tuple[int, ...]) -> Route:
+        d = self._submatrix(ids)
+        exact = len(ids) <= EXACT_MAX_STOPS
+        local = held_karp(d) if exact else improve(d, nearest_neighbor(d))
+        km = _path_length(d, [0] + local + [len(d) - 1])
+        return Route(tuple(ids[j - 1] for j in local), km, km / self.speed_kmh, km * self.cost_per_km, exact)
+
+    def route_ids(self, ids: Iterable[int]) -> Route:
+        """Best route through the given place ids (memoized by the set of ids)."""
+        key = tuple(sorted(set(ids)))
+        route = self._cache.get(key)
+        if route is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return route
+        self.misses += 1
+        route = self._solve(key)
+        self._cache[key] = route
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return route
+
+    def plan(self, places: Iterable[Any]) -> Route:
+        """Best route through `places` (which must come from the planner's pool)."""
+        return self.route_ids(self.place_id(p) for p in places)
+
+    def annotate(self, itinerary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a generator candidate with routed order, travel added to time and cost."""
+        route = self.plan(itinerary["places"])
+        ordered = [self.places[i] for i in route.order]
+        return {
+            **itinerary,
+            "locations": [p.get("id", p.get("name")) for p in ordered],
+            "places": ordered,
+            "travel_km": route.distance_km,
+            "total_time": itinerary["total_time"] + route.travel_hours,
+            "total_cost": itinerary["total_cost"] + route.travel_cost,
+        }
+
+
+def route_itineraries(candidates: Iterable[Dict[str, Any]], planner: RoutePlanner,
+                      user_constraints: Optional[Dict[str, Any]] = None,
+                      fx: Optional[FxTable] = None) -> Iterator[Dict[str, Any]]:
+    """Route each candidate and drop those that travel pushes over `max_time`/`max_budget`.
+
+    Takes the output of `itinerary_generator.generate_itineraries` and yields
+    itineraries ready for `select_final_itinerary`. `max_budget` (number or
+    {"amount", "currency"}) is resolved like the generator does it and
+    converted with `fx` into the currency each candidate names (`fx.base` for
+    converted candidates); a candidate without a currency is compared with the
+    raw amount.
+    """
+    limits = user_constraints or {}
+    max_time = limits.get("max_time", math.inf)
+    budget, budget_currency = budget_limit(limits) if "max_budget" in limits else (math.inf, None)
+    budget_in: Dict[Optional[str], float] = {None: budget}
+    for it in candidates:
+        currency = it.get("currency")
+        if currency not in budget_in:
+            fx = fx or default_fx()
+            budget_in[currency] = fx.convert(budget, budget_currency or fx.base, currency)
+        routed = planner.annotate(it)
+        if routed["total_time"] <= max_time and routed["total_cost"] <= budget_in[currency]:
+            yield routed
+
+
+# --------------------------------------------------------------------------------------
+# Demo / quality check
+# --------------------------------------------------------------------------------------
+def _synthetic_places(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Places scattered over roughly 20 x 20 km around central Hanoi."""
+    rng = random.Random(seed)
+    return [{"name": f"place_{i:03d}", "lat": 21.03 + rng.uniform(-0.09, 0.09),
+             "lon": 105.85 + rng.uniform(-0.09, 0.09), "price": rng.randint(5, 60),
+             "recommend_score": round(100 - i * 0.5 - rng.random(), 2),
+             "visit_hours": rng.choice((0.5, 1.0, 1.5, 2.0))} for i in range(n)]
+
+
+# --------------------------------------------------------------------------------------
+# Self-test (python route_planner.py --test)
+# --------------------------------------------------------------------------------------
+def _brute_force_length(d: np.ndarray) -> float:
+    """Shortest 0 -> every stop -> k+1 path length over all stop permutations."""
+    k = len(d) - 2
+    return min(_path_length(d, [0, *perm, k + 1]) for perm in itertools.permutations(range(1, k + 1)))
+
+
+def run_tests() -> int:
+    """Check Held-Karp against brute force, the heuristic against Held-Karp and the budget check.
+    Returns process exit code (0 = all pass)."""
+    from itinerary_generator import generate_itineraries
+
+    total = 0
+    failures: List[str] = []
+    places = _synthetic_places(30)
+    rng = random.Random(2)
+
+    # Held-Karp is optimal and the heuristic returns a valid order no shorter than it,
+    # with free ends, a fixed start and a round trip
+    for origin, back in ((None, False), ((21.03, 105.85), False), ((21.03, 105.85), True)):
+        planner = RoutePlanner(places, origin=origin, return_to_origin=back)
+        for _ in range(40):
+            total += 1
+            ids = rng.sample(range(len(places)), rng.randint(0, 7))
+            d = planner._submatrix(ids)
+            exact_order, heur_order = held_karp(d), improve(d, nearest_neighbor(d))
+            exact = _path_length(d, [0] + exact_order + [len(d) - 1])
+            heur = _path_length(d, [0] + heur_order + [len(d) - 1])
+            label = f"origin={origin} back={back} stops={len(ids)}"
+            if sorted(exact_order) != list(range(1, len(ids) + 1)) or \
+                    sorted(heur_order) != list(range(1, len(ids) + 1)):
+                failures.append(f"ORDER {label} FAIL – not a permutation of the stops")
+            elif not math.isclose(exact, _brute_force_length(d), abs_tol=1e-9):
+                failures.append(f"HELD-KARP {label} FAIL – {exact:.6f} km vs brute force {_brute_force_length(d):.6f}")
+            elif heur < exact - 1e-9:
+                failures.append(f"HEURISTIC {label} FAIL – {heur:.6f} km shorter than exact {exact:.6f}")
+
+    # Budget in VND against candidates the generator converted to the FX base currency
+    fx = FxTable.from_rates({"USD": 1, "VND": 25000})
+    vnd_places = [{**p, "price": p["price"] * 25000, "currency": "VND"} for p in places[:10]]
+    planner = RoutePlanner(vnd_places, cost_per_km=0.5)
+    constraints = {"max_budget": {"amount": 2_000_000, "currency": "VND"}, "max_time": 8}
+    routed = list(route_itineraries(generate_itineraries(vnd_places, constraints, fx=fx), planner, constraints, fx))
+    expected = [it for it in map(planner.annotate, generate_itineraries(vnd_places, constraints, fx=fx))
+                if it["total_time"] <= 8 and it["total_cost"] <= 80]
+    total += 1
+    if not expected or routed != expected:
+        failures.append(f"BUDGET FAIL – {len(routed)} routed candidates within 2,000,000 VND, expected {len(expected)}")
+
+    passed = total - len(failures)
+    print(f"Test Results: {passed}/{total} tests passed.")
+    if failures:
+        print("Detailed Failures:")
+        for line in failures:
+            print(" - " + line)
+    else:
+        print("All test cases passed.")
+    return 0 if not failures else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Route optimization check: heuristic vs exact orders")
+    parser.add_argument("--test", action="store_true", help="Run the exact-solver, heuristic and budget self-tests")
+    parser.add_argument("--synthetic", type=int, default=40, metavar="N", help="Pool of N synthetic places")
+    parser.add_argument("--stops", type=int, default=8, help="Places per route")
+    parser.add_argument("--trials", type=int, default=200)
+    args = parser.parse_args()
+    if args.test:
+        raise SystemExit(run_tests())
+
+    places = _synthetic_places(args.synthetic)
+    planner = RoutePlanner(places)
+    rng = random.Random(1)
+    # Held-Karp is only run as a reference where it stays fast enough
+    compare = args.stops <= EXACT_MAX_STOPS + 3
+    gaps, exact_s, heur_s = [], 0.0, 0.0
+    for _ in range(args.trials):
+        ids = rng.sample(range(len(places)), min(args.stops, len(places)))
+        d = planner._submatrix(ids)
+        start = time.perf_counter()
+        heur = _path_length(d, [0] + improve(d, nearest_neighbor(d)) + [len(d) - 1])
+        heur_s += time.perf_counter() - start
+        if compare:
+            start = time.perf_counter()
+            exact = _path_length(d, [0] + held_karp(d) + [len(d) - 1])
+            exact_s += time.perf_counter() - start
+            gaps.append(heur / exact - 1 if exact else 0.0)
+    print(f"{args.trials} random {args.stops}-stop routes over {len(places)} places")
+    print(f"NN + 2-opt/Or-opt: {heur_s / args.trials * 1000:.2f} ms/route"
+          + (f"; Held-Karp: {exact_s / args.trials * 1000:.2f} ms/route" if compare else ""))
+    if compare:
+        print(f"Heuristic gap: mean {np.mean(gaps) * 100:.2f}%, max {max(gaps) * 100:.2f}%, "
+              f"optimal in {sum(g < 1e-9 for g in gaps)}/{len(gaps)}")
+
+    from itinerary_generator import generate_itineraries
+    constraints = {"max_budget": 100, "max_time": 6}
+    start = time.perf_counter()
+    routed = list(route_itineraries(generate_itineraries(places[:25], constraints, 2, 4), planner, constraints))
+    again = list(route_itineraries(generate_itineraries(places[:25], constraints, 2, 4), planner, constraints))
+    elapsed = time.perf_counter() - start
+    assert routed == again
+    print(f"Routed {len(routed):,} candidates twice in {elapsed:.2f}s "
+          f"(route cache: {planner.hits:,} hits, {planner.misses:,} misses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Spatial index for distance-aware candidate retrieval (Task 3 / Task 4).
+
+`GridIndex` buckets places into fixed-size lat/lon cells once, then answers
+radius and k-nearest queries by visiting only the cells that can contain a
+match, so the per-request cost grows with the number of nearby places rather
+than with the catalog size.
+
+Two distance metrics are supported:
+- "euclidean": flat distance in degrees, as used by `distance_score` in the ranking
+- "haversine": great-circle distance in kilometers
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG = EARTH_RADIUS_KM * math.pi / 180
+
+METRICS = ("euclidean", "haversine")
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km between points given in degrees (broadcasts)."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(1.0, a)))
+
+
+def check_metric(metric: str) -> None:
+    if metric not in METRICS:
+        raise ValueError(f"Unknown distance metric '{metric}', expected one of {METRICS}")
+
+
+class GridIndex:
+    """Uniform lat/lon grid over a set of points.
+
+    Args:
+        lat, lon: Coordinates in degrees (e.g. `PlaceTable.lat` / `PlaceTable.lon`)
+        cell_size: Cell edge in degrees
+    """
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, cell_size: float = 1.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.cell_size = cell_size
+
+        ci = np.floor(self.lat / cell_size).astype(np.int64)
+        cj = np.floor(self.lon / cell_size).astype(np.int64)
+        order = np.lexsort((cj, ci))
+        ci, cj = ci[order], cj[order]
+        starts = np.flatnonzero(np.r_[True, (ci[1:] != ci[:-1]) | (cj[1:] != cj[:-1])])
+        ends = np.r_[starts[1:], len(order)]
+        self._cells: Dict[Tuple[int, int], np.ndarray] = {
+            (int(ci[s]), int(cj[s])): order[s:e] for s, e in zip(starts, ends)
+        }
+
+    @classmethod
+    def from_table(cls, table, cell_size: float = 1.0) -> "GridIndex":
+        """Build the index over a `PlaceTable`."""
+        return cls(table.lat, table.lon, cell_size)
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def distances(self, idx: np.ndarray, lat: float, lon: float, metric: str = "euclidean") -> np.ndarray:
+        """Distance from (lat, lon) to the points in `idx` (degrees or km)."""
+        check_metric(metric)
+        if metric == "haversine":
+            return haversine_km(lat, lon, self.lat[idx], self.lon[idx])
+        dx = self.lat[idx] - lat
+        dy = self.lon[idx] - lon
+        return np.sqrt(dx * dx + dy * dy)
+
+    def _bounds(self, lat: float, lon: float, radius: float, metric: str) -> Tuple[float, float, float, float]:
+        """Conservative lat/lon bounding box (degrees) of a query circle.
+
+        Longitude bounds are +/-inf when the circle reaches a pole or the
+        antimeridian, in which case every longitude is scanned.
+        """
+        if metric == "euclidean":
+            return lat - radius, lat + radius, lon - radius, lon + radius
+        delta = radius / EARTH_RADIUS_KM
+        phi = math.radians(lat)
+        lat_lo, lat_hi = math.degrees(phi - delta), math.degrees(phi + delta)
+        if lat_hi >= 90 or lat_lo <= -90:
+            return lat_lo, lat_hi, -math.inf, math.inf
+        dlon = math.degrees(math.asin(min(1.0, math.sin(delta) / math.cos(phi))))
+        if lon - dlon < -180 or lon + dlon > 180:
+            return lat_lo, lat_hi, -math.inf, math.inf
+        return lat_lo, lat_hi, lon - dlon, lon + dlon
+
+    def _candidates(self, lat_lo: float, lat_hi: float, lon_lo: float, lon_hi: float) -> np.ndarray:
+        """Point ids of every cell that intersects the bounding box."""
+        cs = self.cell_size
+        i0, i1 = math.floor(lat_lo / cs), math.floor(lat_hi / cs)
+        if math.isinf(lon_lo) or math.isinf(lon_hi):
+            keys: Iterable[Tuple[int, int]] = (k for k in self._cells if i0 <= k[0] <= i1)
+        else:
+            j0, j1 = math.floor(lon_lo / cs), math.floor(lon_hi / cs)
+            if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+                keys = (k for k in self._cells if i0 <= k[0] <= i1 and j0 <= k[1] <= j1)
+            else:
+                keys = ((i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1))
+        buckets = [self._cells[k] for k in keys if k in self._cells]
+        if not buckets:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(buckets)
+
+    def query_radius(self, lat: float, lon: float, radius: float, metric: str = "euclidean") -> np.ndarray:
+        """Ids of all points within `radius` of (lat, lon), in ascending id order."""
+        check_metric(metric)
+        idx = self._candidates(*self._bounds(lat, lon, radius, metric))
+        idx = idx[self.distances(idx, lat, lon, metric) <= radius]
+        idx.sort()
+        return idx
+
+    def query_knn(self, lat: float, lon: float, k: int, metric: str = "euclidean") -> np.ndarray:
+        """Ids of the `k` nearest points, nearest first (ties by id).
+
+        Runs radius queries with a doubling radius until at least `k` points
+        are inside; every point outside that radius is farther than all of
+        them, so the result is exact.
+        """
+        check_metric(metric)
+        n = len(self)
+        k = min(k, n)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        radius = self.cell_size * (KM_PER_DEG if metric == "haversine" else 1.0)
+        while True:
+            idx = self.query_radius(lat, lon, radius, metric)
+            if len(idx) >= k:
+                break
+            radius *= 2
+        dist = self.distances(idx, lat, lon, metric)
+        return idx[np.lexsort((idx, dist))[:k]]
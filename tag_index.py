@@ -0,0 +1,116 @@
+"""
+Shared tag dictionary and inverted tag index (Task 3 / Task 6).
+
+`TagVocabulary` maps every tag string to a small integer id once, and
+`TagIndex` keeps, for each tag id, the sorted ids of the places carrying it.
+Preference matching then becomes a union of a few posting lists, so its cost
+depends on how many places match rather than on the catalog size. The same
+index is used by the ranking engine (`PlaceTable`) and by `ContextAlertSystem`
+for explainability tags.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+class TagVocabulary:
+    """Bidirectional tag <-> integer id mapping."""
+
+    def __init__(self, tags: Iterable[str] = ()) -> None:
+        self._ids: Dict[str, int] = {}
+        self._tags: List[str] = []
+        for tag in tags:
+            self.intern(tag)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._ids
+
+    def intern(self, tag: str) -> int:
+        """Id of `tag`, assigning the next free id to unseen tags."""
+        tid = self._ids.get(tag)
+        if tid is None:
+            tid = self._ids[tag] = len(self._tags)
+            self._tags.append(tag)
+        return tid
+
+    def get(self, tag: str) -> Optional[int]:
+        return self._ids.get(tag)
+
+    def ids(self, tags: Iterable[str]) -> FrozenSet[int]:
+        """Ids of the known tags in `tags` (unknown tags are ignored)."""
+        return frozenset(tid for tid in map(self._ids.get, tags) if tid is not None)
+
+    def tag(self, tid: int) -> str:
+        return self._tags[tid]
+
+    @property
+    def tags(self) -> List[str]:
+        return list(self._tags)
+
+
+class TagIndex:
+    """Per-place tag ids plus the inverted tag -> places index.
+
+    Both directions are stored as CSR arrays: the tags of place `i` are
+    `tag_ids[tag_offsets[i]:tag_offsets[i + 1]]`, and the places carrying tag `t`
+    are `posting_ids[posting_offsets[t]:posting_offsets[t + 1]]` (ascending).
+    """
+
+    def __init__(self, vocab: TagVocabulary, tag_offsets: np.ndarray, tag_ids: np.ndarray,
+                 posting_offsets: Optional[np.ndarray] = None, posting_ids: Optional[np.ndarray] = None) -> None:
+        self.vocab = vocab
+        self.tag_offsets = tag_offsets
+        self.tag_ids = tag_ids
+        if posting_offsets is not None and posting_ids is not None:
+            # Prebuilt inverted index (e.g. memory-mapped from a catalog cache)
+            self.posting_offsets = posting_offsets
+            self.posting_ids = posting_ids
+            return
+        place_of = np.repeat(np.arange(len(tag_offsets) - 1), np.diff(tag_offsets))
+        order = np.lexsort((place_of, tag_ids))
+        self.posting_ids = place_of[order]
+        counts = np.bincount(tag_ids, minlength=len(vocab))
+        self.posting_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    @classmethod
+    def from_places(cls, places: Sequence[Dict[str, Any]], vocab: Optional[TagVocabulary] = None) -> "TagIndex":
+        """Index the `tags` lists of `sample_places.json`-style dicts."""
+        vocab = vocab if vocab is not None else TagVocabulary()
+        offsets = np.zeros(len(places) + 1, dtype=np.int64)
+        ids: List[int] = []
+        for i, p in enumerate(places):
+            ids.extend(dict.fromkeys(vocab.intern(tag) for tag in p.get("tags", [])))
+            offsets[i + 1] = len(ids)
+        return cls(vocab, offsets, np.asarray(ids, dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self.tag_offsets) - 1
+
+    def place_tag_ids(self, place_id: int) -> np.ndarray:
+        return self.tag_ids[self.tag_offsets[place_id]:self.tag_offsets[place_id + 1]]
+
+    def places_with_tag(self, tag: str) -> np.ndarray:
+        tid = self.vocab.get(tag)
+        if tid is None:
+            return np.empty(0, dtype=np.int64)
+        return self.posting_ids[self.posting_offsets[tid]:self.posting_offsets[tid + 1]]
+
+    def places_with_any(self, tags: Iterable[str]) -> np.ndarray:
+        """Sorted ids of the places sharing at least one tag with `tags`."""
+        postings = [self.places_with_tag(tag) for tag in set(tags)]
+        postings = [p for p in postings if len(p)]
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+        if len(postings) == 1:
+            return postings[0]
+        return np.unique(np.concatenate(postings))
+
+    def matched_tags(self, place_id: int, tags: Iterable[str]) -> List[str]:
+        """Tags of place `place_id` that are also in `tags`, in the place's tag order."""
+        wanted = self.vocab.ids(tags)
+        return [self.vocab.tag(t) for t in self.place_tag_ids(place_id).tolist() if t in wanted]
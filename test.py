@@ -1,11 +1,21 @@
 import json
 import os
+from itertools import chain
+
+from catalog_loader import iter_places
 
 def read_places():
     file_path = os.path.join(os.path.dirname(__file__), 'sample_places.json')
+    data = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Đọc lần lượt từng địa điểm (hỗ trợ cả JSON Lines), không nạp cả file một lần
+        places = iter_places(file_path)
+        first = next(places, None)
+        print("=== Dữ liệu trong sample_places.json ===")
+        if first is not None:
+            for i, place in enumerate(chain([first], places), start=1):
+                print(f"{i}. {place['name']} ({place['type']}) - Rating: {place['rating']}")
+                data.append(place)
     except FileNotFoundError:
         print("Không tìm thấy file sample_places.json.")
         return []
@@ -13,11 +23,37 @@ def read_places():
         print("Lỗi định dạng JSON trong sample_places.json.")
         return []
 
-    print("=== Dữ liệu trong sample_places.json ===")
-    for i, place in enumerate(data, start=1):
-        print(f"{i}. {place['name']} ({place['type']}) - Rating: {place['rating']}")
     print("========================================")
     return data
 
+def run_module_tests():
+    """Chạy các bài tự kiểm tra của từng module; trả về mã thoát (0 = tất cả đạt)."""
+    import SourceDemo
+    import Smart_Context_Insights
+    import decision_engine
+    import fx_rates
+    import itinerary_generator
+    import ranking_engine
+    import route_planner
+
+    failed = 0
+    for name, run in (("SourceDemo", SourceDemo.run_tests),
+                      ("fx_rates", fx_rates.run_tests),
+                      ("itinerary_generator", itinerary_generator.run_tests),
+                      ("route_planner", route_planner.run_tests),
+                      ("Smart_Context_Insights", Smart_Context_Insights.run_tests)):
+        print(f"=== {name} ===")
+        failed += run() != 0
+    print("=== ranking_engine ===")
+    mismatches = ranking_engine.check_parity(200)
+    print(f"Parity: {mismatches} mismatches with compute_score over 200 random catalogs")
+    failed += mismatches != 0
+    print("=== decision_engine ===")
+    mismatches = decision_engine.check_parity(200)
+    print(f"Parity: {200 - mismatches}/200 random batches identical")
+    failed += mismatches != 0
+    return 1 if failed else 0
+
 if __name__ == '__main__':
     read_places()
+    raise SystemExit(run_module_tests())
@@ -0,0 +1,119 @@
+"""
+Load generator for validation_service.py (stdlib only).
+
+Opens `--connections` keep-alive connections and sends `--requests` POSTs in
+total, cycling through SourceDemo's raw query (or profile) fixtures, `--batch`
+items per request. Reports requests/second, items/second, latency percentiles
+and the status codes seen.
+
+Usage:
+    python validation_loadgen.py --port 8080 --connections 32 --requests 20000 [--batch 10] [--endpoint profile]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from itertools import cycle
+from typing import List, Optional, Tuple
+
+import SourceDemo as sd
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    i = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[i]
+
+
+def _payloads(endpoint: str, batch: int) -> List[bytes]:
+    """A few distinct request bodies to cycle through."""
+    items = [t["profile"] for t in sd.PROFILE_FIXTURES] if endpoint == "profile" else \
+        [t["query"] for t in sd.QUERY_FIXTURES]
+    source = cycle(items)
+    bodies = []
+    for _ in range(len(items)):
+        payload = next(source) if batch == 1 else [next(source) for _ in range(batch)]
+        bodies.append(json.dumps(payload).encode("utf-8"))
+    return bodies
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *lines = head.decode("latin-1").split("\r\n")
+    status = int(status_line.split(" ", 2)[1])
+    length, keep_alive = 0, True
+    for line in lines:
+        name, _, value = line.partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "connection":
+            keep_alive = value.strip().lower() != "close"
+    await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def _connection(host: str, port: int, path: str, bodies: List[bytes], remaining: List[int],
+                      latencies: List[float], statuses: Counter) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    bodies_iter = cycle(bodies)
+    try:
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            body = next(bodies_iter)
+            request = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if not keep_alive:
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, endpoint: str = "query", connections: int = 16,
+                   requests: int = 10_000, batch: int = 1) -> int:
+    path = f"/v1/{endpoint}"
+    bodies = _payloads(endpoint, batch)
+    remaining = [requests]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection(host, port, path, bodies, remaining, latencies, statuses)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    n = len(latencies)
+    print(f"{n:,} requests ({n * batch:,} items) over {connections} connections in {elapsed:.2f}s")
+    print(f"Throughput: {n / elapsed:,.0f} requests/s, {n * batch / elapsed:,.0f} items/s")
+    print("Latency: " + "  ".join(f"p{q}={_percentile(latencies, q) * 1000:.2f}ms" for q in (50, 90, 99))
+          + f"  max={latencies[-1] * 1000:.2f}ms" if latencies else "Latency: -")
+    print("Status codes: " + ", ".join(f"{code}×{count:,}" for code, count in sorted(statuses.items())))
+    return 0 if set(statuses) <= {200} else 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load generator for validation_service.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--endpoint", choices=("query", "profile"), default="query")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=1, help="Items per request (1 = single object body)")
+    args = parser.parse_args(argv)
+    raise SystemExit(asyncio.run(run_load(args.host, args.port, args.endpoint, args.connections,
+                                          args.requests, args.batch)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Smart Travel validation service — SourceDemo's normalize+validate over HTTP (stdlib only).
+
+Endpoints (JSON in, JSON out):
+    POST /v1/profile   body: a raw profile object, or an array of them (batch)
+    POST /v1/query     body: a raw query object, or an array of them (batch);
+                       an item may also be {"query": {...}, "profile": {...}} so
+                       profile defaults (origin, budget currency) are applied
+    GET  /healthz      taxonomy version and validator backend
+
+Each item is answered with {"valid", "issues", "normalized", "taxonomy"}; a batch
+gets an array in the same order. Connections are kept alive (HTTP/1.1 default),
+and the CPU-bound normalize+validate work runs on a bounded process pool so
+the event loop only parses HTTP and moves bytes.
+
+Usage:
+    python validation_service.py --port 8080 --workers 4 [--backend generated] [--taxonomy taxonomy.json]
+    python validation_loadgen.py --port 8080 --connections 32 --requests 20000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+import SourceDemo as sd
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH_ITEMS = 5000
+IDLE_TIMEOUT_S = 30.0
+
+_ENDPOINTS = {"/v1/profile": "profile", "/v1/query": "query"}
+
+
+# --------------------------------------------------------------------------------------
+# Work done on the executor
+# --------------------------------------------------------------------------------------
+def _init_worker(backend: str, taxonomy_path: Optional[str], watch: bool) -> None:
+    sd.set_validator_backend(backend)
+    if taxonomy_path:
+        sd.load_taxonomy_file(taxonomy_path)
+        if watch:
+            sd.TAXONOMY_STORE.watch()
+
+
+def _check_one(kind: str, item: Any) -> Dict[str, Any]:
+    snap = sd.current_taxonomy()  # one taxonomy version for the whole item
+    if kind == "profile":
+        norm = (sd.normalize_user_profile(item, snap) or {}) if isinstance(item, dict) else item
+        issues = sd.validate_profile(norm, snap)
+    else:
+        profile = None
+        if isinstance(item, dict) and isinstance(item.get("query"), dict):
+            profile = sd.normalize_user_profile(item["profile"], snap) if isinstance(item.get("profile"), dict) else None
+            item = item["query"]
+        norm = (sd.normalize_user_query(item, profile, snap) or {}) if isinstance(item, dict) else item
+        issues = sd.validate_query(norm, snap)
+    return {"valid": not issues, "issues": [asdict(i) for i in issues], "normalized": norm,
+            "taxonomy": snap.version}
+
+
+def process_body(kind: str, body: bytes) -> Tuple[int, bytes]:
+    """Decode a request body, normalize+validate it and return (status, JSON response)."""
+    try:
+        payload = json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        return HTTPStatus.BAD_REQUEST, _error_body(f"Body is not valid JSON: {exc}")
+    if isinstance(payload, list):
+        if len(payload) > MAX_BATCH_ITEMS:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, _error_body(f"At most {MAX_BATCH_ITEMS} items per batch")
+        result: Any = [_check_one(kind, item) for item in payload]
+    else:
+        result = _check_one(kind, payload)
+    return HTTPStatus.OK, json.dumps(result, ensure_ascii=False).encode("utf-8")
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+# --------------------------------------------------------------------------------------
+# HTTP server
+# --------------------------------------------------------------------------------------
+class ValidationServer:
+    """Minimal HTTP/1.1 server (keep-alive, Content-Length bodies) in front of `executor`.
+
+    At most `max_pending` requests are handed to the executor at once; further
+    requests wait on a semaphore, which keeps memory and queueing bounded
+    under load.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int = 64, idle_timeout: float = IDLE_TIMEOUT_S) -> None:
+        self.executor = executor
+        self.idle_timeout = idle_timeout
+        self._slots = asyncio.Semaphore(max_pending)
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self._handle_connection, host, port, limit=64 * 1024)
+        addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+        print(f"Validation service listening on {addrs} (taxonomy {sd.current_taxonomy().tag}, "
+              f"backend {sd.VALIDATOR_BACKEND})")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                try:
+                    method, target, version, headers = _parse_head(head)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, _error_body("Malformed request"), False)
+                    return
+                keep_alive = _keep_alive(version, headers)
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    await self._respond(writer, HTTPStatus.LENGTH_REQUIRED,
+                                        _error_body("Chunked bodies are not supported"), False)
+                    return
+                try:
+                    length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        _error_body(f"Body must be at most {MAX_BODY_BYTES} bytes"), False)
+                    return
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                status, payload = await self._dispatch(method, target.split("?", 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        if path == "/healthz":
+            snap = sd.current_taxonomy()
+            return HTTPStatus.OK, json.dumps({"status": "ok", "taxonomy": snap.tag,
+                                              "backend": sd.VALIDATOR_BACKEND}).encode("utf-8")
+        kind = _ENDPOINTS.get(path)
+        if kind is None:
+            return HTTPStatus.NOT_FOUND, _error_body(f"Unknown endpoint {path}")
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, _error_body("Use POST")
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, process_body, kind, body)
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool) -> None:
+        status = HTTPStatus(status)
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+    request_line, *lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+    method, target, version = request_line.split(" ", 2)
+    headers: Dict[str, str] = {}
+    for line in lines:
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise ValueError(f"Malformed header: {line!r}")
+        headers[name.strip().lower()] = value.strip()
+    return method.upper(), target, version.upper(), headers
+
+
+def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+# --------------------------------------------------------------------------------------
+# Entry point
+# --------------------------------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Smart Travel – profile/query validation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Requests handed to the workers at once (default: 4 per worker)")
+    parser.add_argument("--backend", choices=sd.VALIDATOR_BACKENDS, default="generated",
+                        help="Schema validation backend")
+    parser.add_argument("--taxonomy", metavar="TAXONOMY.json", help="Load the taxonomy from a JSON file")
+    parser.add_argument("--watch-taxonomy", action="store_true", help="Reload the taxonomy file when it changes")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    _init_worker(args.backend, args.taxonomy, args.watch_taxonomy)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(args.backend, args.taxonomy, args.watch_taxonomy))
+    server = ValidationServer(executor, max_pending=args.max_pending or 4 * workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    main()